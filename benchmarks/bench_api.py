@@ -0,0 +1,119 @@
+"""
+Load test for the REST/JSON service on localhost.
+
+Run from the project root:
+    python -m benchmarks.bench_api [--clients 8] [--requests 2000] [--batch-size 100]
+
+Starts the service on a free port in this process, then each client thread
+holds one keep-alive connection and sends a mix of balance reads (50%),
+deposits (40%) and history pages (10%). A second run sends the same number
+of deposits through /batch in groups of --batch-size. Reported: requests/s,
+operations/s and p50/p99 latency. Client and server share the GIL, so the
+absolute numbers are a floor; the batch/single ratio is what carries over.
+"""
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+
+from src.api import BankService, serve
+
+ACCOUNTS: int = 100
+
+
+def setup(port: int) -> None:
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    operations: list[dict] = [{"op": "open_customer", "customer_id": 1, "first_name": "Load",
+                               "last_name": "Test", "email": "load@example.com"}]
+    operations += [{"op": "open_account", "customer_id": 1, "type": "checking", "account_id": account_ID}
+                   for account_ID in range(1, ACCOUNTS + 1)]
+    request(connection, "POST", "/batch", {"operations": operations})
+    connection.close()
+
+
+def request(connection: http.client.HTTPConnection, method: str, path: str, body: dict | None = None) -> dict:
+    data: bytes | None = json.dumps(body).encode() if body is not None else None
+    connection.request(method, path, body=data, headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    payload = json.loads(response.read())
+    if response.status >= 400:
+        raise SystemExit(f"{method} {path} failed: {response.status} {payload}")
+    return payload
+
+
+def run(port: int, clients: int, requests: int, batch_size: int) -> dict:
+    latencies: list[int] = []
+    lock = threading.Lock()
+    start_line = threading.Barrier(clients + 1)
+
+    def client(index: int) -> None:
+        rng = random.Random(index)
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        clock = time.perf_counter_ns
+        local: list[int] = []
+        start_line.wait()
+
+        for _ in range(requests // batch_size if batch_size > 1 else requests):
+            account_ID = rng.randint(1, ACCOUNTS)
+            began = clock()
+            if batch_size > 1:
+                request(connection, "POST", "/batch", {"operations": [
+                    {"op": "deposit", "account_id": rng.randint(1, ACCOUNTS), "amount": 1.0} for _ in range(batch_size)]})
+            else:
+                roll = rng.random()
+                if roll < 0.5:
+                    request(connection, "GET", f"/accounts/{account_ID}/balance")
+                elif roll < 0.9:
+                    request(connection, "POST", f"/accounts/{account_ID}/deposit", {"amount": 1.0})
+                else:
+                    request(connection, "GET", f"/accounts/{account_ID}/history?limit=20")
+            local.append(clock() - began)
+
+        connection.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+
+    start_line.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests_per_sec": len(latencies) / elapsed,
+        "operations_per_sec": len(latencies) * batch_size / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] / 1e6,
+        "p99_ms": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] / 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the REST/JSON service on localhost")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=2_000, help="requests per client (single-operation run)")
+    parser.add_argument("--batch-size", type=int, default=100, help="deposits per /batch request")
+    args = parser.parse_args()
+
+    server = serve(BankService(), port=0)
+    port: int = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        setup(port)
+        for label, batch_size in (("single", 1), (f"batch x{args.batch_size}", args.batch_size)):
+            result = run(port, args.clients, args.requests, batch_size)
+            print(f"{label:<12} {result['requests_per_sec']:>9,.0f} req/s {result['operations_per_sec']:>10,.0f} ops/s  "
+                  f"p50={result['p50_ms']:7.2f}ms p99={result['p99_ms']:7.2f}ms")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Cost of the hash-chained audit log.
+
+Run from the project root:
+    python -m benchmarks.bench_audit_chain [--entries 200000] [--window 1024]
+
+Reported:
+- posting cost: AuditLog.log_transaction versus a plain list append,
+- full verification throughput (entries rehashed per second),
+- range verification of a --window slice at the end of the log (the
+  O(window + log n) path auditors use instead of a full rehash),
+- inclusion proof generation and checking latency.
+"""
+import argparse
+import random
+import time
+
+from src.audit_log import AuditLog, verify_inclusion
+from src.transaction import Transaction, TransactionType
+
+
+def timed(function, repeat: int = 1) -> float:
+    # Best of `repeat` runs, in seconds
+    best: float = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark audit log hash chaining and verification")
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--window", type=int, default=1024, help="entries checked by range verification")
+    parser.add_argument("--proofs", type=int, default=1_000)
+    args = parser.parse_args()
+
+    transactions = [Transaction(TransactionType.DEPOSIT, float(index % 500 + 1)) for index in range(args.entries)]
+
+    def plain() -> None:
+        entries: list[Transaction] = []
+        for transaction in transactions:
+            entries.append(transaction)
+
+    logs: list[AuditLog] = []
+
+    def chained() -> None:
+        log = AuditLog()
+        for transaction in transactions:
+            log.log_transaction(transaction)
+        logs.append(log)
+
+    plain_seconds = timed(plain, 3)
+    chained_seconds = timed(chained, 3)
+    log = logs[-1]
+    per_entry = (chained_seconds - plain_seconds) / args.entries * 1e6
+    print(f"append       plain {plain_seconds / args.entries * 1e6:7.2f}us  chained {chained_seconds / args.entries * 1e6:7.2f}us  "
+          f"(+{per_entry:.2f}us per posting)")
+
+    full = timed(lambda: log.verify())
+    print(f"verify full  {args.entries / full:>12,.0f} entries/s  ({full * 1000:.1f}ms for {args.entries:,})")
+
+    start = max(0, args.entries - args.window)
+    window = timed(lambda: log.verify(start, args.entries), 5)
+    print(f"verify range {window * 1000:9.3f}ms for the last {args.entries - start:,} entries")
+
+    rng = random.Random(7)
+    indices = [rng.randrange(args.entries) for _ in range(args.proofs)]
+    root = log.root()
+    proofs = []
+    prove = timed(lambda: proofs.extend(log.prove(index) for index in indices))
+    check = timed(lambda: all(verify_inclusion(transactions[proof.index], proof, root) for proof in proofs))
+    if not all(verify_inclusion(transactions[proof.index], proof, root) for proof in proofs):
+        raise SystemExit("inclusion proof failed")
+    print(f"prove        {prove / args.proofs * 1e6:9.1f}us  check {check / args.proofs * 1e6:9.1f}us  "
+          f"({len(proofs[0].path)} hashes per proof)")
+
+
+if __name__ == '__main__':
+    main()
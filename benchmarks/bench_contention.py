@@ -0,0 +1,145 @@
+"""
+Hot-account contention: pessimistic row locks vs optimistic CAS.
+
+Run from the project root:
+    python -m benchmarks.bench_contention [--writers 16] [--operations 200] [--accounts 1]
+    python -m benchmarks.bench_contention --mysql     # against the .env database
+
+Every writer thread opens its own connection and deposits into a small set
+of hot accounts. Reported per strategy: throughput, p50/p99 latency, CAS
+retries and writes that gave up. The default backend is a local sqlite file
+(WAL mode); sqlite has a single database-wide write lock, so it shows the
+cost of retries more than the benefit of not holding row locks. Use --mysql
+for row-level locking (Accounts 1..--accounts must already exist there).
+Each run also checks that no deposit was lost.
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from src import SavingsAccount
+from src.repository import AccountRepository, SQLITE_SCHEMA
+from src.transaction import TransactionType
+
+STRATEGIES: tuple[str, ...] = ("pessimistic", "optimistic")
+
+
+def sqlite_factory(path: str):
+    def connect() -> tuple[object, AccountRepository]:
+        connection = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        return connection, AccountRepository.for_sqlite(connection, max_retries=50)
+    return connect
+
+
+def mysql_factory():
+    from src.database import get_db_connection
+
+    def connect() -> tuple[object, AccountRepository]:
+        connection = get_db_connection()
+        if connection is None:
+            raise SystemExit("Could not connect to MySQL")
+        return connection, AccountRepository(connection, max_retries=50)
+    return connect
+
+
+def prepare_sqlite(path: str, accounts: int) -> None:
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SQLITE_SCHEMA)
+    connection.execute("DELETE FROM Accounts")
+    connection.commit()
+
+    repository = AccountRepository.for_sqlite(connection)
+    for account_ID in range(1, accounts + 1):
+        repository.create(SavingsAccount(account_ID))
+    connection.close()
+
+
+def run(connect, strategy: str, writers: int, operations: int, accounts: int) -> dict:
+    latencies: list[int] = []
+    totals: dict[str, int] = {"retries": 0, "conflicts": 0}
+    lock = threading.Lock()
+    start_line = threading.Barrier(writers + 1)
+
+    def writer(index: int) -> None:
+        connection, repository = connect()
+        post = repository.post if strategy == "optimistic" else repository.post_locked
+        local: list[int] = []
+        clock = time.perf_counter_ns
+        start_line.wait()
+
+        for operation in range(operations):
+            account_ID = (index + operation) % accounts + 1
+            began = clock()
+            try:
+                post(account_ID, 1.0, TransactionType.DEPOSIT)
+            except ValueError:
+                pass  # VersionConflict: counted by the repository
+            local.append(clock() - began)
+
+        connection.close()
+        with lock:
+            latencies.extend(local)
+            totals["retries"] += repository.retries
+            totals["conflicts"] += repository.conflicts
+
+    opening: float = total_balance(connect, accounts)
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(writers)]
+    for thread in threads:
+        thread.start()
+
+    start_line.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = writers * operations
+    lost: float = opening + total - totals["conflicts"] - total_balance(connect, accounts)
+    return {
+        "strategy": strategy,
+        "writes": total,
+        "writes_per_sec": total / elapsed,
+        "p50_us": latencies[len(latencies) // 2] / 1000,
+        "p99_us": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] / 1000,
+        "retries": totals["retries"],
+        "conflicts": totals["conflicts"],
+        "lost": lost,
+    }
+
+
+def total_balance(connect, accounts: int) -> float:
+    connection, repository = connect()
+    total: float = sum(repository.load(account_ID)[0] for account_ID in range(1, accounts + 1))
+    connection.close()
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pessimistic vs optimistic balance updates")
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--operations", type=int, default=200, help="writes per writer")
+    parser.add_argument("--accounts", type=int, default=1, help="number of hot accounts")
+    parser.add_argument("--mysql", action="store_true", help="use the MySQL database from .env instead of sqlite")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "contention.db")
+        for strategy in STRATEGIES:
+            if args.mysql:
+                connect = mysql_factory()
+            else:
+                prepare_sqlite(path, args.accounts)
+                connect = sqlite_factory(path)
+
+            result = run(connect, strategy, args.writers, args.operations, args.accounts)
+            print(f"{strategy:<12} {result['writes_per_sec']:>10,.0f} writes/s  p50={result['p50_us']:9.1f}us "
+                  f"p99={result['p99_us']:9.1f}us  retries={result['retries']:,} gave_up={result['conflicts']:,} lost={result['lost']:g}")
+
+
+if __name__ == '__main__':
+    main()
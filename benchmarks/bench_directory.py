@@ -0,0 +1,90 @@
+"""
+Customer directory build time and lookup/search latency.
+
+Run from the project root:
+    python -m benchmarks.bench_directory                        # 1M customers
+    python -m benchmarks.bench_directory --customers 10000000  # full size (needs ~8 GB RAM)
+
+Names are drawn (seeded) from pools of syllable-built first and last names,
+so tokens repeat the way real names do. Reported per query kind: p50/p99
+latency over --queries random queries.
+"""
+import argparse
+import random
+import resource
+import sys
+import time
+
+from src import Customer
+from src.directory import CustomerDirectory
+
+SYLLABLES: tuple[str, ...] = ("an", "bel", "car", "da", "el", "fi", "gor", "ha", "is", "jo", "ka", "li",
+                              "mar", "no", "ol", "pe", "qui", "ro", "sa", "ti", "ul", "ve", "wil", "xa", "yo", "zen")
+
+
+def name_pool(rng: random.Random, size: int, syllables: int) -> list[str]:
+    names: set[str] = set()
+    while len(names) < size:
+        names.add("".join(rng.choice(SYLLABLES) for _ in range(syllables)).capitalize())
+    return sorted(names)
+
+
+def build(customers: int, seed: int) -> tuple[CustomerDirectory, list[str], list[str]]:
+    rng = random.Random(seed)
+    first_names = name_pool(rng, 5_000, 3)
+    last_names = name_pool(rng, 50_000, 4)
+
+    directory = CustomerDirectory()
+    for customer_ID in range(1, customers + 1):
+        directory.add(Customer(customer_ID, rng.choice(first_names), rng.choice(last_names),
+                               f"customer{customer_ID}@example.com"))
+    return directory, first_names, last_names
+
+
+def measure(label: str, queries: list, func) -> None:
+    clock = time.perf_counter_ns
+    latencies: list[int] = []
+    for query in queries:
+        start = clock()
+        func(query)
+        latencies.append(clock() - start)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] / 1000
+    p99 = latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] / 1000
+    print(f"{label:<24} p50={p50:10.1f}us  p99={p99:10.1f}us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark customer directory lookups and name search")
+    parser.add_argument("--customers", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--limit", type=int, default=20, help="results per name search")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    directory, first_names, last_names = build(args.customers, args.seed)
+    build_seconds = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 if sys.platform != "darwin" else 1024 ** 2)
+    print(f"customers={len(directory):,} tokens={directory.token_count:,} build={build_seconds:.1f}s peak_rss={peak:,.0f} MB")
+
+    rng = random.Random(args.seed + 1)
+    ids = [rng.randint(1, args.customers) for _ in range(args.queries)]
+    emails = [f"customer{customer_ID}@example.com" for customer_ID in ids]
+    names = [(rng.choice(first_names), rng.choice(last_names)) for _ in range(args.queries)]
+
+    measure("id lookup", ids, directory.get)
+    measure("email lookup", emails, directory.find_by_email)
+    measure("duplicate email check", emails, directory.email_taken)
+    measure("prefix (3 letters)", [first[:3] for first, _ in names], lambda q: directory.search_prefix(q, args.limit))
+    measure("prefix (first + last)", [f"{first} {last[:4]}" for first, last in names],
+            lambda q: directory.search_prefix(q, args.limit))
+    measure("substring (4 letters)", [last[2:6] for _, last in names], lambda q: directory.search(q, args.limit))
+    measure("substring (two words)", [f"{first[1:4]} {last[2:6]}" for first, last in names],
+            lambda q: directory.search(q, args.limit))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Latency benchmark for the streaming anomaly scorer.
+
+Run from the project root:
+    python -m benchmarks.bench_fraud [--postings N] [--accounts N]
+"""
+import argparse
+import random
+import time
+
+from src import Transaction, TransactionType
+from src.fraud import AnomalyScorer
+
+BUDGET_P99_US: float = 10.0
+
+
+def run(postings: int, accounts: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    types = [TransactionType.DEPOSIT, TransactionType.WITHDRAW, TransactionType.TRANSFER_SENT]
+    stream = [(rng.randrange(accounts), Transaction(rng.choice(types), rng.lognormvariate(4, 1)))
+              for _ in range(postings)]
+
+    scorer = AnomalyScorer()
+    timings: list[int] = []
+    clock = time.perf_counter_ns
+
+    for account_ID, transaction in stream:
+        start = clock()
+        scorer.score(account_ID, transaction)
+        timings.append(clock() - start)
+
+    timings.sort()
+    history = [tx.amount for _, tx in stream[:100_000]]
+    start = time.perf_counter()
+    scorer.score_history(history)
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        "postings": postings,
+        "p50_us": timings[len(timings) // 2] / 1000,
+        "p99_us": timings[int(len(timings) * 0.99)] / 1000,
+        "flagged": scorer.flagged,
+        "batch_postings_per_sec": len(history) / batch_seconds,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark AnomalyScorer latency")
+    parser.add_argument("--postings", type=int, default=200_000)
+    parser.add_argument("--accounts", type=int, default=1_000)
+    args = parser.parse_args()
+
+    result = run(args.postings, args.accounts)
+    for key, value in result.items():
+        print(f"{key}: {value:,.2f}" if isinstance(value, float) else f"{key}: {value}")
+
+    status = "OK" if result["p99_us"] <= BUDGET_P99_US else "OVER BUDGET"
+    print(f"budget p99 <= {BUDGET_P99_US} us: {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Import-time benchmark for CLI start-up and library use.
+
+Run from the project root:
+    python -m benchmarks.bench_import
+
+Each scenario runs in a fresh interpreter under `python -X importtime`;
+the reported time is the cumulative import time of the scenario's
+top-level imports (median of --repeat runs). tests/test_import_time.py
+enforces BUDGETS_MS and checks that FORBIDDEN_MODULES stay unloaded.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Scenario -> code run in a fresh interpreter
+SCENARIOS: dict[str, str] = {
+    "library": "import src; src.Customer; src.SavingsAccount; src.CheckingAccount",
+    "cli": "import main",
+}
+
+BUDGETS_MS: dict[str, float] = {
+    "library": 60.0,
+    "cli": 80.0,
+}
+
+# Heavy or optional modules that plain engine/CLI use must not load
+FORBIDDEN_MODULES: tuple[str, ...] = ("mysql", "dotenv", "numpy", "asyncio", "argparse")
+
+
+def measure(scenario: str) -> tuple[float, list[tuple[float, str]]]:
+    """Returns (total ms, [(cumulative ms, module)] for the top-level imports)."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", SCENARIOS[scenario]],
+                            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+
+    top_level: list[tuple[float, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Top-level imports are not indented
+        if not name.startswith("  "):
+            top_level.append((int(cumulative) / 1000, name.strip()))
+
+    # Interpreter start-up (site, encodings) is the same for everyone
+    ours = [(ms, name) for ms, name in top_level if name not in ("site", "encodings", "encodings.utf_8", "_io")]
+    return sum(ms for ms, _ in ours), sorted(ours, reverse=True)
+
+
+def loaded_modules(scenario: str) -> set[str]:
+    code = SCENARIOS[scenario] + "; import sys; print('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def median_ms(scenario: str, repeat: int = 5) -> float:
+    return statistics.median(measure(scenario)[0] for _ in range(repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure import time")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for scenario in SCENARIOS:
+        total = median_ms(scenario, args.repeat)
+        status = "OK" if total <= BUDGETS_MS[scenario] else "OVER BUDGET"
+        print(f"{scenario:<8} {total:7.1f} ms (budget {BUDGETS_MS[scenario]:.0f} ms) {status}")
+
+        _, breakdown = measure(scenario)
+        for ms, name in breakdown[:5]:
+            print(f"    {ms:7.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Working-set memory before and after a dormancy sweep.
+
+Run from the project root:
+    python -m benchmarks.bench_lifecycle [--customers 20000] [--transactions 50] [--active 0.2]
+
+Every customer gets one savings account with --transactions postings; a
+fraction --active of them posted recently, the rest a year ago. The sweep
+archives the inactive ones (dormancy after 180 days). Reported: traced
+memory before and after, the compressed archive size, sweep time and the
+latency of rehydrating one account through Customer.get_account.
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from src import Customer, SavingsAccount, Transaction, TransactionType
+from src.lifecycle import AccountArchive, DormancyPolicy
+
+
+def build(customers: int, transactions: int, active: float) -> list[Customer]:
+    rng = random.Random(3)
+    now = datetime.now()
+    bank: list[Customer] = []
+    for customer_ID in range(1, customers + 1):
+        customer = Customer(customer_ID, "Load", "Test", f"customer{customer_ID}@example.com")
+        account = SavingsAccount(customer_ID)
+        customer.open_account(account)
+
+        start = now - timedelta(days=7 if rng.random() < active else 400)
+        log = account._audit_log
+        for index in range(transactions):
+            amount = float(rng.randint(1, 500))
+            log.log_transaction(Transaction._restore(TransactionType.DEPOSIT, amount, start + timedelta(minutes=index)))
+            account._balance += amount
+        bank.append(customer)
+
+    return bank
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dormant-account compaction")
+    parser.add_argument("--customers", type=int, default=20_000)
+    parser.add_argument("--transactions", type=int, default=50, help="postings per account")
+    parser.add_argument("--active", type=float, default=0.2, help="fraction of accounts with recent activity")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    bank = build(args.customers, args.transactions, args.active)
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+
+    archive = AccountArchive()
+    start = time.perf_counter()
+    archived = archive.sweep(bank, DormancyPolicy(timedelta(days=180)))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"accounts   {args.customers:,} ({archived:,} archived, {args.customers - archived:,} active)")
+    print(f"memory     {before / 2**20:8.1f} MiB -> {after / 2**20:8.1f} MiB "
+          f"(archive blobs {archive.stored_bytes / 2**20:.1f} MiB)")
+    print(f"sweep      {elapsed:8.2f} s  ({archived / elapsed:,.0f} accounts/s)")
+
+    customer = next(customer for customer in bank if not customer.accounts)
+    start = time.perf_counter()
+    customer.get_account(customer.customer_ID)
+    print(f"rehydrate  {(time.perf_counter() - start) * 1000:8.2f} ms  ({args.transactions} transactions)")
+
+
+if __name__ == '__main__':
+    main()
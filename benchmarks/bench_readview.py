@@ -0,0 +1,113 @@
+"""
+Writer cost of consistent reads under mixed load.
+
+Run from the project root:
+    python -m benchmarks.bench_readview [--accounts 20000] [--writers 2] [--seconds 2]
+
+Writer threads post random transfers between savings accounts (holding one
+shared lock per transfer, as BankService does) while one reader thread
+repeatedly totals every balance. Transfers conserve money, so any total
+that differs from the opening total is a torn read. Reader strategies:
+    none    no reader (baseline)
+    live    scan live accounts without the lock (fast, can tear)
+    locked  hold the writers' lock for the whole scan (consistent, stalls writers)
+    view    scan a ReadView (consistent, writers keep going)
+Reported: writer transfers/s, writer p99 latency, reader scans/s and torn scans.
+"""
+import argparse
+import math
+import random
+import threading
+import time
+
+from src import SavingsAccount
+from src.readview import ReadViews
+
+STRATEGIES: tuple[str, ...] = ("none", "live", "locked", "view")
+OPENING_BALANCE: float = 1000.0
+
+
+def run(strategy: str, accounts: int, writers: int, seconds: float) -> dict:
+    bank = {account_ID: SavingsAccount(account_ID) for account_ID in range(1, accounts + 1)}
+    for account in bank.values():
+        account.deposit(OPENING_BALANCE)
+    expected: float = OPENING_BALANCE * accounts
+
+    lock = threading.Lock()
+    views = ReadViews(bank, lock)
+    stop = threading.Event()
+    latencies: list[int] = []
+    reader_stats = {"scans": 0, "torn": 0}
+    collect = threading.Lock()
+
+    def writer(seed: int) -> None:
+        rng = random.Random(seed)
+        clock = time.perf_counter_ns
+        local: list[int] = []
+        while not stop.is_set():
+            source, destination = rng.sample(range(1, accounts + 1), 2)
+            began = clock()
+            with lock:
+                try:
+                    bank[source].transfer(bank[destination], rng.randint(1, 10000) / 100)
+                except ValueError:
+                    pass
+            local.append(clock() - began)
+        with collect:
+            latencies.extend(local)
+
+    def reader() -> None:
+        while not stop.is_set():
+            if strategy == "live":
+                total = math.fsum(account.balance for account in bank.values())
+            elif strategy == "locked":
+                with lock:
+                    total = math.fsum(account.balance for account in bank.values())
+            else:
+                with views.open() as view:
+                    total = view.total_balance()
+
+            reader_stats["scans"] += 1
+            if not math.isclose(total, expected, abs_tol=1e-6):
+                reader_stats["torn"] += 1
+
+    threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(writers)]
+    if strategy != "none":
+        threads.append(threading.Thread(target=reader))
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "transfers_per_sec": len(latencies) / elapsed,
+        "p99_us": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] / 1000,
+        "scans_per_sec": reader_stats["scans"] / elapsed,
+        "torn": reader_stats["torn"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark read views against live and locked scans")
+    parser.add_argument("--accounts", type=int, default=20_000)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--strategy", choices=STRATEGIES, nargs="+", default=list(STRATEGIES))
+    args = parser.parse_args()
+
+    baseline: float | None = None
+    for strategy in args.strategy:
+        result = run(strategy, args.accounts, args.writers, args.seconds)
+        baseline = baseline or result["transfers_per_sec"]
+        print(f"{strategy:<7} {result['transfers_per_sec']:>10,.0f} transfers/s ({result['transfers_per_sec'] / baseline:5.2f}x)  "
+              f"p99={result['p99_us']:>9.1f}us  scans/s={result['scans_per_sec']:>7.1f}  torn={result['torn']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Snapshot write / load / restore benchmark.
+
+Run from the project root:
+    python -m benchmarks.bench_snapshot [--accounts N] [--transactions-per-account N]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src import CheckingAccount, Customer, SavingsAccount
+from src.snapshot import load_snapshot, write_snapshot
+
+
+def build_bank(accounts: int, transactions_per_account: int) -> list[Customer]:
+    customers: list[Customer] = []
+    for account_ID in range(accounts):
+        if account_ID % 2 == 0:
+            customer = Customer(account_ID // 2, "First", "Last", f"user{account_ID // 2}@example.com")
+            customers.append(customer)
+
+        account = SavingsAccount(account_ID) if account_ID % 2 else CheckingAccount(account_ID)
+        customers[-1].open_account(account)
+        for _ in range(transactions_per_account):
+            account.deposit(10.0)
+
+    return customers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark snapshot write/load/restore")
+    parser.add_argument("--accounts", type=int, default=100_000)
+    parser.add_argument("--transactions-per-account", type=int, default=10)
+    args = parser.parse_args()
+
+    customers = build_bank(args.accounts, args.transactions_per_account)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bank.snap")
+
+        start = time.perf_counter()
+        write_snapshot(path, customers)
+        write_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        snapshot = load_snapshot(path)
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        restored, _ = snapshot.restore()
+        restore_seconds = time.perf_counter() - start
+
+        transactions = snapshot.transaction_count
+        size_mb = os.path.getsize(path) / 1e6
+        del restored
+        snapshot.close()
+
+    print(f"accounts={args.accounts:,} transactions={transactions:,} file={size_mb:,.1f} MB")
+    print(f"write   {write_seconds:8.3f}s ({transactions / write_seconds:,.0f} tx/s)")
+    print(f"load    {load_seconds:8.3f}s (mmap + memoryview, independent of size)")
+    print(f"restore {restore_seconds:8.3f}s ({args.accounts / restore_seconds:,.0f} accounts/s, logs lazy)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Credit throughput on one hot account versus stripe count.
+
+Run from the project root:
+    python -m benchmarks.bench_striping [--threads 8] [--credits 20000] [--stripes 1 2 4 8 16]
+
+Every thread posts deposits into the same account. The baseline is a plain
+CheckingAccount behind one lock (it is not safe to credit without one);
+each striped run uses StripedCheckingAccount with the given stripe count.
+A final withdrawal checks that the merged balance lost nothing.
+With the GIL, stripes mostly save lock hand-offs; the gap between stripe
+counts grows on free-threaded builds where credits truly run in parallel.
+"""
+import argparse
+import threading
+import time
+
+from src import CheckingAccount
+from src.striping import StripedCheckingAccount
+
+
+def run(account, threads: int, credits: int, lock: 'threading.Lock | None' = None) -> float:
+    start_line = threading.Barrier(threads + 1)
+
+    def credit() -> None:
+        deposit = account.deposit
+        start_line.wait()
+        if lock is None:
+            for _ in range(credits):
+                deposit(1.0)
+        else:
+            for _ in range(credits):
+                with lock:
+                    deposit(1.0)
+
+    workers = [threading.Thread(target=credit) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    start_line.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    expected = threads * credits
+    if account.balance != expected:
+        raise SystemExit(f"lost credits: balance {account.balance} != {expected}")
+    account.withdraw(expected)
+
+    return threads * credits / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark hot-account credits versus stripe count")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--credits", type=int, default=20_000, help="credits per thread")
+    parser.add_argument("--stripes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    baseline = run(CheckingAccount(1), args.threads, args.credits, threading.Lock())
+    print(f"{'single lock':<12} {baseline:>12,.0f} credits/s")
+
+    for stripes in args.stripes:
+        throughput = run(StripedCheckingAccount(1, stripes), args.threads, args.credits)
+        print(f"{f'{stripes} stripes':<12} {throughput:>12,.0f} credits/s  ({throughput / baseline:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+"""
+Reproducible benchmark suite for the core engine.
+
+Run from the project root:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --threshold 0.15
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+
+Each case reports operations/second (best of --repeat runs). With
+--baseline, any case slower than baseline * (1 - threshold) is reported as
+a regression and the process exits with status 1.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from typing import Callable
+
+from src import AuditLog, CheckingAccount, Customer, SavingsAccount, Transaction, TransactionType
+
+# name -> factory(scale) returning (callable to time, operations it performs)
+CASES: dict[str, Callable[[int], tuple[Callable[[], None], int]]] = {}
+
+
+def case(name: str):
+    def register(factory):
+        CASES[name] = factory
+        return factory
+    return register
+
+
+@case("transaction_construct")
+def _transaction_construct(scale: int):
+    n = 10_000 * scale
+
+    def run():
+        for _ in range(n):
+            Transaction(TransactionType.DEPOSIT, 10.0)
+    return run, n
+
+
+@case("audit_log_append")
+def _audit_log_append(scale: int):
+    n = 10_000 * scale
+    transactions = [Transaction(TransactionType.DEPOSIT, 10.0) for _ in range(n)]
+
+    def run():
+        log = AuditLog()
+        for transaction in transactions:
+            log.log_transaction(transaction)
+    return run, n
+
+
+@case("audit_log_history_read")
+def _audit_log_history_read(scale: int):
+    account = SavingsAccount(1)
+    for _ in range(1_000):
+        account.deposit(1.0)
+    n = 100 * scale
+
+    def run():
+        for _ in range(n):
+            account.view_transaction_history()
+    return run, n
+
+
+def _throughput_case(account_type: type, operation: str):
+    def factory(scale: int):
+        n = 5_000 * scale
+
+        def run():
+            source = account_type(1)
+            destination = account_type(2)
+            source.deposit(n * 10.0)
+            if operation == "deposit":
+                for _ in range(n):
+                    source.deposit(1.0)
+            elif operation == "withdraw":
+                for _ in range(n):
+                    source.withdraw(1.0)
+            else:
+                for _ in range(n):
+                    source.transfer(destination, 1.0)
+        return run, n
+    return factory
+
+
+for _account_type in (SavingsAccount, CheckingAccount):
+    for _operation in ("deposit", "withdraw", "transfer"):
+        case(f"{_account_type.__name__.lower()}_{_operation}")(_throughput_case(_account_type, _operation))
+
+
+def _lookup_case(account_count: int):
+    def factory(scale: int):
+        customer = Customer(1, "Bench", "Mark", "bench@example.com")
+        for account_ID in range(account_count):
+            customer.open_account(SavingsAccount(account_ID))
+        n = 2_000 * scale
+        targets = [i % account_count for i in range(n)]
+
+        def run():
+            for account_ID in targets:
+                customer.get_account(account_ID)
+        return run, n
+    return factory
+
+
+for _count in (1, 10, 100, 1_000):
+    case(f"customer_get_account_{_count}")(_lookup_case(_count))
+
+
+@case("interest_run_portfolio")
+def _interest_run(scale: int):
+    accounts = []
+    for account_ID in range(10_000 * scale):
+        account = SavingsAccount(account_ID)
+        account.deposit(100.0 + account_ID % 500)
+        accounts.append(account)
+
+    def run():
+        for account in accounts:
+            account.apply_interest()
+    return run, len(accounts)
+
+
+def run_suite(scale: int = 1, repeat: int = 3, only: list[str] | None = None) -> dict:
+    results: dict = {}
+    for name, factory in CASES.items():
+        if only and name not in only:
+            continue
+
+        best: float = float("inf")
+        operations: int = 0
+        for _ in range(repeat):
+            # Fresh setup per repeat so mutating cases start from the same state
+            func, operations = factory(scale)
+            gc.collect()
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+
+        results[name] = {
+            "operations": operations,
+            "seconds": best,
+            "ops_per_sec": operations / best,
+            "ns_per_op": best * 1e9 / operations,
+        }
+
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "scale": scale,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[dict]:
+    """Returns one entry per case slower than baseline by more than threshold."""
+    regressions: list[dict] = []
+    for name, result in current["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+
+        ratio: float = result["ops_per_sec"] / reference["ops_per_sec"]
+        if ratio < 1 - threshold:
+            regressions.append({"case": name, "baseline": reference["ops_per_sec"],
+                                "current": result["ops_per_sec"], "ratio": ratio})
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="SecureBank engine benchmarks")
+    parser.add_argument("--output", help="write results JSON to this file")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--save-baseline", help="write results JSON as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--case", action="append", dest="cases", choices=sorted(CASES), metavar="NAME",
+                        help="run only this case (repeatable)")
+    parser.add_argument("--profile", metavar="DIR", help="profile the run; writes collapsed stacks and report.txt to DIR "
+                                                         "(timings then include profiler overhead)")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        from src.profiling import Profiler
+
+        # Memory tracing slows every allocation by an order of magnitude; use main.py --profile-modes for it
+        with Profiler(("sample", "cprofile")) as profiler:
+            current = run_suite(args.scale, args.repeat, args.cases)
+        profiler.write(args.profile)
+        print(profiler.report())
+    else:
+        current = run_suite(args.scale, args.repeat, args.cases)
+
+    for name, result in current["results"].items():
+        print(f"{name:<32} {result['ops_per_sec']:>14,.0f} ops/s {result['ns_per_op']:>10,.0f} ns/op")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as file:
+                json.dump(current, file, indent=2)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = compare(current, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression['case']}: {regression['ratio']:.2%} of baseline")
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
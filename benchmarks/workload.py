@@ -0,0 +1,321 @@
+"""
+Seeded synthetic workload generator and load-replay harness.
+
+Run from the project root:
+    python -m benchmarks.workload --customers 10000 --operations 200000 --mode thread --workers 4
+
+The generator builds customers with a Savings/Checking account mix and a
+Zipf-skewed stream of deposits, withdrawals, transfers and interest runs,
+so a small set of hot accounts receives most of the traffic. The same
+seed always produces the same bank and the same stream.
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from src import Account, CheckingAccount, Customer, SavingsAccount
+
+# (operation, account_ID, destination account_ID or None, amount)
+Operation = tuple[str, int, int | None, float]
+
+DEFAULT_MIX: dict[str, float] = {"deposit": 0.40, "withdraw": 0.30, "transfer": 0.25, "interest": 0.05}
+MODES: tuple[str, ...] = ("single", "thread", "async", "process")
+
+
+class WorkloadGenerator:
+    def __init__(self, seed: int = 42, customers: int = 1_000, accounts_per_customer: int = 2,
+                 savings_ratio: float = 0.5, zipf_s: float = 1.1, mix: dict[str, float] | None = None):
+
+        if customers <= 0 or accounts_per_customer <= 0:
+            raise ValueError("customers and accounts_per_customer must be positive")
+
+        if not 0 <= savings_ratio <= 1:
+            raise ValueError("savings_ratio must be between 0 and 1")
+
+        self._seed: int = seed
+        self._customers: int = customers
+        self._accounts_per_customer: int = accounts_per_customer
+        self._savings_ratio: float = savings_ratio
+        self._zipf_s: float = zipf_s
+        self._mix: dict[str, float] = mix or DEFAULT_MIX
+
+        unknown = set(self._mix) - set(DEFAULT_MIX)
+        if unknown:
+            raise ValueError(f"Unknown operations in mix: {', '.join(sorted(unknown))}")
+
+
+    def build_bank(self) -> tuple[list[Customer], dict[int, Account]]:
+        rng: random.Random = random.Random(self._seed)
+        customers: list[Customer] = []
+        accounts: dict[int, Account] = {}
+        account_ID: int = 1
+
+        for customer_ID in range(1, self._customers + 1):
+            customer: Customer = Customer(customer_ID, f"First{customer_ID}", f"Last{customer_ID}",
+                                          f"customer{customer_ID}@example.com")
+            for _ in range(self._accounts_per_customer):
+                account_type = SavingsAccount if rng.random() < self._savings_ratio else CheckingAccount
+                account: Account = account_type(account_ID)
+                customer.open_account(account)
+                account.deposit(round(rng.lognormvariate(7, 1), 2))
+                accounts[account_ID] = account
+                account_ID += 1
+
+            customers.append(customer)
+
+        return customers, accounts
+
+
+    def operations(self, count: int) -> list[Operation]:
+        # Separate stream from build_bank so the bank does not depend on the op count
+        rng: random.Random = random.Random(self._seed + 1)
+        account_count: int = self._customers * self._accounts_per_customer
+        account_IDs: list[int] = list(range(1, account_count + 1))
+        rng.shuffle(account_IDs)  # Hot accounts are spread across customers
+
+        cumulative: list[float] = list(itertools.accumulate(1 / rank ** self._zipf_s for rank in range(1, account_count + 1)))
+        sources: list[int] = rng.choices(account_IDs, cum_weights=cumulative, k=count)
+        kinds: list[str] = rng.choices(list(self._mix), weights=list(self._mix.values()), k=count)
+
+        stream: list[Operation] = []
+        for kind, source in zip(kinds, sources):
+            if kind == "interest":
+                stream.append((kind, source, None, 0.0))
+                continue
+
+            amount: float = round(rng.lognormvariate(4, 1), 2)
+            destination: int | None = None
+            if kind == "transfer":
+                destination = rng.choices(account_IDs, cum_weights=cumulative)[0]
+                if destination == source:
+                    kind, destination = "deposit", None
+
+            stream.append((kind, source, destination, amount))
+
+        return stream
+
+
+    def commands(self, count: int) -> list[str]:
+        """The bank and operation stream as `python main.py --batch` command lines."""
+        customers, accounts = self.build_bank()
+        lines: list[str] = []
+
+        for customer in customers:
+            lines.append(f"open_customer {customer.customer_ID} {customer.first_name} {customer.last_name} {customer.email}")
+            for account in customer.accounts:
+                kind: str = "savings" if isinstance(account, SavingsAccount) else "checking"
+                lines.append(f"open_account {customer.customer_ID} {kind} {account.account_ID}")
+                lines.append(f"deposit {account.account_ID} {account.balance}")
+
+        for kind, source, destination, amount in self.operations(count):
+            if kind == "transfer":
+                lines.append(f"transfer {source} {destination} {amount}")
+            elif kind == "interest":
+                if isinstance(accounts[source], SavingsAccount):
+                    lines.append(f"interest {source}")
+            else:
+                lines.append(f"{kind} {source} {amount}")
+
+        return lines
+
+
+    @property
+    def params(self) -> dict:
+        return {"seed": self._seed, "customers": self._customers, "accounts_per_customer": self._accounts_per_customer,
+                "savings_ratio": self._savings_ratio, "zipf_s": self._zipf_s, "mix": self._mix}
+
+
+class ReplayReport:
+    def __init__(self):
+        self.elapsed: float = 0.0
+        self.counts: dict[str, int] = {}
+        self.rejected: dict[str, int] = {}
+        self.latencies: dict[str, list[int]] = {}
+
+
+    def merge(self, other: 'ReplayReport') -> None:
+        for kind, latencies in other.latencies.items():
+            self.latencies.setdefault(kind, []).extend(latencies)
+            self.counts[kind] = self.counts.get(kind, 0) + other.counts.get(kind, 0)
+            self.rejected[kind] = self.rejected.get(kind, 0) + other.rejected.get(kind, 0)
+
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> dict:
+        per_operation: dict = {}
+        for kind, latencies in self.latencies.items():
+            ordered: list[int] = sorted(latencies)
+            count: int = self.counts[kind]
+            per_operation[kind] = {
+                "count": count,
+                "rejection_rate": self.rejected.get(kind, 0) / count if count else 0.0,
+                "p50_us": _percentile(ordered, 50) / 1000,
+                "p99_us": _percentile(ordered, 99) / 1000,
+                "p999_us": _percentile(ordered, 99.9) / 1000,
+            }
+
+        return {"operations": self.total, "elapsed": self.elapsed, "throughput": self.throughput,
+                "per_operation": per_operation}
+
+
+def _percentile(ordered: list[int], q: float) -> int:
+    if not ordered:
+        return 0
+
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+def _apply(accounts: dict[int, Account], operation: Operation) -> None:
+    kind, source, destination, amount = operation
+    account: Account = accounts[source]
+
+    if kind == "deposit":
+        account.deposit(amount)
+    elif kind == "withdraw":
+        account.withdraw(amount)
+    elif kind == "transfer":
+        account.transfer(accounts[destination], amount)
+    elif isinstance(account, SavingsAccount):
+        account.apply_interest()
+
+
+def _replay_slice(accounts: dict[int, Account], operations: list[Operation],
+                  locks: dict[int, threading.Lock] | None = None) -> ReplayReport:
+    report: ReplayReport = ReplayReport()
+    clock = time.perf_counter_ns
+
+    for operation in operations:
+        kind: str = operation[0]
+        held: list[threading.Lock] = []
+        if locks is not None:
+            # Lock both legs of a transfer in ID order so threads cannot deadlock
+            held = [locks[ID] for ID in sorted({operation[1], operation[2] or operation[1]})]
+            for lock in held:
+                lock.acquire()
+
+        start: int = clock()
+        try:
+            _apply(accounts, operation)
+        except ValueError:
+            report.rejected[kind] = report.rejected.get(kind, 0) + 1
+        finally:
+            elapsed: int = clock() - start
+            for lock in reversed(held):
+                lock.release()
+
+        report.counts[kind] = report.counts.get(kind, 0) + 1
+        report.latencies.setdefault(kind, []).append(elapsed)
+
+    return report
+
+
+def _shard(operations: list[Operation], workers: int) -> list[list[Operation]]:
+    # Shard by source account so per-account ordering is preserved
+    shards: list[list[Operation]] = [[] for _ in range(workers)]
+    for operation in operations:
+        shards[operation[1] % workers].append(operation)
+
+    return shards
+
+
+def _process_worker(params: dict, count: int, shard_index: int, workers: int) -> ReplayReport:
+    generator: WorkloadGenerator = WorkloadGenerator(**params)
+    _, accounts = generator.build_bank()
+    shard: list[Operation] = _shard(generator.operations(count), workers)[shard_index]
+
+    start: float = time.perf_counter()
+    report: ReplayReport = _replay_slice(accounts, shard)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+async def _replay_async(accounts: dict[int, Account], shards: list[list[Operation]], batch: int) -> list[ReplayReport]:
+    async def run(shard: list[Operation]) -> ReplayReport:
+        report: ReplayReport = ReplayReport()
+        for start in range(0, len(shard), batch):
+            report.merge(_replay_slice(accounts, shard[start:start + batch]))
+            await asyncio.sleep(0)  # Yield so shards interleave like concurrent clients
+        return report
+
+    return await asyncio.gather(*(run(shard) for shard in shards))
+
+
+def replay(generator: WorkloadGenerator, count: int, mode: str = "single", workers: int = 4,
+           accounts: dict[int, Account] | None = None) -> ReplayReport:
+    """
+    Drives `count` operations against the generator's bank (built here unless
+    `accounts` from generator.build_bank() is passed in).
+    - single:  one thread, in stream order.
+    - thread:  `workers` threads with per-account locks.
+    - async:   `workers` cooperative tasks on one event loop.
+    - process: `workers` processes, each replaying its shard on its own copy of the bank.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown replay mode: {mode}")
+
+    report: ReplayReport = ReplayReport()
+
+    if mode == "process":
+        # Workers build their own bank; only the replay itself is timed (slowest worker wins)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_process_worker, generator.params, count, index, workers) for index in range(workers)]
+            for future in futures:
+                partial: ReplayReport = future.result()
+                report.merge(partial)
+                report.elapsed = max(report.elapsed, partial.elapsed)
+        return report
+
+    if accounts is None:
+        _, accounts = generator.build_bank()
+    operations: list[Operation] = generator.operations(count)
+
+    start: float = time.perf_counter()
+    if mode == "single":
+        report = _replay_slice(accounts, operations)
+    elif mode == "thread":
+        locks: dict[int, threading.Lock] = {account_ID: threading.Lock() for account_ID in accounts}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(lambda shard: _replay_slice(accounts, shard, locks), _shard(operations, workers)):
+                report.merge(partial)
+    else:
+        for partial in asyncio.run(_replay_async(accounts, _shard(operations, workers), batch=64)):
+            report.merge(partial)
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a synthetic workload against the engine")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--customers", type=int, default=1_000)
+    parser.add_argument("--accounts-per-customer", type=int, default=2)
+    parser.add_argument("--savings-ratio", type=float, default=0.5)
+    parser.add_argument("--zipf", type=float, default=1.1)
+    parser.add_argument("--operations", type=int, default=100_000)
+    parser.add_argument("--mode", choices=MODES, default="single")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    generator = WorkloadGenerator(args.seed, args.customers, args.accounts_per_customer, args.savings_ratio, args.zipf)
+    summary = replay(generator, args.operations, args.mode, args.workers).summary()
+
+    print(f"{summary['operations']:,} operations in {summary['elapsed']:.2f}s ({summary['throughput']:,.0f} ops/s)")
+    for kind, stats in summary["per_operation"].items():
+        print(f"{kind:<10} n={stats['count']:<8} rejected={stats['rejection_rate']:6.2%} "
+              f"p50={stats['p50_us']:8.1f}us p99={stats['p99_us']:8.1f}us p99.9={stats['p999_us']:8.1f}us")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,12 @@
 # Main Class
+import math
+import sys
+from collections.abc import Iterable
+from io import TextIOBase
+
 from src import Customer, SavingsAccount, CheckingAccount
+from src.fx import FxRateTable, DEFAULT_CURRENCY
+from src.directory import CustomerDirectory
 
 
 # ================
@@ -31,6 +38,15 @@ def check_str(prompt: str, alpha_only: bool = False) -> str:
             print(f"Invalid input. {e}")
 
 
+def parse_amount(text: str) -> float:
+    # float() also accepts "nan" and "inf", which would poison a balance
+    amount = float(text)
+    if not math.isfinite(amount):
+        raise ValueError(f"Invalid amount '{text}'")
+
+    return amount
+
+
 def process_transaction(prompt: str, transaction_func) -> float | None:
     while True:
         user_input = input(f"{prompt} (or 'e' to cancel): ").strip()
@@ -39,7 +55,7 @@ def process_transaction(prompt: str, transaction_func) -> float | None:
             return None
 
         try:
-            amount = float(user_input)
+            amount = parse_amount(user_input)
             
         except ValueError:
             print("Invalid input. Please enter a valid number.")
@@ -241,8 +257,213 @@ def secure_bank_interface() -> None:
             return
 
 
-def main():
-    secure_bank_interface()
+# ================
+#    Batch Mode
+# ================
+
+BATCH_USAGE: dict[str, str] = {
+    "open_customer": "open_customer <customer_id> <first_name> <last_name> <email>",
+    "open_account": "open_account <customer_id> <savings|checking> <account_id> [currency]",
+    "deposit": "deposit <account_id> <amount>",
+    "withdraw": "withdraw <account_id> <amount>",
+    "transfer": "transfer <source_account_id> <destination_account_id> <amount>",
+    "interest": "interest <account_id>",
+    "balance": "balance <account_id>",
+    "statement": "statement <account_id>",
+    "find": "find <name> [name]",
+}
+
+
+class BatchSession:
+    """
+    In-memory bank state for a batch run.
+    Customers and accounts are indexed by ID so each command is an O(1) lookup.
+    """
+
+    def __init__(self, fx_rates: FxRateTable | None = None):
+        # Indexed by ID, email and name; rejects duplicate emails like the Customers table
+        self.customers: CustomerDirectory = CustomerDirectory()
+        self.accounts: dict[int, SavingsAccount | CheckingAccount] = {}
+        # Loaded once and shared by every cross-currency transfer in the batch
+        self.fx_rates: FxRateTable | None = fx_rates
+
+
+    def account(self, account_ID: str) -> SavingsAccount | CheckingAccount:
+        account = self.accounts.get(int(account_ID))
+        if account is None:
+            raise ValueError(f"Account {account_ID} not found")
+
+        return account
+
+
+    def execute(self, args: list[str]) -> list[str]:
+        command = args[0].lower()
+        if command not in BATCH_USAGE:
+            raise ValueError(f"Unknown command '{command}'")
+
+        usage = BATCH_USAGE[command].split()[1:]
+        required_args = sum(1 for arg in usage if not arg.startswith("["))
+        if not required_args <= len(args) - 1 <= len(usage):
+            raise ValueError(f"Usage: {BATCH_USAGE[command]}")
+
+        if command == "open_customer":
+            customer_ID = int(args[1])
+            self.customers.add(Customer(customer_ID, args[2], args[3], args[4]))
+            return [f"Customer {customer_ID} created"]
+
+        if command == "find":
+            matches = self.customers.search_prefix(" ".join(args[1:]))
+            if not matches:
+                return [f"No customers match '{' '.join(args[1:])}'"]
+
+            return [f"Customer {customer.customer_ID}: {customer.first_name} {customer.last_name} <{customer.email}>"
+                    for customer in matches]
+
+        if command == "open_account":
+            customer = self.customers.get(int(args[1]))
+            if customer is None:
+                raise ValueError(f"Customer {args[1]} not found")
+
+            account_ID = int(args[3])
+            if account_ID in self.accounts:
+                raise ValueError(f"Account ID {account_ID} is already taken")
+
+            kind = args[2].lower()
+            currency = args[4] if len(args) > 4 else DEFAULT_CURRENCY
+            if kind in ("s", "savings"):
+                account = SavingsAccount(account_ID, currency=currency)
+            elif kind in ("c", "checking"):
+                account = CheckingAccount(account_ID, currency=currency)
+            else:
+                raise ValueError("Account type must be 'savings' or 'checking'")
+
+            customer.open_account(account)
+            self.accounts[account_ID] = account
+            return [f"{type(account).__name__} (ID: {account_ID}, {account.currency}) opened for customer {customer.customer_ID}"]
+
+        account = self.account(args[1])
+
+        if command == "deposit":
+            account.deposit(parse_amount(args[2]))
+            return [f"Deposit of ${args[2]} to {account.account_ID} successful"]
+
+        if command == "withdraw":
+            account.withdraw(parse_amount(args[2]))
+            return [f"Withdrawal of ${args[2]} from {account.account_ID} successful"]
+
+        if command == "transfer":
+            account.transfer(self.account(args[2]), parse_amount(args[3]), self.fx_rates)
+            return [f"Transfer of ${args[3]} from {args[1]} to {args[2]} successful"]
+
+        if command == "interest":
+            if not isinstance(account, SavingsAccount):
+                raise ValueError("Interest only applies to savings accounts")
+
+            account.apply_interest()
+            return [f"Interest applied to {account.account_ID}, new balance: ${account.balance}"]
+
+        if command == "balance":
+            return [f"Account {account.account_ID} balance: ${account.balance}"]
+
+        lines = [f"Statement for account {account.account_ID} ({type(account).__name__})"]
+        for transaction in account.view_transaction_history():
+            lines.append(f"{transaction.timestamp} - {transaction.transaction_type.value} - ${transaction.amount}")
+        lines.append(f"Closing balance: ${account.balance}")
+        return lines
+
+
+# Engine faults rather than rejected input; reported per line so one bad command does not end a batch
+ENGINE_FAILURES: tuple[type[Exception], ...] = (AssertionError, LookupError, TypeError, ArithmeticError)
+
+
+def run_batch(lines: Iterable[str], out: TextIOBase, batch_size: int = 1000,
+              session: BatchSession | None = None) -> dict[str, int]:
+    """
+    Runs one command per line (blank lines and '#' comments are skipped).
+    Output is buffered and written once per `batch_size` commands, and a
+    summary is printed at the end. Errors are reported per line and do
+    not stop the run; that includes engine faults such as a violated
+    invariant (AssertionError in "raise" mode), which are labelled with
+    their type so they stand out from rejected commands.
+    """
+    session = session or BatchSession()
+    summary = {"commands": 0, "succeeded": 0, "failed": 0}
+    buffer: list[str] = []
+
+    for line_number, line in enumerate(lines, start=1):
+        args = line.split()
+        if not args or args[0].startswith("#"):
+            continue
+
+        summary["commands"] += 1
+        try:
+            buffer.extend(session.execute(args))
+            summary["succeeded"] += 1
+        except ValueError as e:
+            buffer.append(f"line {line_number}: Error: {e}")
+            summary["failed"] += 1
+        except ENGINE_FAILURES as e:
+            buffer.append(f"line {line_number}: Internal error: {type(e).__name__}: {e}")
+            summary["failed"] += 1
+
+        if summary["commands"] % batch_size == 0:
+            out.write("\n".join(buffer) + "\n")
+            buffer.clear()
+
+    if buffer:
+        out.write("\n".join(buffer) + "\n")
+
+    out.write(f"Processed {summary['commands']} commands: "
+              f"{summary['succeeded']} succeeded, {summary['failed']} failed\n")
+    out.flush()
+    return summary
+
+
+def main(argv: list[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        secure_bank_interface()
+        return
+
+    # Imported only once there are options to parse, so interactive start-up and library imports skip argparse
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SecureBank CLI")
+    parser.add_argument("--batch", metavar="FILE", help="run commands from FILE ('-' for stdin) instead of the interactive menu")
+    parser.add_argument("--batch-size", type=int, default=1000, help="commands per buffered output flush")
+    parser.add_argument("--fx-rates", metavar="CSV", help="base,quote,rate file used for cross-currency transfers")
+    parser.add_argument("--profile", metavar="DIR", help="profile the batch run; writes collapsed stacks and report.txt to DIR")
+    parser.add_argument("--profile-modes", nargs="+", default=["sample", "cprofile", "memory"], metavar="MODE",
+                        help="collectors to run with --profile: sample, cprofile, memory (default: all)")
+    args = parser.parse_args(argv)
+
+    if args.batch is None:
+        secure_bank_interface()
+        return
+
+    profiler = None
+    if args.profile:
+        from src.profiling import Profiler
+
+        try:
+            profiler = Profiler(tuple(args.profile_modes))
+        except ValueError as e:
+            parser.error(str(e))
+
+    session = BatchSession(FxRateTable.load(args.fx_rates) if args.fx_rates else None)
+    if profiler is not None:
+        profiler.start()
+    try:
+        if args.batch == "-":
+            run_batch(sys.stdin, sys.stdout, args.batch_size, session)
+        else:
+            with open(args.batch) as file:
+                run_batch(file, sys.stdout, args.batch_size, session)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            profiler.write(args.profile)
+            print(profiler.report(), file=sys.stderr)
 
 
 if __name__ == '__main__':
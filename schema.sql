@@ -10,13 +10,36 @@ CREATE TABLE Customers (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE TABLE Products (
+    product_code VARCHAR(20) NOT NULL,
+    version INT NOT NULL,
+    overdraft_limit DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
+    overdraft_fee DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
+    maintenance_fee DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (product_code, version)
+);
+
+CREATE TABLE ProductInterestTiers (
+    product_code VARCHAR(20) NOT NULL,
+    version INT NOT NULL,
+    min_balance DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
+    interest_rate DECIMAL(5, 4) NOT NULL,
+    PRIMARY KEY (product_code, version, min_balance),
+    FOREIGN KEY (product_code, version) REFERENCES Products(product_code, version) ON DELETE CASCADE
+);
+
 CREATE TABLE Accounts (
     account_id INT AUTO_INCREMENT PRIMARY KEY,
     customer_id INT NOT NULL,
     account_type ENUM('Savings', 'Checking') NOT NULL,
+    product_code VARCHAR(20) NOT NULL,
+    currency CHAR(3) NOT NULL DEFAULT 'USD',
     balance DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
-    interest_rate DECIMAL(5, 4) DEFAULT 0.00,
-    overdraft_limit DECIMAL(10, 2) DEFAULT 0.00,
+    version INT NOT NULL DEFAULT 0,
+    interest_period CHAR(7) NULL,
+    fees_period CHAR(7) NULL,
+    status ENUM('ACTIVE', 'DORMANT', 'CLOSED') NOT NULL DEFAULT 'ACTIVE',
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (customer_id) REFERENCES Customers(customer_id) ON DELETE CASCADE
 );
@@ -24,9 +47,11 @@ CREATE TABLE Accounts (
 CREATE TABLE Transactions (
     transaction_id INT AUTO_INCREMENT PRIMARY KEY,
     account_id INT NOT NULL,
-    transaction_type ENUM('DEPOSIT', 'WITHDRAW', 'TRANSFER_SENT', 'TRANSFER_RECEIVED', 'OVERDRAFT_FEE', 'INTEREST') NOT NULL,
+    transaction_type ENUM('DEPOSIT', 'WITHDRAW', 'TRANSFER_SENT', 'TRANSFER_RECEIVED', 'OVERDRAFT_FEE', 'MAINTENANCE_FEE', 'INTEREST') NOT NULL,
     amount DECIMAL(10, 2) NOT NULL,
-    time_stamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    fx_amount DECIMAL(10, 2) NULL,
+    fx_currency CHAR(3) NULL,
+    time_stamp DATETIME(6) DEFAULT CURRENT_TIMESTAMP(6),
     FOREIGN KEY (account_id) REFERENCES Accounts(account_id) ON DELETE CASCADE
 );
 
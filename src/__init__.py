@@ -3,8 +3,46 @@ SecureBank Core Package
 -----------------------
 This package contains the core business logic for the banking system.
 It exposes the main classes for easy access.
+
+Names are resolved lazily (PEP 562): `import src` loads nothing until a
+class is first used, and `from src import Customer` only loads the engine
+modules Customer depends on. The DB stack (src.database) and optional
+accelerators such as NumPy are never imported here.
 """
-from .transaction import Transaction, TransactionType
-from .audit_log import AuditLog
-from .account import Account, SavingsAccount, CheckingAccount
-from .customer import Customer
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS: dict[str, str] = {
+    "Transaction": "transaction",
+    "TransactionType": "transaction",
+    "AuditLog": "audit_log",
+    "EventBus": "events",
+    "PostingEvent": "events",
+    "Subscription": "events",
+    "Product": "product",
+    "ProductTerms": "product",
+    "ProductCatalog": "product",
+    "DEFAULT_CATALOG": "product",
+    "FxRateTable": "fx",
+    "Account": "account",
+    "AccountStatus": "account",
+    "SavingsAccount": "account",
+    "CheckingAccount": "account",
+    "Customer": "customer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
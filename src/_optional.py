@@ -0,0 +1,22 @@
+"""
+Lazy loaders for optional accelerators.
+Nothing here is imported until a batch/vectorized code path first asks for it.
+"""
+
+_numpy_module = None
+_numpy_checked: bool = False
+
+
+def numpy():
+    """Returns the numpy module, or None if it is not installed."""
+    global _numpy_module, _numpy_checked
+
+    if not _numpy_checked:
+        try:
+            import numpy as np
+            _numpy_module = np
+        except ImportError:
+            _numpy_module = None
+        _numpy_checked = True
+
+    return _numpy_module
@@ -1,14 +1,41 @@
 from .audit_log import AuditLog
 from .transaction import Transaction, TransactionType
+from .product import Product, ProductTerms, DEFAULT_CATALOG
+from .events import EventBus, PostingEvent
+from .fx import FxRateTable, DEFAULT_CURRENCY, currency_code
+from . import invariants
 from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+
+
+class AccountStatus(Enum):
+    ACTIVE = "ACTIVE"
+    DORMANT = "DORMANT"  # No customer activity for a while (see lifecycle.py); any posting reactivates it
+    CLOSED = "CLOSED"    # Zero balance, no further postings
 
 
 class Account(ABC):
-    def __init__(self, account_ID: int):
+    __slots__ = ("_account_ID", "_customer_ID", "_balance", "_audit_log", "_currency", "_version", "_status", "_posted_periods", "_synced")
+
+    # Shared change stream for every account (None = nobody is listening)
+    _event_bus: EventBus | None = None
+    # Set by readview.ReadViews while a read view is open; pre-images are saved before each change
+    _read_views: 'ReadViews | None' = None
+
+    def __init__(self, account_ID: int, currency: str = DEFAULT_CURRENCY):
         self._account_ID: int = account_ID
         self._customer_ID: int | None = None
         self._balance: float = 0
         self._audit_log: AuditLog = AuditLog()
+        self._currency: str = currency_code(currency)
+        # Row version this balance was loaded at / last persisted as (see repository.py)
+        self._version: int = 0
+        # Audit entries already written to the Transactions table (see repository.py)
+        self._synced: int = 0
+        self._status: AccountStatus = AccountStatus.ACTIVE
+        # Month-end task -> last period it was posted for (see scheduler.py); None until the first run
+        self._posted_periods: dict[str, str] | None = None
 
 
     def assign_customer(self, customer_ID: int) -> None:
@@ -18,29 +45,108 @@ class Account(ABC):
         self._customer_ID = customer_ID
 
 
+    @staticmethod
+    def set_event_bus(event_bus: EventBus | None) -> None:
+        Account._event_bus = event_bus
+
+
+    def close(self) -> None:
+        if self._status is AccountStatus.CLOSED:
+            raise ValueError(f"Account {self._account_ID} is already closed")
+
+        if self._balance != 0:
+            raise ValueError("Balance must be zero to close the account")
+
+        self._status = AccountStatus.CLOSED
+
+
+    def mark_dormant(self) -> None:
+        if self._status is AccountStatus.CLOSED:
+            raise ValueError(f"Account {self._account_ID} is closed")
+
+        self._status = AccountStatus.DORMANT
+
+
+    def _wake(self) -> None:
+        # Called before a customer posting on a non-active account
+        if self._status is AccountStatus.CLOSED:
+            raise ValueError(f"Account {self._account_ID} is closed")
+
+        self._status = AccountStatus.ACTIVE
+
+
     def view_transaction_history(self) -> list[Transaction]:
         # Accessed as a property (no parentheses)
         return self._audit_log.transactions      
-    
 
-    def transfer(self, destination_account: 'Account', amount: float) -> None:
 
-        assert isinstance(destination_account, Account), "Destination must be an Account object"
+    def _view_state(self) -> tuple[float, int]:
+        # (balance, audit entries) as a read view records it; see readview.py
+        return self._balance, len(self._audit_log)
+
+
+    def _history_prefix(self, count: int) -> list[Transaction]:
+        return self._audit_log.slice(0, count)
+    
+
+    def transfer(self, destination_account: 'Account', amount: float, fx_rates: FxRateTable | None = None) -> None:
+        """
+        Moves `amount` (in this account's currency) to destination_account.
+        Cross-currency transfers need `fx_rates`; the destination is credited
+        the converted amount and both legs record the other side's amount.
+        """
+        invariants.check(isinstance(destination_account, Account), "transfer_destination_type", "Destination must be an Account object")
         
         # Prevents circular transfers (A -> A)
         if self == destination_account:
             raise ValueError("Cannot transfer to the same account.")
 
+        if self._currency != destination_account._currency:
+            if amount <= 0:
+                raise ValueError("Invalid withdrawal amount")
+
+            if fx_rates is None:
+                raise ValueError(f"FX rates required to transfer {self._currency} to {destination_account._currency}")
+
+            # Converted before anything is posted, so a missing rate leaves both accounts untouched
+            self._transfer_converted(destination_account, amount, fx_rates.convert(amount, self._currency, destination_account._currency))
+            return
+
+        self._begin_transfer(destination_account)
         self._withdraw_helper(amount, TransactionType.TRANSFER_SENT)
 
+        if destination_account._status is not AccountStatus.ACTIVE:
+            destination_account._wake()
         destination_account._deposit_helper(amount, TransactionType.TRANSFER_RECEIVED)
 
 
+    def _transfer_converted(self, destination_account: 'Account', amount: float, converted: float) -> None:
+        # `converted` is `amount` already expressed in the destination currency (see fx.transfer_batch)
+        self._begin_transfer(destination_account)
+        self._withdraw_helper(amount, TransactionType.TRANSFER_SENT, (converted, destination_account._currency))
+
+        if destination_account._status is not AccountStatus.ACTIVE:
+            destination_account._wake()
+        destination_account._deposit_helper(converted, TransactionType.TRANSFER_RECEIVED, (amount, self._currency))
+
+
+    def _begin_transfer(self, destination_account: 'Account') -> None:
+        # The sender's request is activity, so it wakes now; the destination only wakes once the debit went through
+        if self._status is not AccountStatus.ACTIVE:
+            self._wake()
+        if destination_account._status is AccountStatus.CLOSED:
+            raise ValueError(f"Account {destination_account._account_ID} is closed")
+
+
     def deposit(self, amount: float) -> None:
+        if self._status is not AccountStatus.ACTIVE:
+            self._wake()
+
         self._deposit_helper(amount, TransactionType.DEPOSIT)
 
 
-    def _deposit_helper(self, amount: float, transaction_type: TransactionType) -> None:
+    def _deposit_helper(self, amount: float, transaction_type: TransactionType, fx: tuple[float, str] | None = None,
+                        timestamp: datetime | None = None) -> None:
         """
         Core logic for adding funds.
         - Validates positive amount.
@@ -48,22 +154,79 @@ class Account(ABC):
         """
         if amount <= 0:
             raise ValueError("Invalid deposit amount")
-        
+
+        if Account._read_views is not None:
+            Account._read_views.before_write(self)
+
         self._balance += amount
         
-        new_tx: Transaction = Transaction(transaction_type, amount)
+        self._record(transaction_type, amount, fx, timestamp)
+
+
+    def _record(self, transaction_type: TransactionType, amount: float, fx: tuple[float, str] | None = None,
+                timestamp: datetime | None = None) -> None:
+        """
+        Logs a balance change that has already been applied and publishes it
+        on the event bus (if one is attached).
+        `fx` is (amount, currency) of the other leg of a cross-currency transfer;
+        `timestamp` backdates a month-end posting (default: now).
+        """
+        fx_amount, fx_currency = fx or (None, None)
+        new_tx: Transaction = Transaction(transaction_type, amount, fx_amount, fx_currency, timestamp)
         self._audit_log.log_transaction(new_tx)
 
+        if Account._event_bus is not None:
+            self._publish(new_tx)
+
+
+    def _publish(self, transaction: Transaction) -> None:
+        Account._event_bus.publish(PostingEvent(self._account_ID, self._customer_ID, transaction, self._balance))
+
 
     def withdraw(self, amount: float) -> None:
+        if self._status is not AccountStatus.ACTIVE:
+            self._wake()
+
         self._withdraw_helper(amount, TransactionType.WITHDRAW)
 
 
     @abstractmethod
-    def _withdraw_helper(self, amount: float, transaction_type: TransactionType) -> None:
+    def _withdraw_helper(self, amount: float, transaction_type: TransactionType, fx: tuple[float, str] | None = None) -> None:
         pass
 
 
+    @staticmethod
+    def debit_fee(balance: float, amount: float, terms: ProductTerms) -> float:
+        """
+        Product rule for a debit of `amount` from `balance`: returns the fee
+        it triggers, or raises ValueError if it is not allowed. Shared with
+        repository.py so database postings follow the same rules.
+        """
+        return 0
+
+
+    def _last_timestamp(self) -> datetime | None:
+        # Time of the latest posting; month-end postings are never stamped before it (see scheduler.py)
+        return self._audit_log.last_timestamp
+
+
+    def _charge_fee(self, fee: float, floor: float, timestamp: datetime | None = None) -> float:
+        """
+        Deducts the monthly maintenance fee as a MAINTENANCE_FEE posting.
+        The fee is waived if it would take the balance below `floor`.
+        Returns the amount charged. Closed accounts are never charged.
+        """
+        if fee <= 0 or self._balance - fee < floor or self._status is AccountStatus.CLOSED:
+            return 0
+
+        if Account._read_views is not None:
+            Account._read_views.before_write(self)
+
+        self._balance -= fee
+        self._record(TransactionType.MAINTENANCE_FEE, fee, timestamp=timestamp)
+        return fee
+
+
     # =======================
     #   Getters (Read-only)
     # =======================
@@ -79,93 +242,151 @@ class Account(ABC):
     @property
     def customer_ID(self) -> int:
         return self._customer_ID
+
+    @property
+    def currency(self) -> str:
+        return self._currency
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def status(self) -> AccountStatus:
+        return self._status
+
+    @property
+    def transaction_count(self) -> int:
+        # O(1), unlike len(view_transaction_history()) which copies the log
+        return len(self._audit_log)
     
 
 class SavingsAccount(Account):
-    def __init__(self, account_ID: int):
-        super().__init__(account_ID)
-        self.__interest_rate: float = 0.015
+    __slots__ = ("_product",)
+
+    def __init__(self, account_ID: int, product: Product | None = None, currency: str = DEFAULT_CURRENCY):
+        super().__init__(account_ID, currency)
+        # Rates live on the shared product, not on the account
+        self._product: Product = product or DEFAULT_CATALOG.get("SAVINGS")
 
 
-    def _withdraw_helper(self, amount: float, transaction_type: TransactionType) -> None:
+    def _withdraw_helper(self, amount: float, transaction_type: TransactionType, fx: tuple[float, str] | None = None) -> None:
         if amount <= 0:
             raise ValueError("Invalid withdrawal amount")
-        
-        if self._balance - amount < 0:
-            raise ValueError("Insufficient funds")
-        
+
+        self.debit_fee(self._balance, amount, self._product.terms)
+
+        if Account._read_views is not None:
+            Account._read_views.before_write(self)
+
         self._balance -= amount
 
-        assert self._balance >= 0, "CRITICAL LOGIC ERROR: Savings balance became negative!"
+        invariants.check(self._balance >= 0, "savings_non_negative", "CRITICAL LOGIC ERROR: Savings balance became negative!")
 
-        new_tx: Transaction = Transaction(transaction_type, amount)
-        self._audit_log.log_transaction(new_tx)
+        self._record(transaction_type, amount, fx)
 
 
-    def apply_interest(self) -> None:
-        # Apply interest (1.5%)
-        interest: float = self._balance * self.__interest_rate
-        if interest > 0:
-            self._deposit_helper(interest, TransactionType.INTEREST_APPLIED)
+    @staticmethod
+    def debit_fee(balance: float, amount: float, terms: ProductTerms) -> float:
+        if balance - amount < 0:
+            raise ValueError("Insufficient funds")
+
+        return 0
+
+
+    def apply_interest(self, timestamp: datetime | None = None) -> None:
+        # Apply interest at the current product rate for this balance tier (default 1.5%)
+        interest: float = self._balance * self._product.terms.rate_for(self._balance)
+        # Bank-initiated: posts to dormant accounts without waking them
+        if interest > 0 and self._status is not AccountStatus.CLOSED:
+            self._deposit_helper(interest, TransactionType.INTEREST_APPLIED, timestamp=timestamp)
+
+
+    def apply_maintenance_fee(self, timestamp: datetime | None = None) -> float:
+        # Savings can never go negative, so the fee is waived if it can't be covered
+        return self._charge_fee(self._product.terms.maintenance_fee, 0, timestamp)
 
 
     # =======================
     #   Getters (Read-only)
     # =======================
 
+    @property
+    def product(self) -> Product:
+        return self._product
+
     @property
     def interest_rate(self) -> float:
-        return self.__interest_rate
+        return self._product.terms.interest_rate
     
     
 class CheckingAccount(Account):
-    def __init__(self, account_ID: int):
-        super().__init__(account_ID)
-        self.__overdraft_limit: float = -500
-        self.__overdraft_fee: float = 35
+    __slots__ = ("_product",)
+
+    def __init__(self, account_ID: int, product: Product | None = None, currency: str = DEFAULT_CURRENCY):
+        super().__init__(account_ID, currency)
+        # Limits and fees live on the shared product, not on the account
+        self._product: Product = product or DEFAULT_CATALOG.get("CHECKING")
 
 
-    def _withdraw_helper(self, amount: float, transaction_type: TransactionType) -> None:
+    def _withdraw_helper(self, amount: float, transaction_type: TransactionType, fx: tuple[float, str] | None = None) -> None:
         if amount <= 0:
             raise ValueError("Invalid withdrawal amount")
-        
-        is_negative: bool = self._balance < 0
-        
-        projected_balance: float = self._balance - amount
+
+        terms: ProductTerms = self._product.terms
+        fee: float = self.debit_fee(self._balance, amount, terms)
+
+        if Account._read_views is not None:
+            Account._read_views.before_write(self)
+
+        self._balance -= amount
+
+        self._record(transaction_type, amount, fx)
+
+        if fee > 0:
+            self._balance -= fee
+            self._record(TransactionType.EXTRA_FEE, fee)
+
+        invariants.check(self._balance >= terms.overdraft_limit, "checking_overdraft_limit", "CRITICAL LOGIC ERROR: Checking balance below overdraft limit!")
+
+
+    @staticmethod
+    def debit_fee(balance: float, amount: float, terms: ProductTerms) -> float:
+        is_negative: bool = balance < 0
+        projected_balance: float = balance - amount
         fee: float = 0
-        
+
         # Apply Overdraft Fee if balance drops below 0
         if projected_balance < 0 and not is_negative:
-            fee = self.__overdraft_fee
-            
+            fee = terms.overdraft_fee
+
         if is_negative:
-            assert fee == 0, "Logic Error: Overdraft fee charged on already negative balance"
+            invariants.check(fee == 0, "single_overdraft_fee", "Logic Error: Overdraft fee charged on already negative balance")
 
-        if (projected_balance - fee) < self.__overdraft_limit:
+        if (projected_balance - fee) < terms.overdraft_limit:
             raise ValueError("Overdraft limit exceeded")
-        
-        self._balance -= amount
 
-        new_tx: Transaction = Transaction(transaction_type, amount)
-        self._audit_log.log_transaction(new_tx)
+        return fee
 
-        if fee > 0:
-            self._balance -= fee
-            new_tx: Transaction = Transaction(TransactionType.EXTRA_FEE, fee)
-            self._audit_log.log_transaction(new_tx)
 
-        assert self._balance >= self.__overdraft_limit, "CRITICAL LOGIC ERROR: Checking balance below overdraft limit!"
+    def apply_maintenance_fee(self, timestamp: datetime | None = None) -> float:
+        # Waived if it would push the balance past the overdraft limit
+        return self._charge_fee(self._product.terms.maintenance_fee, self._product.terms.overdraft_limit, timestamp)
 
 
     # =======================
     #   Getters (Read-only)
     # =======================
     
+    @property
+    def product(self) -> Product:
+        return self._product
+
     @property
     def overdraft_limit(self) -> float:
-        return self.__overdraft_limit
+        return self._product.terms.overdraft_limit
     
     @property
     def overdraft_fee(self) -> float:
-        return self.__overdraft_fee
+        return self._product.terms.overdraft_fee
     
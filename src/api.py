@@ -0,0 +1,406 @@
+"""
+Local REST/JSON service over the in-memory engine (standard library only).
+
+Run from the project root:
+    python -m src.api [--host 127.0.0.1] [--port 8080] [--fx-rates rates.csv]
+
+Endpoints (JSON in, JSON out):
+    POST /customers                      {"customer_id", "first_name", "last_name", "email"}
+    GET  /customers/<id>
+    POST /accounts                       {"customer_id", "type", "account_id", "currency"?}
+    GET  /accounts/<id>
+    GET  /accounts/<id>/balance
+    GET  /accounts/<id>/history          ?cursor=<next_cursor>&limit=<n> (default 100, max 1000)
+    GET  /accounts/<id>/history/stream   chunked NDJSON, one transaction per line
+    POST /accounts/<id>/deposit          {"amount"}
+    POST /accounts/<id>/withdraw         {"amount"}
+    POST /transfers                      {"source", "destination", "amount"}
+    POST /batch                          {"operations": [{"op": "deposit", "account_id": 1, "amount": 5}, ...]}
+
+Connections are HTTP/1.1 keep-alive. The engine is not thread-safe, so every
+operation runs under one service lock; /batch takes it once for all of its
+operations and answers with one result per operation (failures do not stop
+the batch, like batch mode in main.py). History cursors are offsets into the
+append-only audit log, so a page never shifts when new postings arrive.
+"""
+import json
+import math
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator
+from urllib.parse import parse_qs, urlsplit
+
+from .account import Account, SavingsAccount, CheckingAccount
+from .customer import Customer
+from .directory import CustomerDirectory
+from .fx import DEFAULT_CURRENCY, FxRateTable
+from .transaction import Transaction
+
+DEFAULT_PAGE_SIZE: int = 100
+MAX_PAGE_SIZE: int = 1000
+STREAM_CHUNK: int = 256  # transactions per chunk of a streamed history
+MAX_BODY: int = 16 * 1024 * 1024
+
+
+class NotFound(ValueError):
+    pass
+
+
+def transaction_json(transaction: Transaction) -> dict:
+    data: dict = {"type": transaction.transaction_type.value, "amount": transaction.amount,
+                  "timestamp": transaction.timestamp.isoformat()}
+    if transaction.fx_currency is not None:
+        data["fx_amount"] = transaction.fx_amount
+        data["fx_currency"] = transaction.fx_currency
+    return data
+
+
+def account_json(account: Account) -> dict:
+    return {"account_id": account.account_ID, "customer_id": account.customer_ID, "type": type(account).__name__,
+            "product": account.product.code, "currency": account.currency, "balance": account.balance,
+            "transactions": account.transaction_count}
+
+
+def _field(fields: dict, name: str, kind: type):
+    if name not in fields:
+        raise ValueError(f"Missing field '{name}'")
+
+    # No coercion: str(None) or int(12.7) would quietly accept a wrong value; bool is not a number here
+    value = fields[name]
+    accepted: tuple[type, ...] = (int, float) if kind is float else (kind,)
+    if not isinstance(value, accepted) or isinstance(value, bool):
+        raise ValueError(f"Field '{name}' must be {kind.__name__}")
+
+    return kind(value)
+
+
+def _amount(fields: dict) -> float:
+    amount: float = _field(fields, "amount", float)
+    if not math.isfinite(amount):
+        raise ValueError("Field 'amount' must be a finite number")
+    return amount
+
+
+def _query_value(value: str) -> int | str:
+    # Query strings are text; whole numbers (limit, cursor) become ints so _field sees JSON-like types
+    return int(value) if value.isascii() and value.isdigit() else value
+
+
+def _reject_constant(name: str) -> None:
+    raise ValueError(f"Invalid JSON constant {name}")
+
+
+class BankService:
+    """
+    Bank state behind the HTTP API.
+    Every operation is a method taking its JSON fields; OPERATIONS maps the
+    names accepted by /batch to them.
+    """
+
+    def __init__(self, fx_rates: FxRateTable | None = None):
+        self._customers: CustomerDirectory = CustomerDirectory()
+        self._accounts: dict[int, Account] = {}
+        self._fx_rates: FxRateTable | None = fx_rates
+        self._lock: threading.Lock = threading.Lock()
+
+
+    def execute(self, operation: str, fields: dict) -> dict:
+        method: Callable[['BankService', dict], dict] | None = self.OPERATIONS.get(operation)
+        if method is None:
+            raise ValueError(f"Unknown operation '{operation}'")
+
+        with self._lock:
+            return method(self, fields)
+
+
+    def batch(self, operations: list) -> list[dict]:
+        results: list[dict] = []
+        with self._lock:
+            for operation in operations:
+                try:
+                    if not isinstance(operation, dict):
+                        raise ValueError("Each operation must be an object")
+
+                    name = operation.get("op")
+                    method = self.OPERATIONS.get(name) if isinstance(name, str) else None
+                    if method is None:
+                        raise ValueError(f"Unknown operation '{name}'")
+
+                    results.append({"ok": True, "result": method(self, operation)})
+                except ValueError as e:
+                    results.append({"ok": False, "error": str(e)})
+
+        return results
+
+
+    def _account(self, account_ID: int) -> Account:
+        account: Account | None = self._accounts.get(account_ID)
+        if account is None:
+            raise NotFound(f"Account {account_ID} not found")
+
+        return account
+
+
+    def _open_customer(self, fields: dict) -> dict:
+        customer = Customer(_field(fields, "customer_id", int), _field(fields, "first_name", str),
+                            _field(fields, "last_name", str), _field(fields, "email", str))
+        self._customers.add(customer)
+        return self._get_customer({"customer_id": customer.customer_ID})
+
+
+    def _get_customer(self, fields: dict) -> dict:
+        customer_ID: int = _field(fields, "customer_id", int)
+        customer: Customer | None = self._customers.get(customer_ID)
+        if customer is None:
+            raise NotFound(f"Customer {customer_ID} not found")
+
+        return {"customer_id": customer.customer_ID, "first_name": customer.first_name, "last_name": customer.last_name,
+                "email": customer.email, "accounts": [account.account_ID for account in customer.accounts]}
+
+
+    def _open_account(self, fields: dict) -> dict:
+        customer_ID: int = _field(fields, "customer_id", int)
+        customer: Customer | None = self._customers.get(customer_ID)
+        if customer is None:
+            raise NotFound(f"Customer {customer_ID} not found")
+
+        account_ID: int = _field(fields, "account_id", int)
+        if account_ID in self._accounts:
+            raise ValueError(f"Account ID {account_ID} is already taken")
+
+        kind: str = _field(fields, "type", str).lower()
+        currency: str = _field(fields, "currency", str) if "currency" in fields else DEFAULT_CURRENCY
+        if kind in ("s", "savings"):
+            account: Account = SavingsAccount(account_ID, currency=currency)
+        elif kind in ("c", "checking"):
+            account = CheckingAccount(account_ID, currency=currency)
+        else:
+            raise ValueError("Account type must be 'savings' or 'checking'")
+
+        customer.open_account(account)
+        self._accounts[account_ID] = account
+        return account_json(account)
+
+
+    def _get_account(self, fields: dict) -> dict:
+        return account_json(self._account(_field(fields, "account_id", int)))
+
+
+    def _balance(self, fields: dict) -> dict:
+        account: Account = self._account(_field(fields, "account_id", int))
+        return {"account_id": account.account_ID, "balance": account.balance, "currency": account.currency}
+
+
+    def _deposit(self, fields: dict) -> dict:
+        account: Account = self._account(_field(fields, "account_id", int))
+        account.deposit(_amount(fields))
+        return {"account_id": account.account_ID, "balance": account.balance}
+
+
+    def _withdraw(self, fields: dict) -> dict:
+        account: Account = self._account(_field(fields, "account_id", int))
+        account.withdraw(_amount(fields))
+        return {"account_id": account.account_ID, "balance": account.balance}
+
+
+    def _transfer(self, fields: dict) -> dict:
+        source: Account = self._account(_field(fields, "source", int))
+        destination: Account = self._account(_field(fields, "destination", int))
+        source.transfer(destination, _amount(fields), self._fx_rates)
+        return {"source": {"account_id": source.account_ID, "balance": source.balance},
+                "destination": {"account_id": destination.account_ID, "balance": destination.balance}}
+
+
+    def _history(self, fields: dict) -> dict:
+        account: Account = self._account(_field(fields, "account_id", int))
+        # Cursors are handed out as strings (next_cursor); a query string may have turned one back into an int
+        cursor = fields.get("cursor") or 0
+        if isinstance(cursor, str) and cursor.isascii() and cursor.isdigit():
+            cursor = int(cursor)
+        if not isinstance(cursor, int) or isinstance(cursor, bool) or cursor < 0:
+            raise ValueError("Invalid cursor")
+        start: int = cursor
+        limit: int = _field(fields, "limit", int) if "limit" in fields else DEFAULT_PAGE_SIZE
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+        # Only the requested page is copied out of the log
+        size: int = len(account._audit_log)
+        end: int = min(start + limit, size)
+        return {"account_id": account.account_ID, "transactions": [transaction_json(tx) for tx in account._audit_log.slice(start, end)],
+                "next_cursor": str(end) if end < size else None}
+
+
+    def history_stream(self, account_ID: int) -> Iterator[bytes]:
+        """NDJSON chunks of the history as it stood when called (serialized outside the lock)."""
+        with self._lock:
+            history: list[Transaction] = self._account(account_ID).view_transaction_history()
+
+        for start in range(0, len(history), STREAM_CHUNK):
+            yield "".join(json.dumps(transaction_json(tx)) + "\n" for tx in history[start:start + STREAM_CHUNK]).encode()
+
+
+    OPERATIONS: dict[str, Callable[['BankService', dict], dict]] = {
+        "open_customer": _open_customer,
+        "customer": _get_customer,
+        "open_account": _open_account,
+        "account": _get_account,
+        "balance": _balance,
+        "deposit": _deposit,
+        "withdraw": _withdraw,
+        "transfer": _transfer,
+        "history": _history,
+    }
+
+
+# (method, path pattern, operation); path groups become fields
+ROUTES: tuple[tuple[str, re.Pattern, str], ...] = (
+    ("POST", re.compile(r"/customers"), "open_customer"),
+    ("GET", re.compile(r"/customers/(?P<customer_id>\d+)"), "customer"),
+    ("POST", re.compile(r"/accounts"), "open_account"),
+    ("GET", re.compile(r"/accounts/(?P<account_id>\d+)"), "account"),
+    ("GET", re.compile(r"/accounts/(?P<account_id>\d+)/balance"), "balance"),
+    ("GET", re.compile(r"/accounts/(?P<account_id>\d+)/history"), "history"),
+    ("POST", re.compile(r"/accounts/(?P<account_id>\d+)/deposit"), "deposit"),
+    ("POST", re.compile(r"/accounts/(?P<account_id>\d+)/withdraw"), "withdraw"),
+    ("POST", re.compile(r"/transfers"), "transfer"),
+)
+_STREAM_ROUTE: re.Pattern = re.compile(r"/accounts/(?P<account_id>\d+)/history/stream")
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: every response carries a length or is chunked
+    server_version = "SecureBank/1.0"
+    # Headers and body go out as separate writes; with Nagle on, keep-alive requests stall on delayed ACKs
+    disable_nagle_algorithm = True
+    service: BankService  # set per server by serve()
+
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        try:
+            if method == "GET" and (match := _STREAM_ROUTE.fullmatch(url.path)):
+                self._stream(self.service.history_stream(int(match["account_id"])))
+                return
+
+            body: dict = self._read_body() if method == "POST" else {}
+            if method == "POST" and url.path == "/batch":
+                operations = body.get("operations")
+                if not isinstance(operations, list):
+                    raise ValueError("Field 'operations' must be a list")
+                self._send(200, {"results": self.service.batch(operations)})
+                return
+
+            for route_method, pattern, operation in ROUTES:
+                match = pattern.fullmatch(url.path)
+                if match and route_method == method:
+                    fields: dict = {name: _query_value(values[-1]) for name, values in parse_qs(url.query).items()}
+                    fields.update(body)
+                    fields.update((name, int(value)) for name, value in match.groupdict().items())
+                    self._send(201 if operation.startswith("open_") else 200, self.service.execute(operation, fields))
+                    return
+
+            raise NotFound(f"No route for {method} {url.path}")
+
+        except NotFound as e:
+            self._send(404, {"error": str(e)})
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+
+
+    def _read_body(self) -> dict:
+        header: str = self.headers.get("Content-Length") or "0"
+        # A negative length would make rfile.read() wait for EOF on a keep-alive connection
+        if not (header.isascii() and header.strip().isdigit()):
+            self.close_connection = True
+            raise ValueError("Invalid Content-Length")
+
+        length: int = int(header)
+        if length > MAX_BODY:
+            self.close_connection = True
+            raise ValueError("Request body too large")
+
+        raw: bytes = self.rfile.read(length) if length else b"{}"
+        try:
+            # NaN / Infinity are not JSON and would reach balances as non-finite floats
+            body = json.loads(raw, parse_constant=_reject_constant)
+        except ValueError:
+            raise ValueError("Invalid JSON body") from None
+
+        if not isinstance(body, dict):
+            raise ValueError("JSON body must be an object")
+        return body
+
+
+    def _send(self, status: int, payload: dict) -> None:
+        data: bytes = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+    def _stream(self, chunks: Iterator[bytes]) -> None:
+        # Pull the first chunk before committing to 200 so a missing account is still a 404
+        first: bytes | None = next(chunks, None)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        if first is not None:
+            self._write_chunk(first)
+            for chunk in chunks:
+                self._write_chunk(chunk)
+        self.wfile.write(b"0\r\n\r\n")
+
+
+    def _write_chunk(self, chunk: bytes) -> None:
+        self.wfile.write(b"%x\r\n%b\r\n" % (len(chunk), chunk))
+
+
+    def log_message(self, format: str, *args) -> None:
+        # Per-request stderr logging would dominate the cost of a request
+        pass
+
+
+def serve(service: BankService, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+    """Binds a server for `service` (port 0 picks a free port); call serve_forever() to run it."""
+    handler: type = type("BoundApiHandler", (ApiHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SecureBank REST/JSON service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fx-rates", metavar="CSV", help="base,quote,rate file for cross-currency transfers")
+    args = parser.parse_args(argv)
+
+    service = BankService(FxRateTable.load(args.fx_rates) if args.fx_rates else None)
+    server = serve(service, args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,258 @@
-from .transaction import Transaction
+"""
+Tamper-evident, append-only transaction log.
+
+Every entry is hash-chained to the one before it:
+    chain[i] = sha256(0x00 || chain[i-1] || canonical bytes of transaction i)
+so changing, dropping or reordering an entry changes every later hash. The
+chain hashes are also the leaves of an append-only Merkle tree (RFC 6962
+tree hash, internal nodes sha256(0x01 || left || right)). Complete subtrees
+are stored level by level as they fill up, so roots and inclusion proofs
+cost O(log n) hashes. Every CHECKPOINT_INTERVAL entries the root is
+recorded as a Checkpoint that auditors can keep outside the system.
+
+- verify(start, end, checkpoint) rehashes only entries [start, end) plus
+  O(log n) stored nodes, and checks them against a checkpoint root.
+- verify_between(since, until) does the same for a date range.
+- prove(index) / verify_inclusion() show one entry is in a checkpoint.
+"""
+import hashlib
+import struct
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from operator import attrgetter
+
+from .transaction import Transaction, TransactionType
+from . import invariants
+
+HASH_SIZE: int = 32
+CHECKPOINT_INTERVAL: int = 1024
+GENESIS: bytes = bytes(HASH_SIZE)
+
+_LEAF: bytes = b"\x00"
+_NODE: bytes = b"\x01"
+_sha256 = hashlib.sha256
+_BY_TIMESTAMP = attrgetter("timestamp")
+
+# Codes follow declaration order; append new transaction types, never reorder
+_TYPE_CODES: dict[TransactionType, int] = {transaction_type: code for code, transaction_type in enumerate(TransactionType)}
+_ENTRY: struct.Struct = struct.Struct("<Bdq")  # type code, amount, microseconds since 1970
+_FX: struct.Struct = struct.Struct("<d")
+_EPOCH: datetime = datetime(1970, 1, 1)
+_MICROSECOND: timedelta = timedelta(microseconds=1)
+
+
+def canonical_bytes(transaction: Transaction) -> bytes:
+    """
+    Stable encoding of everything a transaction records: type code, amount
+    (IEEE double), microseconds since 1970 and, for cross-currency legs, the
+    other leg's amount and currency.
+    """
+    data: bytes = _ENTRY.pack(_TYPE_CODES[transaction._transaction_type], transaction._amount,
+                              (transaction._timestamp - _EPOCH) // _MICROSECOND)
+    if transaction._fx_currency is not None:
+        data += _FX.pack(transaction._fx_amount) + transaction._fx_currency.encode()
+    return data
+
+
+def chain_hash(previous: bytes, transaction: Transaction) -> bytes:
+    return _sha256(_LEAF + previous + canonical_bytes(transaction)).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return _sha256(_NODE + left + right).digest()
+
+
+def _split(size: int) -> int:
+    # Largest power of two strictly below size (RFC 6962 split point)
+    return 1 << ((size - 1).bit_length() - 1)
+
+
+class Checkpoint:
+    __slots__ = ("size", "root", "timestamp")
+
+    def __init__(self, size: int, root: bytes, timestamp: datetime):
+        self.size: int = size
+        self.root: bytes = root
+        self.timestamp: datetime = timestamp
+
+    def __repr__(self) -> str:
+        return f"Checkpoint(size={self.size}, root={self.root.hex()[:16]}..., time={self.timestamp})"
+
+
+class InclusionProof:
+    __slots__ = ("index", "size", "previous", "path")
+
+    def __init__(self, index: int, size: int, previous: bytes, path: list[bytes]):
+        self.index: int = index
+        self.size: int = size
+        self.previous: bytes = previous  # chain hash of the entry before `index`
+        self.path: list[bytes] = path
 
 
 class AuditLog:
-    def __init__(self):
+    _checkpoint_interval: int = CHECKPOINT_INTERVAL
+
+    def __init__(self, checkpoint_interval: int | None = None):
         self._transactions: list[Transaction] = []
+        # _levels[0] holds the chain hashes; _levels[k] the complete subtrees of 2**k leaves
+        self._levels: list[bytearray] = [bytearray()]
+        self._checkpoints: list[Checkpoint] = []
+        if checkpoint_interval is not None:
+            if checkpoint_interval < 1:
+                raise ValueError("checkpoint_interval must be positive")
+            self._checkpoint_interval = checkpoint_interval
+
+
+    @classmethod
+    def _restore(cls, transactions: list[Transaction], chain: bytes) -> 'AuditLog':
+        # Rebuilds a log from stored entries and their chain hashes (snapshot restore); verify() rechecks them
+        log: AuditLog = cls()
+        log._transactions = transactions
+        for offset in range(0, len(chain), HASH_SIZE):
+            log._append_leaf(chain[offset:offset + HASH_SIZE])
+        return log
+
 
     def log_transaction(self, transaction: Transaction) -> None:
 
-        assert isinstance(transaction, Transaction), "Invalid object logged in AuditLog"
+        if not isinstance(transaction, Transaction):
+            # Only transactions can be hashed into the chain: outside "raise" mode the entry is dropped
+            invariants.check(False, "audit_log_entry_type", "Invalid object logged in AuditLog")
+            return
 
+        leaves: bytearray = self._levels[0]
+        previous: bytes = leaves[-HASH_SIZE:] if leaves else GENESIS
         self._transactions.append(transaction)
+        self._append_leaf(chain_hash(previous, transaction))
+
+
+    def _append_leaf(self, leaf: bytes) -> None:
+        levels: list[bytearray] = self._levels
+        levels[0] += leaf
+        size: int = len(levels[0]) // HASH_SIZE
+
+        # Fold completed pairs upwards (amortized one extra hash per entry)
+        index, level, node = size - 1, 0, leaf
+        while index & 1:
+            node = _node_hash(levels[level][(index - 1) * HASH_SIZE:index * HASH_SIZE], node)
+            index >>= 1
+            level += 1
+            if level == len(levels):
+                levels.append(bytearray())
+            levels[level] += node
+
+        if size % self._checkpoint_interval == 0:
+            self._checkpoints.append(Checkpoint(size, self.root(size), self._transactions[size - 1].timestamp))
+
+
+    def _node(self, level: int, index: int) -> bytes:
+        return bytes(self._levels[level][index * HASH_SIZE:(index + 1) * HASH_SIZE])
+
+
+    def _subtree(self, start: int, size: int) -> bytes:
+        # Aligned power-of-two subtrees are stored; anything else splits RFC 6962 style
+        if size & (size - 1) == 0:
+            level: int = size.bit_length() - 1
+            return self._node(level, start >> level)
+
+        k: int = _split(size)
+        return _node_hash(self._subtree(start, k), self._subtree(start + k, size - k))
+
+
+    def root(self, size: int | None = None) -> bytes:
+        """Merkle root over the first `size` entries (default: all)."""
+        size = len(self) if size is None else size
+        if not 0 <= size <= len(self):
+            raise ValueError(f"Size {size} out of range")
+
+        return self._subtree(0, size) if size else _sha256(b"").digest()
+
+
+    def prove(self, index: int, size: int | None = None) -> InclusionProof:
+        """Audit path for entry `index` in the tree of the first `size` entries (default: all)."""
+        size = len(self) if size is None else size
+        if not 0 <= index < size <= len(self):
+            raise ValueError(f"Entry {index} is not within the first {size} entries")
+
+        path: list[bytes] = []
+        start, width, offset = 0, size, index
+        while width > 1:
+            k: int = _split(width)
+            if offset < k:
+                path.append(self._subtree(start + k, width - k))
+                width = k
+            else:
+                path.append(self._subtree(start, k))
+                start, width, offset = start + k, width - k, offset - k
+        path.reverse()
+
+        previous: bytes = self._node(0, index - 1) if index else GENESIS
+        return InclusionProof(index, size, previous, path)
+
+
+    def verify(self, start: int = 0, end: int | None = None, checkpoint: Checkpoint | None = None) -> bool:
+        """
+        Rehashes entries [start, end) and checks them against the stored chain
+        and against `checkpoint` (default: the latest one covering `end`, or
+        the current root). Cost is O(end - start + log n), not O(n).
+        """
+        end = len(self) if end is None else end
+        if not 0 <= start <= end <= len(self):
+            raise ValueError(f"Invalid range [{start}, {end})")
+
+        if checkpoint is None:
+            latest: Checkpoint | None = self._checkpoints[-1] if self._checkpoints else None
+            checkpoint = latest if latest is not None and latest.size >= end else Checkpoint(len(self), self.root(), datetime.now())
+
+        if end > checkpoint.size:
+            raise ValueError(f"Checkpoint covers {checkpoint.size} entries, range ends at {end}")
+
+        transactions: list[Transaction] = self._transactions
+        previous: bytes = self._node(0, start - 1) if start else GENESIS
+        recomputed: list[bytes] = []
+        for index in range(start, end):
+            previous = chain_hash(previous, transactions[index])
+            if previous != self._node(0, index):
+                return False
+            recomputed.append(previous)
+
+        return self._recompute(0, checkpoint.size, start, recomputed) == checkpoint.root
+
+
+    def _recompute(self, start: int, size: int, first: int, leaves: list[bytes]) -> bytes:
+        # Subtree hash using freshly computed leaves for [first, first + len(leaves)) and stored nodes elsewhere
+        if size == 0:
+            return _sha256(b"").digest()
+
+        if start + size <= first or start >= first + len(leaves):
+            return self._subtree(start, size)
+
+        if size == 1:
+            return leaves[start - first]
+
+        k: int = _split(size)
+        return _node_hash(self._recompute(start, k, first, leaves), self._recompute(start + k, size - k, first, leaves))
+
+
+    def verify_between(self, since: datetime, until: datetime, checkpoint: Checkpoint | None = None) -> bool:
+        """verify() over the entries timestamped in [since, until]."""
+        start, end = self.index_range(since, until)
+        return self.verify(start, end, checkpoint)
+
+
+    def index_range(self, since: datetime, until: datetime) -> tuple[int, int]:
+        # Entries are appended in time order, so the log bisects by timestamp in place
+        transactions: list[Transaction] = self._transactions
+        return bisect_left(transactions, since, key=_BY_TIMESTAMP), bisect_right(transactions, until, key=_BY_TIMESTAMP)
+
+
+    def slice(self, start: int, stop: int) -> list[Transaction]:
+        # Entries [start, stop) without copying the rest of the log
+        return self._transactions[start:stop]
+
+
+    def __len__(self) -> int:
+        return len(self._transactions)
 
 
     # =======================
@@ -19,4 +262,47 @@ class AuditLog:
     @property
     def transactions(self) -> list[Transaction]:
         return self._transactions[:]
-    
+
+    @property
+    def checkpoints(self) -> list[Checkpoint]:
+        return self._checkpoints[:]
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        return self._transactions[-1].timestamp if self._transactions else None
+
+    @property
+    def head(self) -> bytes:
+        # Chain hash of the latest entry
+        return self._node(0, len(self) - 1) if len(self) else GENESIS
+
+    @property
+    def chain(self) -> bytes:
+        # Every chain hash, HASH_SIZE bytes each (what snapshots store)
+        return bytes(self._levels[0])
+
+
+def verify_inclusion(transaction: Transaction, proof: InclusionProof, root: bytes) -> bool:
+    """Checks an InclusionProof against a trusted root in O(log n) hashes (RFC 9162 section 2.1.3.2)."""
+    if not 0 <= proof.index < proof.size:
+        return False
+
+    node: bytes = chain_hash(proof.previous, transaction)
+    fn, sn = proof.index, proof.size - 1
+    for sibling in proof.path:
+        if sn == 0:
+            return False
+
+        if fn & 1 or fn == sn:
+            node = _node_hash(sibling, node)
+            if not fn & 1:
+                while fn and not fn & 1:
+                    fn >>= 1
+                    sn >>= 1
+        else:
+            node = _node_hash(node, sibling)
+
+        fn >>= 1
+        sn >>= 1
+
+    return sn == 0 and node == root
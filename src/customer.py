@@ -1,4 +1,5 @@
 from .account import Account
+from . import invariants
 
 
 class Customer:
@@ -8,12 +9,14 @@ class Customer:
         self._last_name: str = last_name
         self._email: str = email
         self._accounts: list[Account] = []
+        # Set once an AccountArchive compacts one of this customer's accounts (see lifecycle.py)
+        self._archive: 'AccountArchive | None' = None
 
     def open_account(self, account: Account) -> None:
 
         account.assign_customer(self.customer_ID)
 
-        assert account.customer_ID == self.customer_ID, "Account assignment failed"
+        invariants.check(account.customer_ID == self.customer_ID, "account_assignment", "Account assignment failed")
         
         self._accounts.append(account)
 
@@ -22,7 +25,15 @@ class Customer:
         for account in self._accounts:
             if account.account_ID == account_ID:
                 return account
-        
+
+        if self._archive is not None:
+            # Compacted accounts are rehydrated on demand and become hot again
+            summary = self._archive.summary(account_ID)
+            if summary is not None and summary.customer_ID == self._customer_ID:
+                account = self._archive.rehydrate(account_ID)
+                self._accounts.append(account)
+                return account
+
         return None
     
 
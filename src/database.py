@@ -1,15 +1,31 @@
 import os
-import mysql.connector
-from mysql.connector import Error
-from dotenv import load_dotenv
 
-load_dotenv()
+_env_loaded = False
+
+
+def _load_env():
+    """
+    Reads .env on first use instead of at import time, so code that never
+    touches the database never pays for dotenv.
+    """
+    global _env_loaded
+
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
 
 def get_db_connection():
     """
     Establishes and returns a connection to the MySQL database.
     Returns the connection object if successful, None otherwise. 
     """
+    # The driver is imported on first connection, not when the module loads
+    import mysql.connector
+    from mysql.connector import Error
+
+    _load_env()
 
     try:
         connection = mysql.connector.connect(
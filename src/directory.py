@@ -0,0 +1,237 @@
+"""
+In-memory customer directory.
+
+- ID and email lookups are dict hits; add() rejects a duplicate ID or email
+  (emails compare case-insensitively) in O(1), mirroring the UNIQUE
+  constraint on Customers.email.
+- Name search works on tokens (first and last name words, casefolded). Each
+  distinct token maps to an array of customer IDs, so a common surname costs
+  8 bytes per customer rather than one string per customer.
+  - search_prefix() bisects a sorted list of distinct tokens, re-sorted
+    lazily only after new tokens were added.
+  - search() finds tokens containing each query word through a trigram
+    index over the distinct tokens.
+  A multi-word query matches customers that have a token for every word;
+  their ID sets are intersected starting from the most selective word.
+- remove() leaves the customer's IDs in their posting arrays as tombstones
+  (searches skip IDs no longer in the directory) and counts them per token.
+  A token's array is compacted once half of it is dead, so removal costs
+  amortized O(1) per token instead of a scan of a common surname's array.
+"""
+from array import array
+from bisect import bisect_left
+from itertools import chain
+from typing import Callable, Iterator
+
+from .customer import Customer
+
+# Checking one customer's name costs about as much as scanning this many posting entries
+_VERIFY_COST: int = 50
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def _name_tokens(customer: Customer) -> set[str]:
+    return set(f"{customer.first_name} {customer.last_name}".casefold().split())
+
+
+def _trigrams(token: str) -> set[str]:
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+class CustomerDirectory:
+    def __init__(self):
+        self._by_id: dict[int, Customer] = {}
+        self._by_email: dict[str, Customer] = {}
+        # token -> IDs of customers with that token
+        self._postings: dict[str, array] = {}
+        # trigram -> tokens containing it
+        self._trigram_index: dict[str, set[str]] = {}
+        self._sorted_tokens: list[str] | None = []
+        # token -> tombstoned IDs still in its postings
+        self._dead: dict[str, int] = {}
+        # removed ID -> tokens whose postings still hold it
+        self._tombstones: dict[int, set[str]] = {}
+
+
+    def add(self, customer: Customer) -> None:
+        if customer.customer_ID in self._by_id:
+            raise ValueError(f"Customer ID {customer.customer_ID} is already taken")
+
+        email: str = normalize_email(customer.email)
+        if email in self._by_email:
+            raise ValueError(f"Email {customer.email} is already registered")
+
+        # A re-used ID must not revive its old tombstones
+        for token in self._tombstones.get(customer.customer_ID, set()).copy():
+            self._compact(token)
+
+        self._by_id[customer.customer_ID] = customer
+        self._by_email[email] = customer
+
+        for token in _name_tokens(customer):
+            ids: array | None = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = array("q")
+                for trigram in _trigrams(token):
+                    self._trigram_index.setdefault(trigram, set()).add(token)
+                self._sorted_tokens = None
+            ids.append(customer.customer_ID)
+
+
+    def remove(self, customer_ID: int) -> Customer:
+        customer: Customer | None = self._by_id.pop(customer_ID, None)
+        if customer is None:
+            raise ValueError(f"Customer {customer_ID} not found")
+
+        del self._by_email[normalize_email(customer.email)]
+
+        tokens: set[str] = _name_tokens(customer)
+        self._tombstones[customer_ID] = set(tokens)
+        for token in tokens:
+            dead: int = self._dead.get(token, 0) + 1
+            self._dead[token] = dead
+            if dead * 2 >= len(self._postings[token]):
+                self._compact(token)
+
+        return customer
+
+
+    def _compact(self, token: str) -> None:
+        """Drop the tombstones from one token's postings, and the token itself once no live ID is left."""
+        by_id: dict[int, Customer] = self._by_id
+        ids: array = self._postings[token]
+        for customer_ID in ids:
+            if customer_ID not in by_id:
+                tokens: set[str] = self._tombstones[customer_ID]
+                tokens.discard(token)
+                if not tokens:
+                    del self._tombstones[customer_ID]
+        self._dead.pop(token, None)
+
+        live: array = array("q", (customer_ID for customer_ID in ids if customer_ID in by_id))
+        if live:
+            self._postings[token] = live
+            return
+
+        del self._postings[token]
+        for trigram in _trigrams(token):
+            containing: set[str] = self._trigram_index[trigram]
+            containing.discard(token)
+            if not containing:
+                del self._trigram_index[trigram]
+        self._sorted_tokens = None
+
+
+    def get(self, customer_ID: int) -> Customer | None:
+        return self._by_id.get(customer_ID)
+
+
+    def find_by_email(self, email: str) -> Customer | None:
+        return self._by_email.get(normalize_email(email))
+
+
+    def email_taken(self, email: str) -> bool:
+        return normalize_email(email) in self._by_email
+
+
+    def search_prefix(self, query: str, limit: int = 20) -> list[Customer]:
+        """Customers with a name token starting with each word of `query` ("jo sm" finds John Smith)."""
+        return self._search(query, self._tokens_with_prefix, limit)
+
+
+    def search(self, query: str, limit: int = 20) -> list[Customer]:
+        """Customers with a name token containing each word of `query` ("mit" finds Smith)."""
+        return self._search(query, self._tokens_containing, limit)
+
+
+    def _search(self, query: str, tokens_for: Callable[[str], list[str]], limit: int) -> list[Customer]:
+        words: list[str] = query.casefold().split()
+        if not words or limit <= 0:
+            return []
+
+        postings: dict[str, array] = self._postings
+        by_id: dict[int, Customer] = self._by_id
+        matches: list[tuple[int, list[str]]] = sorted(
+            (sum(map(len, map(postings.__getitem__, tokens))), tokens) for tokens in map(tokens_for, words))
+
+        if len(matches) == 1:
+            # Single word: stream its postings and stop at the limit
+            results: list[Customer] = []
+            seen: set[int] = set()
+            for token in matches[0][1]:
+                for customer_ID in postings[token]:
+                    if customer_ID not in seen and customer_ID in by_id:
+                        seen.add(customer_ID)
+                        results.append(by_id[customer_ID])
+                        if len(results) == limit:
+                            return results
+            return results
+
+        # Several words: start from the most selective word's IDs and narrow down
+        candidates: set[int] = set(chain.from_iterable(postings[token] for token in matches[0][1]))
+        candidates.intersection_update(by_id)
+        for size, tokens in matches[1:]:
+            if not candidates:
+                break
+
+            if len(candidates) * _VERIFY_COST < size:
+                # Cheaper to check each remaining candidate's own name than to scan a common word's postings
+                wanted: set[str] = set(tokens)
+                candidates = {customer_ID for customer_ID in candidates
+                              if _name_tokens(by_id[customer_ID]) & wanted}
+            else:
+                candidates = candidates.intersection(chain.from_iterable(postings[token] for token in tokens))
+
+        return [by_id[customer_ID] for customer_ID in sorted(candidates)[:limit]]
+
+
+    def _tokens_with_prefix(self, prefix: str) -> list[str]:
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+
+        tokens: list[str] = self._sorted_tokens
+        matched: list[str] = []
+        for index in range(bisect_left(tokens, prefix), len(tokens)):
+            if not tokens[index].startswith(prefix):
+                break
+            matched.append(tokens[index])
+
+        return matched
+
+
+    def _tokens_containing(self, word: str) -> list[str]:
+        if len(word) < 3:
+            # Too short for a trigram: scan the distinct tokens (far fewer than customers)
+            return [token for token in self._postings if word in token]
+
+        candidates: set[str] | None = None
+        for trigram in sorted(_trigrams(word), key=lambda trigram: len(self._trigram_index.get(trigram, ()))):
+            tokens: set[str] | None = self._trigram_index.get(trigram)
+            if not tokens:
+                return []
+            candidates = set(tokens) if candidates is None else candidates & tokens
+
+        # Trigrams can match out of order; confirm the substring
+        return [token for token in candidates if word in token]
+
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, customer_ID: int) -> bool:
+        return customer_ID in self._by_id
+
+    def __iter__(self) -> Iterator[Customer]:
+        return iter(self._by_id.values())
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def token_count(self) -> int:
+        return len(self._postings)
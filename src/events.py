@@ -0,0 +1,274 @@
+import threading
+from collections import deque
+from collections.abc import Callable
+
+from .transaction import Transaction
+
+
+class PostingEvent:
+    """A single balance change, published after it has been logged."""
+    __slots__ = ("_account_ID", "_customer_ID", "_transaction", "_balance")
+
+    def __init__(self, account_ID: int, customer_ID: int | None, transaction: Transaction, balance: float):
+        self._account_ID: int = account_ID
+        self._customer_ID: int | None = customer_ID
+        self._transaction: Transaction = transaction
+        self._balance: float = balance
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def account_ID(self) -> int:
+        return self._account_ID
+
+    @property
+    def customer_ID(self) -> int | None:
+        return self._customer_ID
+
+    @property
+    def transaction(self) -> Transaction:
+        return self._transaction
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    def __repr__(self) -> str:
+        return f"PostingEvent(account={self._account_ID}, tx={self._transaction!r}, balance={self._balance})"
+
+
+class Subscription:
+    """
+    Bounded per-subscriber queue.
+    Publishing only appends to the queue; the handler runs later in batches,
+    either when drained manually, on a background thread or on an asyncio loop.
+
+    Overflow policies:
+    - "drop_oldest": evict the oldest queued event (default, never blocks).
+    - "drop_newest": discard the incoming event (never blocks).
+    - "block": wait up to block_timeout seconds for room (backpressure). The
+      wait happens inside the posting, so EventBus only allows it with
+      delivery="thread", where a dedicated thread is always draining. A
+      Subscription with no delivery thread drops the incoming event instead.
+    """
+    POLICIES = ("drop_oldest", "drop_newest", "block")
+
+    def __init__(self, handler: Callable[[list[PostingEvent]], None], max_queue: int = 10_000,
+                 batch_size: int = 100, overflow: str = "drop_oldest", block_timeout: float = 0.1):
+
+        if max_queue <= 0 or batch_size <= 0:
+            raise ValueError("Queue size and batch size must be positive")
+
+        if overflow not in self.POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        self._handler = handler
+        self._max_queue: int = max_queue
+        self._batch_size: int = batch_size
+        self._overflow: str = overflow
+        self._block_timeout: float = block_timeout
+        self._queue: deque[PostingEvent] = deque()
+        self._ready: threading.Condition = threading.Condition()
+        self._wakeup: Callable[[], None] | None = None
+        # Guards the counters; publishers and the delivery thread both update them
+        self._stats_lock: threading.Lock = threading.Lock()
+        self._dropped: int = 0
+        self._delivered: int = 0
+        self._errors: int = 0
+
+
+    def offer(self, event: PostingEvent) -> bool:
+        queue = self._queue
+        if len(queue) >= self._max_queue:
+            if self._overflow == "drop_newest":
+                self._count_drop()
+                return False
+
+            if self._overflow == "drop_oldest":
+                try:
+                    queue.popleft()
+                    self._count_drop()
+                except IndexError:
+                    # The delivery thread emptied the queue after the length check: there is room now
+                    pass
+
+            elif self._wakeup is None or not self._wait_for_room():
+                self._count_drop()
+                return False
+
+        queue.append(event)
+
+        if self._wakeup is not None and len(queue) == 1:
+            self._wakeup()
+
+        return True
+
+
+    def _count_drop(self) -> None:
+        with self._stats_lock:
+            self._dropped += 1
+
+
+    def _wait_for_room(self) -> bool:
+        # Nudge the delivery thread in case it is idle between polls
+        self._wakeup()
+        with self._ready:
+            return self._ready.wait_for(lambda: len(self._queue) < self._max_queue, self._block_timeout)
+
+
+    def drain(self, max_batches: int | None = None) -> int:
+        """Delivers queued events to the handler in batches. Returns the number delivered."""
+        delivered: int = 0
+        batches: int = 0
+        queue = self._queue
+
+        while queue and (max_batches is None or batches < max_batches):
+            batch: list[PostingEvent] = []
+            try:
+                while len(batch) < self._batch_size:
+                    batch.append(queue.popleft())
+            except IndexError:
+                # Queue emptied (possibly by a concurrent drain)
+                if not batch:
+                    break
+
+            if self._overflow == "block":
+                with self._ready:
+                    self._ready.notify_all()
+
+            try:
+                self._handler(batch)
+            except Exception:
+                # A failing subscriber must not break delivery to the others
+                with self._stats_lock:
+                    self._errors += 1
+
+            delivered += len(batch)
+            batches += 1
+
+        with self._stats_lock:
+            self._delivered += delivered
+        return delivered
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def delivered(self) -> int:
+        return self._delivered
+
+    @property
+    def errors(self) -> int:
+        return self._errors
+
+
+class EventBus:
+    def __init__(self):
+        self._subscriptions: tuple[Subscription, ...] = ()
+        self._threads: dict[Subscription, tuple[threading.Thread, threading.Event, threading.Event]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+
+    def subscribe(self, handler: Callable[[list[PostingEvent]], None], delivery: str = "manual",
+                  loop=None, **options) -> Subscription:
+        """
+        Registers a batch handler.
+        - delivery="manual": events are delivered when drain() is called.
+        - delivery="thread": a daemon thread drains the queue as events arrive.
+        - delivery="asyncio": batches are drained on the given event loop.
+        asyncio itself is never imported here; it costs tens of milliseconds at start-up.
+        """
+        if options.get("overflow") == "block" and delivery != "thread":
+            # Nobody else drains a manual or asyncio queue while a posting waits, so every posting would stall
+            raise ValueError("The 'block' overflow policy needs delivery='thread'")
+
+        subscription: Subscription = Subscription(handler, **options)
+
+        if delivery == "thread":
+            self._start_thread(subscription)
+        elif delivery == "asyncio":
+            if loop is None:
+                raise ValueError("An event loop is required for asyncio delivery")
+            subscription._wakeup = lambda: loop.call_soon_threadsafe(subscription.drain)
+        elif delivery != "manual":
+            raise ValueError(f"Unknown delivery mode: {delivery}")
+
+        with self._lock:
+            # Copy-on-write so publish() can iterate without locking
+            self._subscriptions = self._subscriptions + (subscription,)
+
+        return subscription
+
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions = tuple(sub for sub in self._subscriptions if sub is not subscription)
+
+        self._stop_thread(subscription)
+
+
+    def publish(self, event: PostingEvent) -> None:
+        # Hot path: one deque append per subscriber, handlers never run here
+        for subscription in self._subscriptions:
+            subscription.offer(event)
+
+
+    def drain(self) -> int:
+        return sum(subscription.drain() for subscription in self._subscriptions)
+
+
+    def close(self) -> None:
+        for subscription in self._subscriptions:
+            self.unsubscribe(subscription)
+
+
+    def _start_thread(self, subscription: Subscription) -> None:
+        wake: threading.Event = threading.Event()
+        stop: threading.Event = threading.Event()
+
+        def run() -> None:
+            while not stop.is_set():
+                wake.wait(0.05)
+                wake.clear()
+                subscription.drain()
+
+            # Flush whatever arrived before the stop request
+            subscription.drain()
+
+        subscription._wakeup = wake.set
+        thread: threading.Thread = threading.Thread(target=run, name="posting-subscriber", daemon=True)
+        self._threads[subscription] = (thread, stop, wake)
+        thread.start()
+
+
+    def _stop_thread(self, subscription: Subscription) -> None:
+        entry = self._threads.pop(subscription, None)
+        if entry is None:
+            return
+
+        thread, stop, wake = entry
+        stop.set()
+        wake.set()
+        thread.join()
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def subscriptions(self) -> list[Subscription]:
+        return list(self._subscriptions)
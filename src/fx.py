@@ -0,0 +1,181 @@
+"""
+Foreign exchange rates for cross-currency transfers.
+
+Rates are loaded once from a local CSV file (base,quote,rate per line) into
+a dict keyed by (base, quote), with the inverse of every pair precomputed,
+so a conversion is one dict lookup. One table is meant to be shared by every
+transfer in a batch; convert_batch() and transfer_batch() convert a whole
+batch of amounts at once (vectorized with NumPy when it is installed).
+"""
+import math
+from typing import Iterable, Sequence
+
+from . import _optional
+
+DEFAULT_CURRENCY: str = "USD"
+
+
+def currency_code(code: str) -> str:
+    """Normalizes an ISO 4217 style code ('eur' -> 'EUR')."""
+    normalized: str = code.strip().upper()
+    if len(normalized) != 3 or not normalized.isalpha():
+        raise ValueError(f"Invalid currency code '{code}'")
+
+    return normalized
+
+
+class FxRateTable:
+    def __init__(self, rates: Iterable[tuple[str, str, float]] = ()):
+        self._rates: dict[tuple[str, str], float] = {}
+        for base, quote, rate in rates:
+            self.set_rate(base, quote, rate)
+
+
+    @classmethod
+    def load(cls, path: str) -> 'FxRateTable':
+        """
+        Reads `base,quote,rate` rows. Blank lines, '#' comments and a
+        `base,quote,rate` header row are skipped.
+        """
+        # Imported here so importing accounts does not pull in csv
+        import csv
+
+        table: FxRateTable = cls()
+        with open(path, newline="") as file:
+            for line_number, row in enumerate(csv.reader(file), start=1):
+                if not row or row[0].lstrip().startswith("#") or row[0].strip().lower() == "base":
+                    continue
+
+                if len(row) != 3:
+                    raise ValueError(f"{path}:{line_number}: expected base,quote,rate")
+
+                try:
+                    rate: float = float(row[2])
+                except ValueError:
+                    rate = math.nan
+                if not math.isfinite(rate):
+                    raise ValueError(f"{path}:{line_number}: invalid rate '{row[2].strip()}'")
+
+                table.set_rate(row[0], row[1], rate)
+
+        return table
+
+
+    def set_rate(self, base: str, quote: str, rate: float) -> None:
+        # 1 unit of base = rate units of quote; the inverse is stored too
+        base, quote = currency_code(base), currency_code(quote)
+        if base == quote:
+            raise ValueError("Base and quote currency must differ")
+
+        # NaN and inf fail too: either would reach balances through convert()
+        if not (math.isfinite(rate) and rate > 0):
+            raise ValueError("FX rate must be positive")
+
+        self._rates[(base, quote)] = rate
+        self._rates[(quote, base)] = 1 / rate
+
+
+    def rate(self, base: str, quote: str) -> float:
+        if base == quote:
+            return 1.0
+
+        rate: float | None = self._rates.get((base, quote))
+        if rate is None:
+            raise ValueError(f"No FX rate for {base}/{quote}")
+
+        return rate
+
+
+    def convert(self, amount: float, base: str, quote: str) -> float:
+        """Converts to `quote`, rounded to cents. Raises if nothing would arrive."""
+        converted: float = round(amount * self.rate(base, quote), 2)
+        if converted <= 0:
+            raise ValueError("Converted amount is too small")
+
+        return converted
+
+
+    def convert_batch(self, amounts: Sequence[float], pairs: Sequence[tuple[str, str]]) -> list[float]:
+        """
+        Converts amounts[i] along pairs[i] = (base, quote) in one pass.
+        Rates are gathered with one lookup per distinct pair; the multiply
+        runs vectorized when NumPy is available.
+        """
+        if len(amounts) != len(pairs):
+            raise ValueError("amounts and pairs must have the same length")
+
+        cache: dict[tuple[str, str], float] = {}
+        rates: list[float] = []
+        for pair in pairs:
+            rate: float | None = cache.get(pair)
+            if rate is None:
+                rate = cache[pair] = self.rate(*pair)
+            rates.append(rate)
+
+        np = _optional.numpy()
+        if np is not None:
+            products: list[float] = (np.asarray(amounts, dtype=float) * np.asarray(rates)).tolist()
+        else:
+            products = [amount * rate for amount, rate in zip(amounts, rates)]
+
+        # Same IEEE multiply as convert(); rounding stays in Python so both paths agree to the cent
+        converted: list[float] = [round(value, 2) for value in products]
+
+        if any(value <= 0 for value in converted):
+            raise ValueError("Converted amount is too small")
+
+        return converted
+
+
+    def __contains__(self, pair: tuple[str, str]) -> bool:
+        return pair[0] == pair[1] or pair in self._rates
+
+    def __len__(self) -> int:
+        return len(self._rates)
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def currencies(self) -> set[str]:
+        return {base for base, _ in self._rates}
+
+
+def transfer_batch(transfers: Sequence[tuple['Account', 'Account', float]], rates: FxRateTable) -> list[str | None]:
+    """
+    Runs (source, destination, amount) transfers in order, converting every
+    cross-currency amount up front with a single convert_batch() call.
+    Returns one entry per transfer: None on success, else the error message.
+    """
+    cross: list[int] = [index for index, (source, destination, _) in enumerate(transfers)
+                        if source.currency != destination.currency]
+    converted: dict[int, float] = {}
+
+    if cross:
+        pairs: list[tuple[str, str]] = []
+        amounts: list[float] = []
+        for index in cross:
+            source, destination, amount = transfers[index]
+            pairs.append((source.currency, destination.currency))
+            amounts.append(amount)
+
+        # Rounding can zero out a tiny amount; fall back to per-transfer conversion so only it fails
+        try:
+            converted = dict(zip(cross, rates.convert_batch(amounts, pairs)))
+        except ValueError:
+            converted = {}
+
+    results: list[str | None] = []
+    for index, (source, destination, amount) in enumerate(transfers):
+        try:
+            if index in converted:
+                source._transfer_converted(destination, amount, converted[index])
+            else:
+                source.transfer(destination, amount, rates)
+            results.append(None)
+        except ValueError as e:
+            results.append(str(e))
+
+    return results
@@ -0,0 +1,45 @@
+"""
+Engine invariant checks.
+
+These replace bare `assert` statements so the checks survive `python -O`
+and can be tuned in production:
+- "raise" (default): count the violation and raise AssertionError.
+- "count": count the violation and carry on.
+- "off":   skip counting entirely.
+"""
+
+MODES: tuple[str, ...] = ("raise", "count", "off")
+
+_mode: str = "raise"
+_violations: dict[str, int] = {}
+
+
+def check(condition: bool, name: str, message: str) -> None:
+    if condition or _mode == "off":
+        return
+
+    _violations[name] = _violations.get(name, 0) + 1
+
+    if _mode == "raise":
+        raise AssertionError(message)
+
+
+def set_mode(mode: str) -> None:
+    global _mode
+
+    if mode not in MODES:
+        raise ValueError(f"Unknown invariant mode: {mode}")
+
+    _mode = mode
+
+
+def get_mode() -> str:
+    return _mode
+
+
+def violations() -> dict[str, int]:
+    return dict(_violations)
+
+
+def reset() -> None:
+    _violations.clear()
@@ -0,0 +1,287 @@
+"""
+Dormancy policy and archive for accounts that no longer need to be in memory.
+
+- DormancyPolicy marks accounts DORMANT after a period without customer
+  activity (interest and fees posted by the bank do not count).
+- AccountArchive compacts dormant or closed accounts: the full history is
+  packed into fixed struct rows and zlib-compressed (in memory, or one
+  file per account with `directory`), and only a small ArchivedAccount
+  summary stays in memory. Each blob's HMAC-SHA256 is checked before
+  anything in it is decoded; the key is random for in-memory archives and
+  must be given for directory-backed ones.
+  The summary is a balance checkpoint: balance, status, posted month-end
+  periods, transaction count and the audit chain head.
+- Compacted accounts leave Customer.accounts (and so every index built from
+  it); Customer.get_account() rehydrates them on demand. Rehydration
+  rehashes the history and checks it against the checkpoint's chain head.
+- Snapshots still include archived accounts: write_snapshot loads a
+  verified copy of each one through accounts_of() (the archive keeps it).
+
+Only plain SavingsAccount and CheckingAccount are archived; striped
+accounts are hot by design.
+"""
+import hashlib
+import hmac
+import os
+import struct
+import zlib
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from .account import Account, AccountStatus, SavingsAccount, CheckingAccount
+from .customer import Customer
+from .product import ProductCatalog, DEFAULT_CATALOG
+from .transaction import Transaction, TransactionType
+
+ARCHIVABLE_TYPES: tuple[type, ...] = (SavingsAccount, CheckingAccount)
+# Postings the bank makes on its own; they do not keep an account active
+BANK_INITIATED: frozenset[TransactionType] = frozenset({TransactionType.INTEREST_APPLIED, TransactionType.EXTRA_FEE,
+                                                        TransactionType.MAINTENANCE_FEE})
+
+_TRANSACTION_TYPES: tuple[TransactionType, ...] = tuple(TransactionType)
+_TYPE_INDEX: dict[TransactionType, int] = {transaction_type: index for index, transaction_type in enumerate(_TRANSACTION_TYPES)}
+# type, amount, timestamp (microseconds since 1970-01-01), other-leg amount, other-leg currency length (0 = none)
+_ROW: struct.Struct = struct.Struct("<BdqdB")
+_EPOCH: datetime = datetime(1970, 1, 1)
+_MICROSECOND: timedelta = timedelta(microseconds=1)
+
+
+def last_activity(account: Account) -> datetime | None:
+    """Timestamp of the latest customer posting (None if there is none)."""
+    for transaction in reversed(account._audit_log._transactions):
+        if transaction.transaction_type not in BANK_INITIATED:
+            return transaction.timestamp
+
+    return None
+
+
+class DormancyPolicy:
+    def __init__(self, inactive_for: timedelta = timedelta(days=365)):
+        if inactive_for <= timedelta(0):
+            raise ValueError("inactive_for must be positive")
+
+        self._inactive_for: timedelta = inactive_for
+
+
+    def is_dormant(self, account: Account, now: datetime | None = None) -> bool:
+        # Accounts that never had a customer posting are left alone
+        latest: datetime | None = last_activity(account)
+        return latest is not None and (now or datetime.now()) - latest >= self._inactive_for
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def inactive_for(self) -> timedelta:
+        return self._inactive_for
+
+
+class ArchivedAccount:
+    __slots__ = ("account_ID", "customer_ID", "account_type", "product_code", "currency", "status",
+                 "balance", "version", "synced", "posted_periods", "transaction_count", "last_activity", "head", "digest",
+                 "archived_at")
+
+    def __init__(self, account: Account, digest: bytes):
+        self.account_ID: int = account.account_ID
+        self.customer_ID: int | None = account.customer_ID
+        self.account_type: type = type(account)
+        self.product_code: str = account.product.code
+        self.currency: str = account.currency
+        self.status: AccountStatus = account.status
+        self.balance: float = account.balance
+        self.version: int = account.version
+        # History entries already written to the database, so the repository does not insert them again
+        self.synced: int = account._synced
+        # Month-end periods already posted, so a rehydrated account is not posted twice
+        self.posted_periods: dict[str, str] | None = dict(account._posted_periods) if account._posted_periods else None
+        self.transaction_count: int = account.transaction_count
+        self.last_activity: datetime | None = last_activity(account)
+        self.head: bytes = account._audit_log.head
+        # HMAC of the stored blob
+        self.digest: bytes = digest
+        self.archived_at: datetime = datetime.now()
+
+    def __repr__(self) -> str:
+        return (f"ArchivedAccount(id={self.account_ID}, {self.status.value}, balance={self.balance}, "
+                f"transactions={self.transaction_count})")
+
+
+class AccountArchive:
+    def __init__(self, directory: str | None = None, catalog: ProductCatalog = DEFAULT_CATALOG, key: bytes | None = None):
+        if directory is not None and key is None:
+            # A random key would make the files unreadable to the next process
+            raise ValueError("A directory-backed archive needs a key")
+
+        self._directory: str | None = directory
+        # Blob digests are keyed, so a blob written into the directory by anyone else is refused
+        self._key: bytes = key if key is not None else os.urandom(32)
+        self._catalog: ProductCatalog = catalog
+        self._summaries: dict[int, ArchivedAccount] = {}
+        # customer ID -> archived account IDs, in archive order
+        self._by_customer: dict[int | None, list[int]] = {}
+        # account ID -> compressed history (in-memory archives only)
+        self._blobs: dict[int, bytes] = {}
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+
+    def compact(self, account: Account, customer: Customer | None = None) -> ArchivedAccount:
+        """Archives a dormant or closed account and drops it from `customer`'s accounts."""
+        if type(account) not in ARCHIVABLE_TYPES:
+            raise ValueError(f"Cannot archive account type {type(account).__name__}")
+
+        if account.status is AccountStatus.ACTIVE:
+            raise ValueError("Only dormant or closed accounts can be archived")
+
+        if account.account_ID in self._summaries:
+            raise ValueError(f"Account {account.account_ID} is already archived")
+
+        if customer is not None and account.customer_ID != customer.customer_ID:
+            raise ValueError(f"Account {account.account_ID} does not belong to customer {customer.customer_ID}")
+
+        blob: bytes = zlib.compress(_pack(account._audit_log._transactions))
+        summary: ArchivedAccount = ArchivedAccount(account, self._digest(blob))
+
+        if self._directory is None:
+            self._blobs[account.account_ID] = blob
+        else:
+            with open(self._path(account.account_ID), "wb") as file:
+                file.write(blob)
+        self._summaries[account.account_ID] = summary
+        self._by_customer.setdefault(summary.customer_ID, []).append(account.account_ID)
+
+        if customer is not None:
+            customer._accounts.remove(account)
+            customer._archive = self
+
+        return summary
+
+
+    def sweep(self, customers: Iterable[Customer], policy: DormancyPolicy, now: datetime | None = None) -> int:
+        """
+        Marks inactive accounts dormant and compacts every dormant or closed
+        account. Returns how many accounts were archived.
+        """
+        now = now or datetime.now()
+        archived: int = 0
+        for customer in customers:
+            for account in customer.accounts:
+                if type(account) not in ARCHIVABLE_TYPES:
+                    continue
+
+                if account.status is AccountStatus.ACTIVE and policy.is_dormant(account, now):
+                    account.mark_dormant()
+
+                if account.status is not AccountStatus.ACTIVE:
+                    self.compact(account, customer)
+                    archived += 1
+
+        return archived
+
+
+    def rehydrate(self, account_ID: int) -> Account:
+        """Rebuilds an archived account (removing it from the archive) after checking its history."""
+        account: Account = self.load(account_ID)
+
+        summary: ArchivedAccount = self._summaries.pop(account_ID)
+        self._by_customer[summary.customer_ID].remove(account_ID)
+        if self._directory is None:
+            del self._blobs[account_ID]
+        else:
+            os.remove(self._path(account_ID))
+
+        return account
+
+
+    def load(self, account_ID: int) -> Account:
+        """Rebuilds a checked copy of an archived account; the archive keeps it."""
+        summary: ArchivedAccount | None = self._summaries.get(account_ID)
+        if summary is None:
+            raise ValueError(f"Account {account_ID} is not archived")
+
+        if self._directory is None:
+            blob: bytes = self._blobs[account_ID]
+        else:
+            with open(self._path(account_ID), "rb") as file:
+                blob = file.read()
+
+        if not hmac.compare_digest(self._digest(blob), summary.digest):
+            raise ValueError(f"Archived history for account {account_ID} failed its integrity check")
+
+        account: Account = summary.account_type(account_ID, self._catalog.get(summary.product_code), summary.currency)
+        log = account._audit_log
+        for transaction in _unpack(zlib.decompress(blob)):
+            log.log_transaction(transaction)
+
+        if len(log) != summary.transaction_count or log.head != summary.head:
+            raise ValueError(f"Archived history for account {account_ID} does not match its checkpoint")
+
+        account._customer_ID = summary.customer_ID
+        account._balance = summary.balance
+        account._version = summary.version
+        account._status = summary.status
+        account._synced = summary.synced
+        account._posted_periods = dict(summary.posted_periods) if summary.posted_periods else None
+        return account
+
+
+    def accounts_of(self, customer_ID: int) -> list[Account]:
+        """Checked copies of every account archived for `customer_ID` (see load())."""
+        return [self.load(account_ID) for account_ID in self._by_customer.get(customer_ID, ())]
+
+
+    def summary(self, account_ID: int) -> ArchivedAccount | None:
+        return self._summaries.get(account_ID)
+
+
+    def _digest(self, blob: bytes) -> bytes:
+        return hmac.new(self._key, blob, hashlib.sha256).digest()
+
+
+    def _path(self, account_ID: int) -> str:
+        return os.path.join(self._directory, f"{account_ID}.archive")
+
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def __contains__(self, account_ID: int) -> bool:
+        return account_ID in self._summaries
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def stored_bytes(self) -> int:
+        # Compressed history held in memory (0 for a directory-backed archive)
+        return sum(map(len, self._blobs.values()))
+
+
+def _pack(transactions: list[Transaction]) -> bytes:
+    rows: bytearray = bytearray()
+    for transaction in transactions:
+        currency: bytes = transaction.fx_currency.encode("ascii") if transaction.fx_currency is not None else b""
+        rows += _ROW.pack(_TYPE_INDEX[transaction.transaction_type], transaction.amount,
+                          (transaction.timestamp - _EPOCH) // _MICROSECOND,
+                          transaction.fx_amount if transaction.fx_amount is not None else 0.0, len(currency))
+        rows += currency
+
+    return bytes(rows)
+
+
+def _unpack(rows: bytes) -> list[Transaction]:
+    restore = Transaction._restore
+    transactions: list[Transaction] = []
+    offset: int = 0
+    while offset < len(rows):
+        kind, amount, micros, fx_amount, length = _ROW.unpack_from(rows, offset)
+        offset += _ROW.size
+        fx_currency: str | None = rows[offset:offset + length].decode("ascii") if length else None
+        offset += length
+        transactions.append(restore(_TRANSACTION_TYPES[kind], amount, _EPOCH + micros * _MICROSECOND, fx_amount, fx_currency))
+
+    return transactions
@@ -0,0 +1,284 @@
+"""
+Hot-path instrumentation for the transaction engine.
+
+Instrumentation.enable() wraps the engine entry points (deposit, withdraw,
+transfer, apply_interest, AuditLog.log_transaction) with timing wrappers;
+disable() puts the original methods back, so a disabled engine runs with
+zero added overhead. Metrics can be exported as a snapshot dict or as
+Prometheus text.
+"""
+import time
+from functools import wraps
+
+from .account import Account, SavingsAccount
+from .audit_log import AuditLog
+from . import invariants
+
+
+# ValueError message -> error reason label
+ERROR_REASONS: dict[str, str] = {
+    "Insufficient funds": "insufficient_funds",
+    "Overdraft limit exceeded": "overdraft_limit_exceeded",
+    "Invalid deposit amount": "invalid_amount",
+    "Invalid withdrawal amount": "invalid_amount",
+    "Invalid transaction amount": "invalid_amount",
+}
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of nanosecond latencies.
+    Each power of two is split into 2 ** sub_bucket_bits buckets, so every
+    recorded value is accurate to within 1 / 2 ** sub_bucket_bits (12.5% by default).
+    """
+
+    def __init__(self, sub_bucket_bits: int = 3):
+        self._bits: int = sub_bucket_bits
+        self._counts: dict[int, int] = {}
+        self._count: int = 0
+        self._total: int = 0
+        self._min: int | None = None
+        self._max: int = 0
+
+
+    def record(self, value: int) -> None:
+        bits: int = self._bits
+        length: int = value.bit_length()
+
+        if length <= bits + 1:
+            index: int = value
+        else:
+            shift: int = length - bits - 1
+            index = (shift << bits) + (value >> shift)
+
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self._count += 1
+        self._total += value
+
+        if self._min is None or value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+
+    def _bucket_bounds(self, index: int) -> tuple[int, int]:
+        bits: int = self._bits
+        if index < 1 << (bits + 1):
+            return index, index
+
+        shift: int = (index >> bits) - 1
+        low: int = (index - (shift << bits)) << shift
+        return low, low + (1 << shift) - 1
+
+
+    def percentile(self, q: float) -> int:
+        """Upper bound (ns) of the bucket holding the q-th percentile (0-100)."""
+        if not self._count:
+            return 0
+
+        target: float = self._count * q / 100
+        seen: int = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._bucket_bounds(index)[1], self._max)
+
+        return self._max
+
+
+    def buckets(self) -> list[tuple[int, int]]:
+        """(upper bound ns, cumulative count) for every non-empty bucket."""
+        cumulative: int = 0
+        result: list[tuple[int, int]] = []
+        for index in sorted(self._counts):
+            cumulative += self._counts[index]
+            result.append((self._bucket_bounds(index)[1], cumulative))
+
+        return result
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @property
+    def min(self) -> int:
+        return self._min or 0
+
+    @property
+    def max(self) -> int:
+        return self._max
+
+
+class OperationStats:
+    def __init__(self):
+        self.calls: int = 0
+        self.errors: dict[str, int] = {}
+        self.latency: LatencyHistogram = LatencyHistogram()
+
+
+class Metrics:
+    def __init__(self):
+        self._operations: dict[str, OperationStats] = {}
+
+
+    def operation(self, name: str) -> OperationStats:
+        stats: OperationStats | None = self._operations.get(name)
+        if stats is None:
+            stats = self._operations[name] = OperationStats()
+
+        return stats
+
+
+    def snapshot(self) -> dict:
+        operations: dict = {}
+        for name, stats in self._operations.items():
+            latency: LatencyHistogram = stats.latency
+            operations[name] = {
+                "calls": stats.calls,
+                "errors": dict(stats.errors),
+                "latency_ns": {
+                    "count": latency.count,
+                    "min": latency.min,
+                    "max": latency.max,
+                    "mean": latency.total / latency.count if latency.count else 0,
+                    "p50": latency.percentile(50),
+                    "p90": latency.percentile(90),
+                    "p99": latency.percentile(99),
+                    "p999": latency.percentile(99.9),
+                },
+            }
+
+        return {"operations": operations, "invariant_violations": invariants.violations()}
+
+
+    def to_prometheus(self, prefix: str = "securebank") -> str:
+        lines: list[str] = [
+            f"# HELP {prefix}_operation_calls_total Engine operations performed.",
+            f"# TYPE {prefix}_operation_calls_total counter",
+        ]
+        for name, stats in self._operations.items():
+            lines.append(f'{prefix}_operation_calls_total{{operation="{name}"}} {stats.calls}')
+
+        lines += [
+            f"# HELP {prefix}_operation_errors_total Rejected engine operations by reason.",
+            f"# TYPE {prefix}_operation_errors_total counter",
+        ]
+        for name, stats in self._operations.items():
+            for reason, count in stats.errors.items():
+                lines.append(f'{prefix}_operation_errors_total{{operation="{name}",reason="{reason}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_operation_latency_seconds Engine operation latency.",
+            f"# TYPE {prefix}_operation_latency_seconds histogram",
+        ]
+        for name, stats in self._operations.items():
+            latency: LatencyHistogram = stats.latency
+            for upper, cumulative in latency.buckets():
+                lines.append(f'{prefix}_operation_latency_seconds_bucket{{operation="{name}",le="{upper / 1e9:.9g}"}} {cumulative}')
+            lines.append(f'{prefix}_operation_latency_seconds_bucket{{operation="{name}",le="+Inf"}} {latency.count}')
+            lines.append(f'{prefix}_operation_latency_seconds_sum{{operation="{name}"}} {latency.total / 1e9:.9g}')
+            lines.append(f'{prefix}_operation_latency_seconds_count{{operation="{name}"}} {latency.count}')
+
+        lines += [
+            f"# HELP {prefix}_invariant_violations_total Engine invariant violations.",
+            f"# TYPE {prefix}_invariant_violations_total counter",
+        ]
+        for name, count in invariants.violations().items():
+            lines.append(f'{prefix}_invariant_violations_total{{invariant="{name}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+
+    def reset(self) -> None:
+        self._operations.clear()
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def operations(self) -> dict[str, OperationStats]:
+        return dict(self._operations)
+
+
+class Instrumentation:
+    # (owner class, method name, operation label)
+    TARGETS: tuple[tuple[type, str, str], ...] = (
+        (Account, "deposit", "deposit"),
+        (Account, "withdraw", "withdraw"),
+        (Account, "transfer", "transfer"),
+        (SavingsAccount, "apply_interest", "apply_interest"),
+        (AuditLog, "log_transaction", "log_transaction"),
+    )
+
+    def __init__(self, metrics: Metrics | None = None):
+        self._metrics: Metrics = metrics or Metrics()
+        self._originals: list[tuple[type, str, object]] = []
+
+
+    def enable(self) -> None:
+        if self._originals:
+            return
+
+        for owner, method_name, label in self.TARGETS:
+            original = owner.__dict__[method_name]
+            self._originals.append((owner, method_name, original))
+            setattr(owner, method_name, _timed(original, self._metrics.operation(label)))
+
+
+    def disable(self) -> None:
+        for owner, method_name, original in reversed(self._originals):
+            setattr(owner, method_name, original)
+
+        self._originals.clear()
+
+
+    def __enter__(self) -> 'Instrumentation':
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def metrics(self) -> Metrics:
+        return self._metrics
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+
+def _timed(method, stats: OperationStats):
+    clock = time.perf_counter_ns
+    record = stats.latency.record
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        start: int = clock()
+        try:
+            return method(*args, **kwargs)
+        except ValueError as e:
+            reason: str = ERROR_REASONS.get(str(e), "other")
+            stats.errors[reason] = stats.errors.get(reason, 0) + 1
+            raise
+        finally:
+            stats.calls += 1
+            record(clock() - start)
+
+    return wrapper
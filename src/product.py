@@ -0,0 +1,188 @@
+from bisect import bisect_right
+
+
+class ProductTerms:
+    """
+    One immutable version of a product's pricing.
+    - interest_tiers: (minimum balance, rate) pairs sorted by minimum balance.
+    - overdraft_limit / overdraft_fee: limits and fees for checking products.
+    - maintenance_fee: flat fee charged by month-end processing.
+    """
+    __slots__ = ("_version", "_interest_tiers", "_tier_floors", "_overdraft_limit",
+                 "_overdraft_fee", "_maintenance_fee")
+
+    def __init__(self, version: int,
+                 interest_tiers: tuple[tuple[float, float], ...] = ((0, 0.0),),
+                 overdraft_limit: float = 0,
+                 overdraft_fee: float = 0,
+                 maintenance_fee: float = 0):
+
+        if not interest_tiers:
+            raise ValueError("At least one interest tier is required")
+
+        if overdraft_limit > 0:
+            raise ValueError("Overdraft limit cannot be positive")
+
+        if overdraft_fee < 0 or maintenance_fee < 0:
+            raise ValueError("Fees cannot be negative")
+
+        tiers = tuple(sorted((float(floor), float(rate)) for floor, rate in interest_tiers))
+
+        self._version: int = version
+        self._interest_tiers: tuple[tuple[float, float], ...] = tiers
+        self._tier_floors: tuple[float, ...] = tuple(floor for floor, _ in tiers)
+        self._overdraft_limit: float = overdraft_limit
+        self._overdraft_fee: float = overdraft_fee
+        self._maintenance_fee: float = maintenance_fee
+
+
+    def rate_for(self, balance: float) -> float:
+        # Highest tier whose floor is at or below the balance (first tier if below every floor)
+        index: int = bisect_right(self._tier_floors, balance) - 1
+        return self._interest_tiers[max(index, 0)][1]
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def interest_tiers(self) -> tuple[tuple[float, float], ...]:
+        return self._interest_tiers
+
+    @property
+    def interest_rate(self) -> float:
+        # Base rate (lowest tier)
+        return self._interest_tiers[0][1]
+
+    @property
+    def overdraft_limit(self) -> float:
+        return self._overdraft_limit
+
+    @property
+    def overdraft_fee(self) -> float:
+        return self._overdraft_fee
+
+    @property
+    def maintenance_fee(self) -> float:
+        return self._maintenance_fee
+
+    def __repr__(self) -> str:
+        return f"ProductTerms(version={self._version}, tiers={self._interest_tiers})"
+
+
+class Product:
+    """
+    Shared product definition referenced by every account of that product.
+    Revising a product appends a new ProductTerms version; accounts always
+    read the current version, so a rate change is O(1) regardless of how
+    many accounts hold the product.
+    """
+    __slots__ = ("_code", "_versions")
+
+    def __init__(self, code: str, terms: ProductTerms):
+        self._code: str = code
+        self._versions: list[ProductTerms] = [terms]
+
+
+    def revise(self, **changes) -> ProductTerms:
+        current: ProductTerms = self.terms
+        values: dict = {
+            "interest_tiers": current.interest_tiers,
+            "overdraft_limit": current.overdraft_limit,
+            "overdraft_fee": current.overdraft_fee,
+            "maintenance_fee": current.maintenance_fee,
+        }
+
+        unknown = set(changes) - set(values)
+        if unknown:
+            raise ValueError(f"Unknown product terms: {', '.join(sorted(unknown))}")
+
+        values.update(changes)
+        new_terms: ProductTerms = ProductTerms(current.version + 1, **values)
+        self._versions.append(new_terms)
+        return new_terms
+
+
+    def terms_at(self, version: int) -> ProductTerms:
+        if not 1 <= version <= len(self._versions):
+            raise ValueError(f"Unknown version {version} for product {self._code}")
+
+        return self._versions[version - 1]
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def code(self) -> str:
+        return self._code
+
+    @property
+    def terms(self) -> ProductTerms:
+        return self._versions[-1]
+
+    @property
+    def versions(self) -> list[ProductTerms]:
+        return self._versions[:]
+
+    def __repr__(self) -> str:
+        return f"Product(code={self._code}, version={self.terms.version})"
+
+
+class ProductCatalog:
+    def __init__(self):
+        self._products: dict[str, Product] = {}
+
+
+    def register(self, code: str, **terms) -> Product:
+        if code in self._products:
+            raise ValueError(f"Product {code} already exists")
+
+        product: Product = Product(code, ProductTerms(1, **terms))
+        self._products[code] = product
+        return product
+
+
+    def get(self, code: str) -> Product:
+        product: Product | None = self._products.get(code)
+        if product is None:
+            raise ValueError(f"Unknown product: {code}")
+
+        return product
+
+
+    def group_by_product(self, accounts) -> dict[str, list]:
+        """
+        Buckets accounts by product code so batch runs (interest, fees) can
+        read the product terms once per group instead of once per account.
+        """
+        groups: dict[str, list] = {}
+        for account in accounts:
+            groups.setdefault(account.product.code, []).append(account)
+
+        return groups
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def products(self) -> list[Product]:
+        return list(self._products.values())
+
+
+def _build_default_catalog() -> ProductCatalog:
+    catalog: ProductCatalog = ProductCatalog()
+    catalog.register("SAVINGS", interest_tiers=((0, 0.015),))
+    catalog.register("CHECKING", overdraft_limit=-500, overdraft_fee=35)
+    return catalog
+
+
+DEFAULT_CATALOG: ProductCatalog = _build_default_catalog()
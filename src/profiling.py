@@ -0,0 +1,330 @@
+"""
+Profiling modes for batch and benchmark runs.
+
+Profiler combines three optional collectors:
+- "sample":   a background thread reads the profiled thread's stack from
+              sys._current_frames() every `interval` seconds. Cheap, covers
+              everything (CLI loop, parsing, I/O). Under the GIL samples
+              land at most once per switch interval (5 ms by default).
+- "cprofile": cProfile switched on only inside engine entry points (the
+              same targets metrics.Instrumentation times), so the CLI loop
+              and output buffering stay out of the numbers.
+- "memory":   tracemalloc; net bytes retained per top-level operation type,
+              plus the top allocation sites in src/ when profiling stops.
+
+write(directory) produces collapsed-stack files ("frame;frame;frame count"
+per line, ready for flamegraph.pl or speedscope), the raw cProfile dump and
+report.txt, which ranks the hottest functions in src/. Entry points are
+patched the way Instrumentation patches them and restored on stop(); the
+collectors assume the engine runs on the thread that called start().
+"""
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from functools import wraps
+
+from .metrics import Instrumentation
+
+MODES: tuple[str, ...] = ("sample", "cprofile", "memory")
+SRC_DIR: str = os.path.dirname(os.path.abspath(__file__))
+# This module's own wrappers are left out of every stack and report
+_SELF: str = os.path.abspath(__file__)
+_ROOT_DIR: str = os.path.dirname(SRC_DIR)
+_MAX_DEPTH: int = 64
+
+
+def _short(filename: str) -> str:
+    if filename.startswith(_ROOT_DIR + os.sep):
+        return os.path.relpath(filename, _ROOT_DIR)
+    return os.path.basename(filename)
+
+
+def _in_src(filename: str) -> bool:
+    return filename.startswith(SRC_DIR + os.sep) and filename != _SELF
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.001):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self._interval: float = interval
+        self._stacks: Counter = Counter()
+        # code object -> (label, in src/), label None for hidden frames; built once per function
+        self._labels: dict = {}
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target: int | None = None
+
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+
+    def _run(self) -> None:
+        frames = sys._current_frames
+        labels: dict = self._labels
+        while not self._stop.wait(self._interval):
+            frame = frames().get(self._target)
+            stack: list[str] = []
+            while frame is not None:
+                code = frame.f_code
+                label = labels.get(code)
+                if label is None:
+                    hidden: bool = code.co_filename == _SELF
+                    label = labels[code] = (None if hidden else f"{_short(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}",
+                                            _in_src(code.co_filename))
+                if label[0] is not None:
+                    stack.append(label[0])
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self._stacks[tuple(stack)] += 1
+
+
+    def collapsed(self) -> list[str]:
+        return [f"{';'.join(stack)} {count}" for stack, count in self._stacks.most_common()]
+
+
+    def hot_functions(self, limit: int = 15) -> list[tuple[str, int, int]]:
+        """(function, self samples, inclusive samples) for src/ functions, hottest first."""
+        in_src: set[str] = {label for label, is_src in self._labels.values() if is_src and label is not None}
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in self._stacks.items():
+            if stack[-1] in in_src:
+                own[stack[-1]] += count
+            for label in set(stack) & in_src:
+                inclusive[label] += count
+
+        ranked = sorted(inclusive, key=lambda label: (own[label], inclusive[label]), reverse=True)
+        return [(label, own[label], inclusive[label]) for label in ranked[:limit]]
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def samples(self) -> int:
+        return sum(self._stacks.values())
+
+
+class Profiler:
+    def __init__(self, modes: tuple[str, ...] = MODES, interval: float = 0.001):
+        unknown: set[str] = set(modes) - set(MODES)
+        if unknown:
+            raise ValueError(f"Unknown profiling mode: {', '.join(sorted(unknown))}")
+
+        self._modes: tuple[str, ...] = tuple(modes)
+        self._sampler: SamplingProfiler | None = SamplingProfiler(interval) if "sample" in modes else None
+        self._profile: cProfile.Profile | None = cProfile.Profile() if "cprofile" in modes else None
+        # operation label -> [calls, net bytes retained]
+        self._memory: dict[str, list[int]] = {}
+        self._allocation_sites: list[tracemalloc.StatisticDiff] = []
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._originals: list[tuple[type, str, object]] = []
+        self._depth: int = 0
+
+
+    def start(self) -> None:
+        if self._originals:
+            return
+
+        if "memory" in self._modes:
+            tracemalloc.start()
+            self._baseline = tracemalloc.take_snapshot()
+
+        if self._profile is not None or "memory" in self._modes:
+            for owner, method_name, label in Instrumentation.TARGETS:
+                original = owner.__dict__[method_name]
+                self._originals.append((owner, method_name, original))
+                setattr(owner, method_name, self._scoped(original, label))
+
+        if self._sampler is not None:
+            self._sampler.start()
+
+
+    def stop(self) -> None:
+        if self._sampler is not None:
+            self._sampler.stop()
+
+        for owner, method_name, original in reversed(self._originals):
+            setattr(owner, method_name, original)
+        self._originals.clear()
+
+        if self._baseline is not None:
+            snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, os.path.join(SRC_DIR, "*")),
+                                                                  tracemalloc.Filter(False, _SELF)])
+            self._allocation_sites = snapshot.compare_to(self._baseline, "lineno")
+            self._baseline = None
+            tracemalloc.stop()
+
+
+    def __enter__(self) -> 'Profiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+    def _scoped(self, method, label: str):
+        profile: cProfile.Profile | None = self._profile
+        memory: list[int] | None = self._memory.setdefault(label, [0, 0]) if self._baseline is not None else None
+        traced = tracemalloc.get_traced_memory
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            # Only the outermost engine call is measured (a transfer's log_transaction counts as the transfer)
+            if self._depth:
+                return method(*args, **kwargs)
+
+            self._depth = 1
+            before: int = traced()[0] if memory is not None else 0
+            if profile is not None:
+                profile.enable()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                if profile is not None:
+                    profile.disable()
+                if memory is not None:
+                    memory[0] += 1
+                    memory[1] += traced()[0] - before
+                self._depth = 0
+
+        return wrapper
+
+
+    def engine_collapsed(self) -> list[str]:
+        """
+        Collapsed stacks rebuilt from the scoped cProfile call graph (in
+        microseconds). A function called from several places has its time
+        split across them in proportion to each caller's cumulative time.
+        """
+        if self._profile is None:
+            return []
+
+        stats: dict = pstats.Stats(self._profile).stats
+        children: dict = {}
+        for callee, (_, _, _, _, callers) in stats.items():
+            for caller, edge in callers.items():
+                children.setdefault(caller, []).append((callee, edge[3]))
+
+        lines: Counter = Counter()
+
+        def walk(function: tuple, path: tuple[str, ...], share: float) -> None:
+            _, _, own_time, total_time, _ = stats[function]
+            if function[0] != _SELF:
+                path = path + (_function_label(function),)
+                lines[path] += own_time * share
+            if len(path) >= _MAX_DEPTH:
+                return
+
+            for callee, edge_time in children.get(function, ()):
+                callee_total: float = stats[callee][3]
+                if callee_total > 0 and _function_label(callee) not in path:
+                    walk(callee, path, share * min(1.0, edge_time / callee_total))
+
+        for function, (_, _, _, _, callers) in stats.items():
+            if not callers and "disable" not in function[2]:
+                walk(function, (), 1.0)
+
+        return [f"{';'.join(path)} {round(seconds * 1e6)}" for path, seconds in lines.most_common() if seconds * 1e6 >= 0.5]
+
+
+    def report(self, limit: int = 15) -> str:
+        lines: list[str] = []
+
+        if self._profile is not None:
+            lines.append("Hottest src/ functions inside engine calls (cProfile):")
+            lines.append(f"  {'function':<58} {'calls':>10} {'self ms':>10} {'total ms':>10}")
+            stats: dict = pstats.Stats(self._profile).stats
+            ranked = sorted((item for item in stats.items() if _in_src(item[0][0])), key=lambda item: item[1][2], reverse=True)
+            for function, (_, calls, own_time, total_time, _) in ranked[:limit]:
+                lines.append(f"  {_function_label(function):<58} {calls:>10,} {own_time * 1000:>10.2f} {total_time * 1000:>10.2f}")
+            lines.append("")
+
+        if self._sampler is not None:
+            lines.append(f"Hottest src/ functions by samples ({self._sampler.samples:,} samples, whole run):")
+            lines.append(f"  {'function':<58} {'self':>10} {'total':>10}")
+            for label, own, inclusive in self._sampler.hot_functions(limit):
+                lines.append(f"  {label:<58} {own:>10,} {inclusive:>10,}")
+            lines.append("")
+
+        if self._memory:
+            lines.append("Net memory retained per operation (tracemalloc):")
+            lines.append(f"  {'operation':<20} {'calls':>10} {'bytes':>14} {'bytes/op':>10}")
+            for label, (calls, retained) in sorted(self._memory.items(), key=lambda item: item[1][1], reverse=True):
+                if calls:
+                    lines.append(f"  {label:<20} {calls:>10,} {retained:>14,} {retained / calls:>10,.0f}")
+            lines.append("Top allocation sites in src/:")
+            for site in self._allocation_sites[:limit]:
+                frame = site.traceback[0]
+                lines.append(f"  {_short(frame.filename)}:{frame.lineno:<6} {site.size_diff:>14,} bytes {site.count_diff:>10,} blocks")
+            lines.append("")
+
+        return "\n".join(lines)
+
+
+    def write(self, directory: str) -> list[str]:
+        """Writes collapsed stacks, the cProfile dump and report.txt; returns the paths written."""
+        os.makedirs(directory, exist_ok=True)
+        outputs: dict[str, str] = {"report.txt": self.report() + "\n"}
+        if self._sampler is not None:
+            outputs["samples.collapsed"] = "\n".join(self._sampler.collapsed()) + "\n"
+        if self._profile is not None:
+            outputs["engine.collapsed"] = "\n".join(self.engine_collapsed()) + "\n"
+
+        paths: list[str] = []
+        for name, text in outputs.items():
+            paths.append(os.path.join(directory, name))
+            with open(paths[-1], "w") as file:
+                file.write(text)
+
+        if self._profile is not None:
+            paths.append(os.path.join(directory, "engine.prof"))
+            self._profile.dump_stats(paths[-1])
+
+        return paths
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def modes(self) -> tuple[str, ...]:
+        return self._modes
+
+    @property
+    def memory(self) -> dict[str, tuple[int, int]]:
+        # operation -> (calls, net bytes retained)
+        return {label: (calls, retained) for label, (calls, retained) in self._memory.items()}
+
+
+def _function_label(function: tuple) -> str:
+    filename, _, name = function
+    if filename == "~":
+        return name  # built-in, e.g. "<method 'append' of 'list' objects>"
+    return f"{_short(filename)}:{name}"
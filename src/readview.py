@@ -0,0 +1,182 @@
+"""
+Point-in-time read views of balances and audit logs (copy-on-write MVCC).
+
+A ReadView is a consistent cut across many accounts that a long-running
+reader (statements, aggregates, reconciliation) can scan while postings
+continue:
+- Opening a view copies the account index (references only) while
+  holding the writers' lock, so it never starts in the middle of a
+  transfer. No balance is copied.
+- While any view is open, the first change to an account after the
+  newest view opened saves that account's pre-image (balance, audit log
+  length) into every open view that lacks one. Later changes in the same
+  window cost a set lookup.
+- A view reads the pre-image if one exists, otherwise the live account.
+  Writers save pre-images before they mutate, so a live read that finds
+  no pre-image afterwards saw the account as of the view.
+- History comes from the append-only AuditLog, cut at the recorded length.
+
+With no view open, writers only check one class attribute. Postings must
+be serialized by the lock given to ReadViews (as BankService does); striped
+credits, which bypass that lock, save their pre-image with every stripe
+locked instead (see StripedCheckingAccount._deposit_helper).
+"""
+import math
+import threading
+from contextlib import nullcontext
+from typing import Iterator, Mapping
+
+from .account import Account
+from .transaction import Transaction, TransactionType
+
+_CREDITS: frozenset[TransactionType] = frozenset({TransactionType.DEPOSIT, TransactionType.TRANSFER_RECEIVED,
+                                                  TransactionType.INTEREST_APPLIED})
+
+
+class ReadView:
+    def __init__(self, manager: 'ReadViews', accounts: dict[int, Account]):
+        self._manager: ReadViews = manager
+        self._accounts: dict[int, Account] = accounts
+        # account -> (balance, audit log length) as of this view
+        self._pre: dict[Account, tuple[float, int]] = {}
+        self._closed: bool = False
+
+
+    def _state(self, account: Account) -> tuple[float, int]:
+        pre: tuple[float, int] | None = self._pre.get(account)
+        if pre is not None:
+            return pre
+
+        state: tuple[float, int] = account._view_state()
+        # A writer that started meanwhile saved the pre-image first; prefer it
+        pre = self._pre.get(account)
+        return state if pre is None else pre
+
+
+    def _account(self, account_ID: int) -> Account:
+        if self._closed:
+            raise ValueError("Read view is closed")
+
+        account: Account | None = self._accounts.get(account_ID)
+        if account is None:
+            raise ValueError(f"Account {account_ID} not found")
+
+        return account
+
+
+    def balance(self, account_ID: int) -> float:
+        return self._state(self._account(account_ID))[0]
+
+
+    def transaction_count(self, account_ID: int) -> int:
+        return self._state(self._account(account_ID))[1]
+
+
+    def history(self, account_ID: int) -> list[Transaction]:
+        account: Account = self._account(account_ID)
+        return account._history_prefix(self._state(account)[1])
+
+
+    def balances(self) -> Iterator[tuple[int, float]]:
+        if self._closed:
+            raise ValueError("Read view is closed")
+
+        for account_ID, account in self._accounts.items():
+            yield account_ID, self._state(account)[0]
+
+
+    def total_balance(self) -> float:
+        return math.fsum(balance for _, balance in self.balances())
+
+
+    def check_ledger(self, account_ID: int) -> bool:
+        """True if the view's balance equals the sum of the view's history (accounts opened at zero)."""
+        total: float = math.fsum(tx.amount if tx.transaction_type in _CREDITS else -tx.amount for tx in self.history(account_ID))
+        return math.isclose(total, self.balance(account_ID), abs_tol=1e-6)
+
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._manager._release(self)
+
+
+    def __enter__(self) -> 'ReadView':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def account_count(self) -> int:
+        return len(self._accounts)
+
+    @property
+    def preserved(self) -> int:
+        # Accounts written since the view opened (each holds one saved pre-image)
+        return len(self._pre)
+
+
+class ReadViews:
+    """
+    Opens read views over an account index. `lock` is the lock writers hold
+    for each operation (None when reads and writes share one thread).
+    Only one ReadViews should have views open at a time.
+    """
+
+    def __init__(self, accounts: Mapping[int, Account], lock: 'threading.Lock | None' = None):
+        self._accounts: Mapping[int, Account] = accounts
+        self._lock = lock if lock is not None else nullcontext()
+        # Replaced, never mutated, so writers can iterate without locking
+        self._views: tuple[ReadView, ...] = ()
+        # Accounts already preserved since the newest view opened
+        self._touched: set[Account] = set()
+
+
+    def open(self) -> ReadView:
+        with self._lock:
+            view: ReadView = ReadView(self, dict(self._accounts))
+            self._views = self._views + (view,)
+            self._touched = set()
+            Account._read_views = self
+
+        return view
+
+
+    def needs(self, account: Account) -> bool:
+        """True if `account` has no pre-image yet in the newest window (a hint; before_write re-checks)."""
+        return account not in self._touched
+
+
+    def before_write(self, account: Account) -> None:
+        # Called by Account right before it changes a balance (writers' lock held)
+        if account in self._touched:
+            return
+
+        self._touched.add(account)
+        state: tuple[float, int] = account._view_state()
+        for view in self._views:
+            view._pre.setdefault(account, state)
+
+
+    def _release(self, view: ReadView) -> None:
+        with self._lock:
+            self._views = tuple(open_view for open_view in self._views if open_view is not view)
+            if not self._views:
+                self._touched = set()
+                if Account._read_views is self:
+                    Account._read_views = None
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def open_views(self) -> int:
+        return len(self._views)
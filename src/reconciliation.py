@@ -0,0 +1,259 @@
+import math
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, Future
+from collections import deque
+from typing import Iterable, Iterator
+
+from .account import Account
+from .transaction import TransactionType
+
+
+# Effect of each transaction type on the balance
+SIGNS: dict[str, int] = {
+    TransactionType.DEPOSIT.value: 1,
+    TransactionType.TRANSFER_RECEIVED.value: 1,
+    TransactionType.INTEREST_APPLIED.value: 1,
+    TransactionType.WITHDRAW.value: -1,
+    TransactionType.TRANSFER_SENT.value: -1,
+    TransactionType.EXTRA_FEE.value: -1,
+    TransactionType.MAINTENANCE_FEE.value: -1,
+}
+
+# Transaction type names used by the Transactions table (schema.sql)
+DB_TRANSACTION_TYPES: dict[TransactionType, str] = {
+    TransactionType.DEPOSIT: "DEPOSIT",
+    TransactionType.WITHDRAW: "WITHDRAW",
+    TransactionType.TRANSFER_SENT: "TRANSFER_SENT",
+    TransactionType.TRANSFER_RECEIVED: "TRANSFER_RECEIVED",
+    TransactionType.EXTRA_FEE: "OVERDRAFT_FEE",
+    TransactionType.MAINTENANCE_FEE: "MAINTENANCE_FEE",
+    TransactionType.INTEREST_APPLIED: "INTEREST",
+}
+
+# (account_ID, balance, ((type value, amount), ...), FX adjustment) -- plain tuples pickle cheaply
+AccountRecord = tuple[int, float, tuple[tuple[str, float], ...], float]
+
+
+class ReconciliationReport:
+    def __init__(self):
+        self.accounts_checked: int = 0
+        self.transactions_replayed: int = 0
+        self.mismatches: list[tuple[int, float, float]] = []
+        self.transfer_sent: float = 0.0
+        self.transfer_received: float = 0.0
+        self.elapsed: float = 0.0
+        self.tolerance: float = 0.005
+        # Bank-wide totals grow with the bank, so their comparison scales with them too
+        self.relative_tolerance: float = 1e-12
+
+
+    @property
+    def transfers_balanced(self) -> bool:
+        return math.isclose(self.transfer_sent, self.transfer_received, rel_tol=self.relative_tolerance, abs_tol=self.tolerance)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches and self.transfers_balanced
+
+    @property
+    def accounts_per_second(self) -> float:
+        return self.accounts_checked / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def transactions_per_second(self) -> float:
+        return self.transactions_replayed / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (f"ReconciliationReport(ok={self.ok}, accounts={self.accounts_checked}, "
+                f"mismatches={len(self.mismatches)}, accounts/s={self.accounts_per_second:,.0f})")
+
+
+def replay_balance(entries: Iterable[tuple[str, float]]) -> float:
+    balance: float = 0.0
+    for type_value, amount in entries:
+        balance += SIGNS[type_value] * amount
+
+    return balance
+
+
+def _to_record(account: Account) -> AccountRecord:
+    history = account.view_transaction_history()
+    entries = tuple((tx.transaction_type.value, tx.amount) for tx in history)
+
+    # Cross-currency transfers balance in the receiving currency: count the converted amount of sent legs
+    adjustment: float = sum(tx.converted_amount - tx.amount for tx in history
+                            if tx.fx_currency is not None and tx.transaction_type is TransactionType.TRANSFER_SENT)
+    return account.account_ID, account.balance, entries, adjustment
+
+
+def _check_chunk(records: list[AccountRecord], tolerance: float) -> tuple:
+    """
+    Worker: replays each account's log and sums transfer legs.
+    Returns (checked, replayed, mismatches, per-account (ID, sent, received, log length)).
+    """
+    sent_type: str = TransactionType.TRANSFER_SENT.value
+    received_type: str = TransactionType.TRANSFER_RECEIVED.value
+    mismatches: list[tuple[int, float, float]] = []
+    transfers: list[tuple[int, float, float, int]] = []
+    replayed: int = 0
+
+    for account_ID, balance, entries, adjustment in records:
+        expected: float = replay_balance(entries)
+        if abs(expected - balance) > tolerance:
+            mismatches.append((account_ID, balance, expected))
+
+        sent: float = math.fsum(amount for type_value, amount in entries if type_value == sent_type) + adjustment
+        received: float = math.fsum(amount for type_value, amount in entries if type_value == received_type)
+        transfers.append((account_ID, sent, received, len(entries)))
+        replayed += len(entries)
+
+    return len(records), replayed, mismatches, transfers
+
+
+class Reconciler:
+    """
+    Bank-wide invariant checker.
+    - Every account balance must equal the replay of its audit log.
+    - Total TRANSFER_SENT must equal total TRANSFER_RECEIVED (cross-currency
+      legs compared at their converted amount).
+    Accounts are streamed in chunks to a process pool (workers > 1) with a
+    bounded number of chunks in flight. In incremental mode only accounts
+    whose audit log grew since the previous run are rechecked; accounts no
+    longer passed in (closed and archived, say) drop out of the totals.
+    """
+
+    def __init__(self, workers: int = 1, chunk_size: int = 1000, tolerance: float = 0.005):
+        if workers < 1 or chunk_size < 1:
+            raise ValueError("workers and chunk_size must be positive")
+
+        self._workers: int = workers
+        self._chunk_size: int = chunk_size
+        self._tolerance: float = tolerance
+        # account_ID -> transaction count at the last clean check
+        self._watermarks: dict[int, int] = {}
+        # account_ID -> (sent, received), so incremental runs keep bank-wide totals
+        self._transfer_totals: dict[int, tuple[float, float]] = {}
+
+
+    def run(self, accounts: Iterable[Account], incremental: bool = False) -> ReconciliationReport:
+        report: ReconciliationReport = ReconciliationReport()
+        report.tolerance = self._tolerance
+        start: float = time.perf_counter()
+
+        present: set[int] = set()
+        chunks: Iterator[list[AccountRecord]] = self._chunks(accounts, incremental, present)
+
+        if self._workers == 1:
+            for chunk in chunks:
+                self._merge(report, _check_chunk(chunk, self._tolerance))
+        else:
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                for result in self._stream(executor, chunks):
+                    self._merge(report, result)
+
+        for account_ID in self._transfer_totals.keys() - present:
+            del self._transfer_totals[account_ID]
+            self._watermarks.pop(account_ID, None)
+
+        report.transfer_sent = math.fsum(sent for sent, _ in self._transfer_totals.values())
+        report.transfer_received = math.fsum(received for _, received in self._transfer_totals.values())
+        report.elapsed = time.perf_counter() - start
+        return report
+
+
+    def _chunks(self, accounts: Iterable[Account], incremental: bool, present: set[int]) -> Iterator[list[AccountRecord]]:
+        chunk: list[AccountRecord] = []
+        for account in accounts:
+            present.add(account.account_ID)
+            if incremental and self._watermarks.get(account.account_ID) == account.transaction_count:
+                continue
+
+            self._watermarks.pop(account.account_ID, None)
+            chunk.append(_to_record(account))
+            if len(chunk) == self._chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+
+    def _stream(self, executor: Executor, chunks: Iterator[list[AccountRecord]]) -> Iterator[tuple]:
+        # Keep at most 2 chunks per worker in flight so memory stays bounded
+        pending: deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_check_chunk, chunk, self._tolerance))
+            if len(pending) >= self._workers * 2:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+    def _merge(self, report: ReconciliationReport, result: tuple) -> None:
+        checked, replayed, mismatches, transfers = result
+        report.accounts_checked += checked
+        report.transactions_replayed += replayed
+        report.mismatches.extend(mismatches)
+
+        failed: set[int] = {account_ID for account_ID, _, _ in mismatches}
+        for account_ID, sent, received, count in transfers:
+            self._transfer_totals[account_ID] = (sent, received)
+            if account_ID not in failed:
+                # The log is append-only, so an unchanged length means nothing to recheck
+                self._watermarks[account_ID] = count
+
+
+def compare_with_database(connection, accounts: Iterable[Account], batch_size: int = 10_000) -> list[tuple[int, str]]:
+    """
+    Compares in-memory accounts with the Accounts/Transactions tables.
+    Balances are compared at cent precision (DECIMAL(10, 2)); transaction
+    counts are compared per account and type. Rows are streamed with
+    fetchmany so the result set never has to fit in memory at once.
+    A posting type with no Transactions name is reported, never guessed.
+    """
+    expected: dict[int, tuple[float, dict[str, int]]] = {}
+    mismatches: list[tuple[int, str]] = []
+    for account in accounts:
+        counts: dict[str, int] = {}
+        for tx in account.view_transaction_history():
+            db_type: str | None = DB_TRANSACTION_TYPES.get(tx.transaction_type)
+            if db_type is None:
+                mismatches.append((account.account_ID, f"no database type for {tx.transaction_type.value}"))
+                continue
+            counts[db_type] = counts.get(db_type, 0) + 1
+        expected[account.account_ID] = (account.balance, counts)
+
+    seen: set[int] = set()
+    cursor = connection.cursor()
+
+    cursor.execute("SELECT account_id, balance FROM Accounts")
+    for account_ID, balance in _fetch_stream(cursor, batch_size):
+        seen.add(account_ID)
+        if account_ID not in expected:
+            mismatches.append((account_ID, "missing in memory"))
+        elif round(float(balance), 2) != round(expected[account_ID][0], 2):
+            mismatches.append((account_ID, f"balance {float(balance)} != {expected[account_ID][0]}"))
+
+    for account_ID in expected.keys() - seen:
+        mismatches.append((account_ID, "missing in database"))
+
+    stored: dict[int, dict[str, int]] = {}
+    cursor.execute("SELECT account_id, transaction_type, COUNT(*) FROM Transactions GROUP BY account_id, transaction_type")
+    for account_ID, db_type, count in _fetch_stream(cursor, batch_size):
+        stored.setdefault(account_ID, {})[db_type] = count
+
+    for account_ID in expected.keys() & seen:
+        if stored.get(account_ID, {}) != expected[account_ID][1]:
+            mismatches.append((account_ID, "transaction counts differ"))
+
+    cursor.close()
+    return mismatches
+
+
+def _fetch_stream(cursor, batch_size: int) -> Iterator[tuple]:
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
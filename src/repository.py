@@ -0,0 +1,307 @@
+"""
+Persistence of account balances with optimistic concurrency control.
+
+Every Accounts row carries a `version`. A write reads (balance, version),
+computes the new balance and then swaps it in with
+
+    UPDATE Accounts SET balance = ?, version = version + 1
+    WHERE account_id = ? AND version = ?
+
+If another writer got there first the UPDATE matches no row, the
+transaction is rolled back and the write is retried (bounded, with jittered
+exponential backoff). No row lock is held while the new balance is
+computed, so a hot account (e.g. a merchant settlement account) is not
+serialized behind SELECT ... FOR UPDATE. post_locked() is the pessimistic
+variant, kept for comparison (benchmarks/bench_contention.py).
+
+Debits follow the same product rules as the in-memory accounts
+(Account.debit_fee: savings floor, checking overdraft limit and fee), and
+every balance change writes its Transactions rows in the same database
+transaction, so the row ledger always adds up to the stored balance.
+
+Works with any DB-API connection: MySQL (the default placeholder and
+lock clause) or sqlite3 via AccountRepository.for_sqlite().
+"""
+import random
+import time
+
+from .account import Account, AccountStatus, SavingsAccount, CheckingAccount
+from .product import ProductCatalog, DEFAULT_CATALOG
+from .transaction import TransactionType
+from .reconciliation import SIGNS, DB_TRANSACTION_TYPES
+from .scheduler import POSTED_TASKS
+
+# Subset of schema.sql that sqlite accepts; used by the tests and benchmarks
+SQLITE_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS Accounts (
+    account_id INTEGER PRIMARY KEY,
+    customer_id INTEGER,
+    account_type TEXT NOT NULL,
+    product_code TEXT NOT NULL,
+    currency TEXT NOT NULL DEFAULT 'USD',
+    balance REAL NOT NULL DEFAULT 0,
+    version INTEGER NOT NULL DEFAULT 0,
+    interest_period TEXT,
+    fees_period TEXT,
+    status TEXT NOT NULL DEFAULT 'ACTIVE'
+);
+CREATE TABLE IF NOT EXISTS Transactions (
+    transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    account_id INTEGER NOT NULL,
+    transaction_type TEXT NOT NULL,
+    amount REAL NOT NULL,
+    fx_amount REAL,
+    fx_currency TEXT,
+    time_stamp TEXT DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+ACCOUNT_TYPES: dict[str, str] = {"SavingsAccount": "Savings", "CheckingAccount": "Checking"}
+ROW_TYPES: dict[str, type] = {"Savings": SavingsAccount, "Checking": CheckingAccount}
+
+
+class VersionConflict(ValueError):
+    """The row changed since it was read (and retries, if any, ran out)."""
+
+
+class AccountRepository:
+    def __init__(self, connection, placeholder: str = "%s", lock_clause: str = " FOR UPDATE",
+                 begin_locked: str | None = None, max_retries: int = 10, backoff: float = 0.0005,
+                 catalog: ProductCatalog = DEFAULT_CATALOG):
+
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+
+        self._connection = connection
+        self._max_retries: int = max_retries
+        self._backoff: float = backoff
+        # Statement that opens a locking transaction (sqlite needs BEGIN IMMEDIATE; MySQL starts one implicitly)
+        self._begin_locked: str | None = begin_locked
+        self._catalog: ProductCatalog = catalog
+        self._retries: int = 0
+        self._conflicts: int = 0
+
+        p: str = placeholder
+        # balance, version, then what the product rules need
+        self._select: str = f"SELECT balance, version, account_type, product_code FROM Accounts WHERE account_id = {p}"
+        self._select_locked: str = self._select + lock_clause
+        self._swap: str = f"UPDATE Accounts SET balance = {p}, version = version + 1 WHERE account_id = {p} AND version = {p}"
+        self._update: str = f"UPDATE Accounts SET balance = {p}, version = version + 1 WHERE account_id = {p}"
+        self._log: str = f"INSERT INTO Transactions (account_id, transaction_type, amount) VALUES ({p}, {p}, {p})"
+        # In-memory postings keep their own time and other FX leg
+        self._log_entry: str = (f"INSERT INTO Transactions (account_id, transaction_type, amount, fx_amount, fx_currency, time_stamp) "
+                                f"VALUES ({p}, {p}, {p}, {p}, {p}, {p})")
+        # Status and month-end periods travel with the balance, so a reloaded account is not
+        # reopened or posted twice (see scheduler.py)
+        state: list[str] = ["status"] + [f"{task}_period" for task in POSTED_TASKS]
+        self._insert: str = (f"INSERT INTO Accounts (account_id, customer_id, account_type, product_code, currency, balance, version, "
+                             f"{', '.join(state)}) VALUES ({', '.join([p] * (7 + len(state)))})")
+        self._store: str = (f"UPDATE Accounts SET balance = {p}, {', '.join(f'{column} = {p}' for column in state)}, "
+                            f"version = version + 1 WHERE account_id = {p} AND version = {p}")
+        self._select_state: str = f"SELECT balance, version, {', '.join(state)} FROM Accounts WHERE account_id = {p}"
+
+
+    @classmethod
+    def for_sqlite(cls, connection, **options) -> 'AccountRepository':
+        # sqlite has no row locks: the pessimistic path takes the database write lock up front
+        return cls(connection, placeholder="?", lock_clause="", begin_locked="BEGIN IMMEDIATE", **options)
+
+
+    def create(self, account: Account) -> None:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(self._insert, (account.account_ID, account.customer_ID, ACCOUNT_TYPES[type(account).__name__],
+                                          account.product.code, account.currency, account.balance, account.version,
+                                          *_state_of(account)))
+            self._log_history(cursor, account)
+            self._connection.commit()
+        except BaseException:
+            self._connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+    def load(self, account_ID: int) -> tuple[float, int]:
+        """Returns the stored (balance, version)."""
+        cursor = self._connection.cursor()
+        try:
+            return self._read(cursor, self._select, account_ID)[:2]
+        finally:
+            cursor.close()
+            # End the read so the next one sees fresh data (MySQL REPEATABLE READ)
+            self._connection.rollback()
+
+
+    def refresh(self, account: Account) -> None:
+        """
+        Overwrites an in-memory account's balance, version, status and posted
+        month-end periods with the stored row. Postings already in its history count as
+        stored from now on.
+        """
+        cursor = self._connection.cursor()
+        try:
+            row: tuple = self._read(cursor, self._select_state, account.account_ID)
+        finally:
+            cursor.close()
+            self._connection.rollback()
+
+        account._balance, account._version = row[:2]
+        account._status = AccountStatus(row[2])
+        posted: dict[str, str] = {task: period for task, period in zip(POSTED_TASKS, row[3:]) if period is not None}
+        account._posted_periods = posted or None
+        account._synced = len(account._audit_log)
+
+
+    def persist(self, account: Account) -> None:
+        """
+        Writes an in-memory account's balance, status and posted periods, and a Transactions row for
+        every posting since it was last stored, if the row is still at the
+        version the account was loaded with. Raises VersionConflict otherwise
+        (refresh() and redo the change); there is nothing to merge, so no retry.
+        """
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(self._store, (account.balance, *_state_of(account), account.account_ID, account.version))
+            if cursor.rowcount != 1:
+                self._connection.rollback()
+                self._conflicts += 1
+                raise VersionConflict(f"Account {account.account_ID} changed since version {account.version}")
+
+            self._log_history(cursor, account)
+            self._connection.commit()
+            account._version += 1
+        except BaseException:
+            self._connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+    def _log_history(self, cursor, account: Account) -> None:
+        # Caller commits; _synced only moves once the rows are in
+        pending = account._audit_log.slice(account._synced, len(account._audit_log))
+        unmapped = {tx.transaction_type.value for tx in pending} - {kind.value for kind in DB_TRANSACTION_TYPES}
+        if unmapped:
+            raise ValueError(f"No database type for {', '.join(sorted(unmapped))}")
+        cursor.executemany(self._log_entry, [(account.account_ID, DB_TRANSACTION_TYPES[tx.transaction_type], tx.amount,
+                                              tx.fx_amount, tx.fx_currency, tx.timestamp.isoformat(" "))
+                                             for tx in pending])
+        account._synced += len(pending)
+
+
+    def post(self, account_ID: int, amount: float, transaction_type: TransactionType) -> float:
+        """
+        Applies one posting with a compare-and-swap on the version. Debits
+        follow the stored account type's rules (overdraft fees included).
+        Returns the new balance.
+        """
+        self._validate(amount)
+        cursor = self._connection.cursor()
+        try:
+            for attempt in range(self._max_retries + 1):
+                row: tuple = self._read(cursor, self._select, account_ID)
+                new_balance, fee = self._apply(row, amount, transaction_type)
+
+                cursor.execute(self._swap, (new_balance, account_ID, row[1]))
+                if cursor.rowcount == 1:
+                    self._log_posting(cursor, account_ID, amount, transaction_type, fee)
+                    self._connection.commit()
+                    return new_balance
+
+                # Lost the race: start over from a fresh read
+                self._connection.rollback()
+                if attempt < self._max_retries:
+                    self._retries += 1
+                    time.sleep(self._backoff * (2 ** attempt) * random.random())
+
+            self._conflicts += 1
+            raise VersionConflict(f"Account {account_ID} is too contended: gave up after {self._max_retries} retries")
+        except BaseException:
+            self._connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+    def post_locked(self, account_ID: int, amount: float, transaction_type: TransactionType) -> float:
+        """Pessimistic variant of post(): locks the row (SELECT ... FOR UPDATE) for the whole write."""
+        self._validate(amount)
+        cursor = self._connection.cursor()
+        try:
+            if self._begin_locked:
+                cursor.execute(self._begin_locked)
+
+            row: tuple = self._read(cursor, self._select_locked, account_ID)
+            new_balance, fee = self._apply(row, amount, transaction_type)
+
+            cursor.execute(self._update, (new_balance, account_ID))
+            self._log_posting(cursor, account_ID, amount, transaction_type, fee)
+            self._connection.commit()
+            return new_balance
+        except BaseException:
+            self._connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+    @staticmethod
+    def _read(cursor, statement: str, account_ID: int) -> tuple:
+        cursor.execute(statement, (account_ID,))
+        rows = cursor.fetchall()
+        if not rows:
+            raise ValueError(f"Account {account_ID} not found")
+
+        return (float(rows[0][0]),) + tuple(rows[0][1:])
+
+
+    def _log_posting(self, cursor, account_ID: int, amount: float, transaction_type: TransactionType, fee: float) -> None:
+        cursor.execute(self._log, (account_ID, DB_TRANSACTION_TYPES[transaction_type], amount))
+        if fee:
+            # Recorded after the debit that triggered it, as CheckingAccount does
+            cursor.execute(self._log, (account_ID, DB_TRANSACTION_TYPES[TransactionType.EXTRA_FEE], fee))
+
+
+    @staticmethod
+    def _validate(amount: float) -> None:
+        if amount <= 0:
+            raise ValueError("Invalid transaction amount")
+
+
+    def _apply(self, row: tuple, amount: float, transaction_type: TransactionType) -> tuple[float, float]:
+        """(new balance, overdraft fee) for a posting on a stored row."""
+        balance, _, account_type, product_code = row
+        sign: int = SIGNS[transaction_type.value]
+        fee: float = 0
+        if sign < 0:
+            kind: type = ROW_TYPES[account_type]
+            terms = self._catalog.get(product_code).terms
+            if transaction_type in (TransactionType.MAINTENANCE_FEE, TransactionType.EXTRA_FEE):
+                # Fees never trigger an overdraft fee of their own; like Account._charge_fee they stop at the product's floor
+                floor: float = terms.overdraft_limit if issubclass(kind, CheckingAccount) else 0
+                if balance - amount < floor:
+                    raise ValueError("Fee not covered")
+            else:
+                fee = kind.debit_fee(balance, amount, terms)
+
+        return round(balance + sign * amount - fee, 2), fee
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def retries(self) -> int:
+        return self._retries
+
+    @property
+    def conflicts(self) -> int:
+        return self._conflicts
+
+
+def _state_of(account: Account) -> tuple[str | None, ...]:
+    # Values for the status and period columns, in _insert / _store order
+    posted: dict[str, str] = account._posted_periods or {}
+    return (account.status.value,) + tuple(posted.get(task) for task in POSTED_TASKS)
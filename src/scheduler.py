@@ -0,0 +1,292 @@
+"""
+Month-end batch processing: interest posting, maintenance fees and statements.
+
+The account population is split into chunks. For each chunk the job:
+1. posts interest (savings) and maintenance fees (every product with a fee)
+   serially on the caller's thread, since accounts are not thread-safe,
+2. renders statements on a thread or process pool (the only parallel step),
+3. checkpoints the chunk.
+Each account records the last period every task was posted for, so posting
+a period twice is a no-op even without a checkpoint file. Once a period has
+ended, its interest and fees are stamped at the period's last microsecond so
+they land in that period's statement (an account that already has later
+postings keeps the posting time, so its log stays in time order). The optional
+checkpoint is an append-only journal (one line per posted account, one per
+finished chunk) that lets a crashed run skip work it already did.
+"""
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Iterator, Sequence
+
+from .account import Account, SavingsAccount
+from .reconciliation import SIGNS
+
+TASKS: tuple[str, ...] = ("interest", "fees", "statements")
+# Tasks recorded in Account._posted_periods; snapshots, archives and the repository store one period per task
+POSTED_TASKS: tuple[str, ...] = ("interest", "fees")
+EXECUTORS: tuple[str, ...] = ("thread", "process")
+_PERIOD = re.compile(r"\d{4}-(0[1-9]|1[0-2])")
+
+# (account_ID, account type name, balance, ((timestamp, type value, amount), ...))
+StatementRecord = tuple[int, str, float, tuple[tuple[str, str, float], ...]]
+
+
+def period_end(period: str) -> datetime:
+    """Last microsecond of a "YYYY-MM" period; any other format raises ValueError."""
+    if not _PERIOD.fullmatch(period):
+        raise ValueError(f"Invalid period '{period}' (expected YYYY-MM)")
+
+    year, month = int(period[:4]), int(period[5:])
+    return datetime(year + month // 12, month % 12 + 1, 1) - timedelta(microseconds=1)
+
+
+class JobReport:
+    def __init__(self, period: str):
+        self.period: str = period
+        self.interest_posted: int = 0
+        self.fees_charged: int = 0
+        self.statements: dict[int, str] = {}
+        self.skipped: int = 0
+        self.chunks: int = 0
+        self.elapsed: float = 0.0
+
+    def __repr__(self) -> str:
+        return (f"JobReport(period={self.period}, interest={self.interest_posted}, fees={self.fees_charged}, "
+                f"statements={len(self.statements)}, skipped={self.skipped}, elapsed={self.elapsed:.2f}s)")
+
+
+class _Checkpoint:
+    """
+    Per-period journal of which accounts were posted and which got statements.
+    The first line names the period; each later line adds IDs, so saving
+    costs only the new IDs.
+    """
+
+    def __init__(self, path: str | None, period: str):
+        self._path: str | None = path
+        self._period: str = period
+        self.posted: set[int] = set()
+        self.completed: set[int] = set()
+        self._file = None
+
+        resume: bool = False
+        if path and os.path.exists(path):
+            with open(path) as file:
+                lines: list[str] = file.read().splitlines()
+
+            # A journal from another period means that period finished; start fresh
+            if lines and _parse(lines[0]).get("period") == period:
+                resume = True
+                for line in lines[1:]:
+                    entry: dict = _parse(line)
+                    self.posted.update(entry.get("posted", ()))
+                    self.completed.update(entry.get("completed", ()))
+
+        if path:
+            self._file = open(path, "a" if resume else "w")
+            if not resume:
+                self._write({"period": period})
+
+
+    def _write(self, entry: dict) -> None:
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+
+    def add_posted(self, account_ID: int) -> None:
+        self.posted.add(account_ID)
+        if self._file is not None:
+            self._write({"posted": [account_ID]})
+
+
+    def add_completed(self, account_IDs: list[int]) -> None:
+        self.completed.update(account_IDs)
+        if self._file is not None:
+            self._write({"completed": account_IDs})
+
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _parse(line: str) -> dict:
+    # A crash can leave the last line half-written; it only loses that line's IDs
+    try:
+        return json.loads(line)
+    except ValueError:
+        return {}
+
+
+class MonthEndJob:
+    def __init__(self, period: str, tasks: Sequence[str] = TASKS, chunk_size: int = 1000, workers: int = 4,
+                 executor: str = "thread", checkpoint_path: str | None = None, statement_dir: str | None = None):
+
+        unknown = set(tasks) - set(TASKS)
+        if unknown:
+            raise ValueError(f"Unknown tasks: {', '.join(sorted(unknown))}")
+
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}")
+
+        if chunk_size < 1 or workers < 1:
+            raise ValueError("chunk_size and workers must be positive")
+
+        self._period: str = period
+        self._period_end: datetime = period_end(period)
+        self._tasks: frozenset[str] = frozenset(tasks)
+        self._chunk_size: int = chunk_size
+        self._workers: int = workers
+        self._executor: str = executor
+        self._checkpoint_path: str | None = checkpoint_path
+        self._statement_dir: str | None = statement_dir
+
+
+    def run(self, accounts: Sequence[Account]) -> JobReport:
+        report: JobReport = JobReport(self._period)
+        start: float = time.perf_counter()
+        pool_type = ThreadPoolExecutor if self._executor == "thread" else ProcessPoolExecutor
+        self._checkpoint: _Checkpoint = _Checkpoint(self._checkpoint_path, self._period)
+        self._period_closed: bool = self._period_end <= datetime.now()
+
+        try:
+            self._run(accounts, pool_type, report)
+        finally:
+            self._checkpoint.close()
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+
+    def _run(self, accounts: Sequence[Account], pool_type: type, report: JobReport) -> None:
+        with pool_type(max_workers=self._workers) as pool:
+            pending: deque[tuple[Future, list[int]]] = deque()
+
+            for chunk in self._chunks(accounts, report):
+                self._post(chunk, report)
+
+                if "statements" in self._tasks:
+                    records: list[StatementRecord] = [_statement_record(account) for account in chunk]
+                    pending.append((pool.submit(render_statements, records, self._period),
+                                    [account.account_ID for account in chunk]))
+                    # Bound the number of chunks in flight
+                    if len(pending) >= self._workers * 2:
+                        self._complete(*pending.popleft(), report)
+                else:
+                    self._complete(None, [account.account_ID for account in chunk], report)
+
+            while pending:
+                self._complete(*pending.popleft(), report)
+
+
+    def _chunks(self, accounts: Sequence[Account], report: JobReport) -> Iterator[list[Account]]:
+        chunk: list[Account] = []
+        for account in accounts:
+            if account.account_ID in self._checkpoint.completed:
+                report.skipped += 1
+                continue
+
+            chunk.append(account)
+            if len(chunk) == self._chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+
+    def _post(self, chunk: list[Account], report: JobReport) -> None:
+        for account in chunk:
+            if account.account_ID in self._checkpoint.posted:
+                continue
+
+            stamp: datetime | None = self._stamp(account)
+            if "interest" in self._tasks and isinstance(account, SavingsAccount) and self._due(account, "interest"):
+                before: int = account.transaction_count
+                account.apply_interest(stamp)
+                self._mark(account, "interest")
+                report.interest_posted += account.transaction_count - before
+
+            if "fees" in self._tasks and hasattr(account, "apply_maintenance_fee") and self._due(account, "fees"):
+                charged: float = account.apply_maintenance_fee(stamp)
+                self._mark(account, "fees")
+                if charged:
+                    report.fees_charged += 1
+
+            # Postings are durable before statements are rendered
+            self._checkpoint.add_posted(account.account_ID)
+
+
+    def _stamp(self, account: Account) -> datetime | None:
+        # None = post at the current time (the period is still open, or the account has later postings)
+        if not self._period_closed:
+            return None
+
+        last: datetime | None = account._last_timestamp()
+        return self._period_end if last is None or last <= self._period_end else None
+
+
+    def _due(self, account: Account, task: str) -> bool:
+        posted: dict[str, str] | None = account._posted_periods
+        return posted is None or posted.get(task) != self._period
+
+
+    def _mark(self, account: Account, task: str) -> None:
+        if account._posted_periods is None:
+            account._posted_periods = {}
+        account._posted_periods[task] = self._period
+
+
+    def _complete(self, future: Future | None, account_IDs: list[int], report: JobReport) -> None:
+        if future is not None:
+            statements: dict[int, str] = future.result()
+            if self._statement_dir:
+                self._write_statements(statements)
+            else:
+                report.statements.update(statements)
+
+        self._checkpoint.add_completed(account_IDs)
+        report.chunks += 1
+
+
+    def _write_statements(self, statements: dict[int, str]) -> None:
+        directory: str = os.path.join(self._statement_dir, self._period)
+        os.makedirs(directory, exist_ok=True)
+
+        for account_ID, text in statements.items():
+            with open(os.path.join(directory, f"{account_ID}.txt"), "w") as file:
+                file.write(text)
+
+
+def _statement_record(account: Account) -> StatementRecord:
+    history = tuple((str(tx.timestamp), tx.transaction_type.value, tx.amount) for tx in account.view_transaction_history())
+    return account.account_ID, type(account).__name__, account.balance, history
+
+
+def render_statements(records: list[StatementRecord], period: str) -> dict[int, str]:
+    """
+    Pool worker: formats one statement per account from plain tuples.
+    Only postings timestamped in `period` ("YYYY-MM") are listed; the closing
+    balance is the live balance less every posting made after the period.
+    """
+    period_end(period)
+    statements: dict[int, str] = {}
+    for account_ID, account_type, balance, history in records:
+        entries = [entry for entry in history if entry[0][:7] == period]
+        closing: float = balance - sum(SIGNS[type_value] * amount for timestamp, type_value, amount in history
+                                       if timestamp[:7] > period)
+        opening: float = closing - sum(SIGNS[type_value] * amount for _, type_value, amount in entries)
+
+        lines: list[str] = [f"Statement {period} - Account {account_ID} ({account_type})",
+                            f"Opening balance: ${round(opening, 2)}"]
+        lines.extend(f"{timestamp} - {type_value} - ${amount}" for timestamp, type_value, amount in entries)
+        lines.append(f"Closing balance: ${round(closing, 2)}")
+        statements[account_ID] = "\n".join(lines) + "\n"
+
+    return statements
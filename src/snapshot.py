@@ -0,0 +1,442 @@
+"""
+Compact binary snapshot of the in-memory bank.
+
+Layout (native byte order, recorded in the header):
+- Header: magic, format version, byte order, row counts.
+- Section table: (offset, length) for every column below.
+- Columns, each 8-byte aligned:
+    strings      utf-8 blob + int64 offsets (names, emails, product codes)
+    customers    id, first/last/email string index
+    accounts     id, customer id (-1 = none), kind (0 savings, 1 checking,
+                 1 + n striped checking with n stripes), product index,
+                 currency index, status, balance, int64 offsets into the
+                 transaction columns
+    transactions type, amount, timestamp (microseconds since 1970-01-01),
+                 other-leg amount and currency index + 1 (0 = not cross-currency),
+                 32-byte audit chain hash
+    posted       per month-end task, the last period posted as a string
+                 index + 1 (0 = never), so a restored bank is not posted twice
+
+Columns are written straight from `array` buffers and loaded with mmap +
+memoryview.cast, so loading never parses individual fields. restore()
+builds accounts whose audit logs materialize their Transaction objects on
+first use, so restore cost tracks the number of accounts, not transactions.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from .account import Account, AccountStatus, SavingsAccount, CheckingAccount
+from .audit_log import AuditLog, Checkpoint, GENESIS, HASH_SIZE, chain_hash
+from .customer import Customer
+from .product import ProductCatalog, DEFAULT_CATALOG
+from .scheduler import POSTED_TASKS
+from .striping import StripedCheckingAccount
+from .transaction import Transaction, TransactionType
+
+MAGIC: bytes = b"SBNKSNAP"
+FORMAT_VERSION: int = 6
+# Version 4 files never have a striped kind; versions 4 and 5 end before the posted sections
+READABLE_VERSIONS: tuple[int, ...] = (4, 5, FORMAT_VERSION)
+
+_HEADER: struct.Struct = struct.Struct("<8sIIQQQQ")  # magic, version, byte order, customers, accounts, transactions, strings
+_SECTION: struct.Struct = struct.Struct("<QQ")        # offset, length
+
+# Section name -> array typecode
+SECTIONS: tuple[tuple[str, str], ...] = (
+    ("string_blob", "B"),
+    ("string_offsets", "q"),
+    ("customer_id", "q"),
+    ("customer_first", "I"),
+    ("customer_last", "I"),
+    ("customer_email", "I"),
+    ("account_id", "q"),
+    ("account_customer", "q"),
+    ("account_kind", "B"),
+    ("account_product", "I"),
+    ("account_currency", "I"),
+    ("account_status", "B"),
+    ("account_balance", "d"),
+    ("account_tx_offsets", "q"),
+    ("tx_type", "B"),
+    ("tx_amount", "d"),
+    ("tx_time", "q"),
+    ("tx_fx_amount", "d"),
+    ("tx_fx_currency", "I"),
+    ("tx_chain", "B"),
+) + tuple((f"account_{task}_period", "I") for task in POSTED_TASKS)
+_POSTED_SINCE: int = 6
+
+ACCOUNT_KINDS: tuple[type, ...] = (SavingsAccount, CheckingAccount)
+# Kinds above the plain ones are striped checking accounts; the kind carries the stripe count
+MAX_STRIPES: int = 255 - len(ACCOUNT_KINDS) + 1
+TRANSACTION_TYPES: tuple[TransactionType, ...] = tuple(TransactionType)
+ACCOUNT_STATUSES: tuple[AccountStatus, ...] = tuple(AccountStatus)
+
+_TYPE_INDEX: dict[TransactionType, int] = {transaction_type: index for index, transaction_type in enumerate(TRANSACTION_TYPES)}
+_EPOCH: datetime = datetime(1970, 1, 1)
+_MICROSECOND: timedelta = timedelta(microseconds=1)
+_STATUS_INDEX: dict[AccountStatus, int] = {status: index for index, status in enumerate(ACCOUNT_STATUSES)}
+_BYTE_ORDERS: dict[str, int] = {"little": 0, "big": 1}
+
+
+class _StringTable:
+    def __init__(self):
+        self._index: dict[str, int] = {}
+        self.blob: bytearray = bytearray()
+        self.offsets: array = array("q", [0])
+
+    def add(self, value: str) -> int:
+        index: int | None = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self._index)
+            self.blob += value.encode("utf-8")
+            self.offsets.append(len(self.blob))
+
+        return index
+
+
+def write_snapshot(path: str, customers: Iterable[Customer], orphan_accounts: Iterable[Account] = ()) -> None:
+    """
+    Writes every customer, their accounts (and any unowned accounts) with full
+    history. Accounts a customer has in an AccountArchive are written too.
+    """
+    strings: _StringTable = _StringTable()
+    columns: dict[str, array] = {name: array(typecode) for name, typecode in SECTIONS if name not in ("string_blob", "string_offsets")}
+    columns["account_tx_offsets"].append(0)
+
+    def add_account(account: Account, customer_ID: int) -> None:
+        kind: int = _kind_of(account)
+        columns["account_id"].append(account.account_ID)
+        columns["account_customer"].append(customer_ID)
+        columns["account_kind"].append(kind)
+        columns["account_product"].append(strings.add(account.product.code))
+        columns["account_currency"].append(strings.add(account.currency))
+        columns["account_status"].append(_STATUS_INDEX[account.status])
+        columns["account_balance"].append(account.balance)
+        posted: dict[str, str] = account._posted_periods or {}
+        for task in POSTED_TASKS:
+            period: str | None = posted.get(task)
+            columns[f"account_{task}_period"].append(0 if period is None else strings.add(period) + 1)
+
+        tx_type, tx_amount, tx_time = columns["tx_type"], columns["tx_amount"], columns["tx_time"]
+        tx_fx_amount, tx_fx_currency = columns["tx_fx_amount"], columns["tx_fx_currency"]
+        history: list[Transaction] = account.view_transaction_history()
+        for transaction in history:
+            tx_type.append(_TYPE_INDEX[transaction.transaction_type])
+            tx_amount.append(transaction.amount)
+            tx_time.append((transaction.timestamp - _EPOCH) // _MICROSECOND)
+            if transaction.fx_currency is None:
+                tx_fx_amount.append(0.0)
+                tx_fx_currency.append(0)
+            else:
+                tx_fx_amount.append(transaction.fx_amount)
+                tx_fx_currency.append(strings.add(transaction.fx_currency) + 1)
+
+        columns["tx_chain"].frombytes(_chain_of(account, history))
+        columns["account_tx_offsets"].append(len(tx_amount))
+
+    customer_count: int = 0
+    for customer in customers:
+        customer_count += 1
+        columns["customer_id"].append(customer.customer_ID)
+        columns["customer_first"].append(strings.add(customer.first_name))
+        columns["customer_last"].append(strings.add(customer.last_name))
+        columns["customer_email"].append(strings.add(customer.email))
+        for account in customer.accounts:
+            add_account(account, customer.customer_ID)
+        if customer._archive is not None:
+            for account in customer._archive.accounts_of(customer.customer_ID):
+                add_account(account, customer.customer_ID)
+
+    for account in orphan_accounts:
+        if account.customer_ID is not None:
+            raise ValueError(f"Account {account.account_ID} belongs to customer {account.customer_ID}")
+        add_account(account, -1)
+
+    columns["string_blob"] = array("B", bytes(strings.blob))
+    columns["string_offsets"] = strings.offsets
+
+    header: bytes = _HEADER.pack(MAGIC, FORMAT_VERSION, _BYTE_ORDERS[sys.byteorder], customer_count,
+                                 len(columns["account_id"]), len(columns["tx_amount"]), len(strings.offsets) - 1)
+
+    # Lay sections out after the header and section table, 8-byte aligned
+    offset: int = _align(_HEADER.size + _SECTION.size * len(SECTIONS))
+    table: list[tuple[int, int]] = []
+    for name, _ in SECTIONS:
+        length: int = len(columns[name]) * columns[name].itemsize
+        table.append((offset, length))
+        offset = _align(offset + length)
+
+    with open(path, "wb") as file:
+        file.write(header)
+        for section_offset, length in table:
+            file.write(_SECTION.pack(section_offset, length))
+
+        for (name, _), (section_offset, length) in zip(SECTIONS, table):
+            file.write(b"\0" * (section_offset - file.tell()))
+            file.write(memoryview(columns[name]))
+
+
+def load_snapshot(path: str) -> 'BankSnapshot':
+    return BankSnapshot(path)
+
+
+class BankSnapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file.
+    Columns are exposed as typed memoryviews (no copying or parsing).
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._mmap: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._columns: dict[str, memoryview] = {}
+        try:
+            self._load_columns(memoryview(self._mmap))
+        except ValueError:
+            self.close()
+            raise
+
+
+    def _load_columns(self, buffer: memoryview) -> None:
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Invalid snapshot: file too short")
+
+        magic, version, byte_order, customers, accounts, transactions, strings = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Invalid snapshot: bad magic")
+        if version not in READABLE_VERSIONS:
+            raise ValueError(f"Unsupported snapshot version {version}")
+        if byte_order != _BYTE_ORDERS[sys.byteorder]:
+            raise ValueError("Snapshot was written on a machine with a different byte order")
+
+        expected_rows: dict[str, int] = {
+            "string_offsets": strings + 1,
+            "customer_id": customers, "customer_first": customers, "customer_last": customers, "customer_email": customers,
+            "account_id": accounts, "account_customer": accounts, "account_kind": accounts,
+            "account_product": accounts, "account_currency": accounts, "account_status": accounts, "account_balance": accounts,
+            "account_tx_offsets": accounts + 1,
+            "tx_type": transactions, "tx_amount": transactions, "tx_time": transactions,
+            "tx_fx_amount": transactions, "tx_fx_currency": transactions, "tx_chain": transactions * HASH_SIZE,
+        }
+        expected_rows.update((f"account_{task}_period", accounts) for task in POSTED_TASKS)
+
+        sections = SECTIONS if version >= _POSTED_SINCE else SECTIONS[:-len(POSTED_TASKS)]
+        for index, (name, typecode) in enumerate(sections):
+            offset, length = _SECTION.unpack_from(buffer, _HEADER.size + index * _SECTION.size)
+            if offset + length > len(buffer):
+                raise ValueError(f"Invalid snapshot: section {name} out of bounds")
+
+            column: memoryview = buffer[offset:offset + length].cast(typecode)
+            if name in expected_rows and len(column) != expected_rows[name]:
+                raise ValueError(f"Invalid snapshot: section {name} has {len(column)} rows")
+            self._columns[name] = column
+
+        self._customer_count: int = customers
+        self._account_count: int = accounts
+        self._transaction_count: int = transactions
+
+
+    def column(self, name: str) -> memoryview:
+        return self._columns[name]
+
+
+    def string(self, index: int) -> str:
+        offsets: memoryview = self._columns["string_offsets"]
+        return bytes(self._columns["string_blob"][offsets[index]:offsets[index + 1]]).decode("utf-8")
+
+
+    def transactions_between(self, start: int, end: int) -> list[Transaction]:
+        tx_type = self._columns["tx_type"][start:end]
+        tx_amount = self._columns["tx_amount"][start:end]
+        tx_time = self._columns["tx_time"][start:end]
+        tx_fx_currency = self._columns["tx_fx_currency"][start:end]
+        restore = Transaction._restore
+
+        transactions: list[Transaction] = [restore(TRANSACTION_TYPES[kind], amount, _EPOCH + micros * _MICROSECOND)
+                                           for kind, amount, micros in zip(tx_type, tx_amount, tx_time)]
+
+        # Cross-currency legs are rare; patch them in rather than branching per row above
+        if any(tx_fx_currency):
+            tx_fx_amount = self._columns["tx_fx_amount"][start:end]
+            for index, currency in enumerate(tx_fx_currency):
+                if currency:
+                    transaction = transactions[index]
+                    transaction._fx_amount = tx_fx_amount[index]
+                    transaction._fx_currency = self.string(currency - 1)
+
+        return transactions
+
+
+    def chain_between(self, start: int, end: int) -> bytes:
+        return bytes(self._columns["tx_chain"][start * HASH_SIZE:end * HASH_SIZE])
+
+
+    def restore(self, catalog: ProductCatalog = DEFAULT_CATALOG, lazy: bool = True) -> tuple[list[Customer], dict[int, Account]]:
+        """
+        Rebuilds customers and accounts.
+        With lazy=True audit logs load their transactions on first use, so the
+        snapshot must stay open until then; lazy=False loads them all now.
+        """
+        string = self.string
+        columns = self._columns
+
+        customers: dict[int, Customer] = {}
+        for row in range(self._customer_count):
+            customer_ID: int = columns["customer_id"][row]
+            customers[customer_ID] = Customer(customer_ID, string(columns["customer_first"][row]),
+                                              string(columns["customer_last"][row]), string(columns["customer_email"][row]))
+
+        products: dict[int, object] = {}
+        currencies: dict[int, str] = {}
+        accounts: dict[int, Account] = {}
+        tx_offsets: memoryview = columns["account_tx_offsets"]
+        periods: dict[str, memoryview] = {task: columns[f"account_{task}_period"] for task in POSTED_TASKS
+                                          if f"account_{task}_period" in columns}
+
+        for row in range(self._account_count):
+            product_index: int = columns["account_product"][row]
+            product = products.get(product_index)
+            if product is None:
+                product = products[product_index] = catalog.get(string(product_index))
+
+            currency_index: int = columns["account_currency"][row]
+            currency: str | None = currencies.get(currency_index)
+            if currency is None:
+                currency = currencies[currency_index] = string(currency_index)
+
+            kind: int = columns["account_kind"][row]
+            if kind < len(ACCOUNT_KINDS):
+                account: Account = ACCOUNT_KINDS[kind](columns["account_id"][row], product, currency)
+            else:
+                account = StripedCheckingAccount(columns["account_id"][row], kind - len(ACCOUNT_KINDS) + 1, product, currency)
+            account._balance = columns["account_balance"][row]
+            account._status = ACCOUNT_STATUSES[columns["account_status"][row]]
+            posted: dict[str, str] = {task: string(periods[task][row] - 1) for task in periods if periods[task][row]}
+            if posted:
+                account._posted_periods = posted
+            if lazy:
+                account._audit_log = _SnapshotAuditLog(self, tx_offsets[row], tx_offsets[row + 1])
+            else:
+                start, end = tx_offsets[row], tx_offsets[row + 1]
+                account._audit_log = AuditLog._restore(self.transactions_between(start, end), self.chain_between(start, end))
+
+            owner: int = columns["account_customer"][row]
+            if owner >= 0:
+                customers[owner].open_account(account)
+            accounts[account.account_ID] = account
+
+        return list(customers.values()), accounts
+
+
+    def close(self) -> None:
+        for column in self._columns.values():
+            column.release()
+        self._columns.clear()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # A column slice handed out by column() is still alive; the map closes when it goes
+            pass
+
+
+    def __enter__(self) -> 'BankSnapshot':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def customer_count(self) -> int:
+        return self._customer_count
+
+    @property
+    def account_count(self) -> int:
+        return self._account_count
+
+    @property
+    def transaction_count(self) -> int:
+        return self._transaction_count
+
+
+class _SnapshotAuditLog(AuditLog):
+    """
+    Audit log backed by a snapshot range.
+    Transaction objects and the Merkle tree are built the first time the log
+    is read, verified or appended to; until then it only holds (snapshot, start, end).
+    """
+
+    def __init__(self, snapshot: BankSnapshot, start: int, end: int):
+        self._source: tuple[BankSnapshot, int, int] | None = (snapshot, start, end)
+        self._loaded: AuditLog | None = None
+
+
+    def _load(self) -> AuditLog:
+        if self._loaded is None:
+            snapshot, start, end = self._source
+            self._loaded = AuditLog._restore(snapshot.transactions_between(start, end), snapshot.chain_between(start, end))
+            self._source = None
+
+        return self._loaded
+
+
+    @property
+    def _transactions(self) -> list[Transaction]:
+        return self._load()._transactions
+
+    @property
+    def _levels(self) -> list[bytearray]:
+        return self._load()._levels
+
+    @property
+    def _checkpoints(self) -> list[Checkpoint]:
+        return self._load()._checkpoints
+
+
+    def __len__(self) -> int:
+        if self._loaded is None:
+            _, start, end = self._source
+            return end - start
+
+        return len(self._loaded)
+
+
+def _chain_of(account: Account, history: list[Transaction]) -> bytes:
+    log: AuditLog = account._audit_log
+    if len(log) == len(history):
+        return log.chain
+
+    # Striped accounts keep one chain per stripe; chain the merged history instead
+    chain: bytearray = bytearray()
+    previous: bytes = GENESIS
+    for transaction in history:
+        previous = chain_hash(previous, transaction)
+        chain += previous
+    return bytes(chain)
+
+
+def _kind_of(account: Account) -> int:
+    if isinstance(account, StripedCheckingAccount):
+        if account.stripe_count > MAX_STRIPES:
+            raise ValueError(f"Cannot snapshot more than {MAX_STRIPES} stripes")
+        return len(ACCOUNT_KINDS) + account.stripe_count - 1
+
+    for kind, account_type in enumerate(ACCOUNT_KINDS):
+        if isinstance(account, account_type):
+            return kind
+
+    raise ValueError(f"Cannot snapshot account type {type(account).__name__}")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
@@ -0,0 +1,170 @@
+"""
+Striped checking accounts for high-contention (merchant settlement) accounts.
+
+A StripedCheckingAccount spreads credits over N stripes, each with its own
+lock, sub-balance and sub-AuditLog, so concurrent credits only contend when
+they land on the same stripe. Reads merge lazily:
+- balance is the base balance plus every stripe's sub-balance,
+- view_transaction_history() merges the base and stripe logs by timestamp.
+Debits (withdrawals, outgoing transfers, fees) take every stripe lock, fold
+the stripes into the base balance and then run the normal CheckingAccount
+rules, so the overdraft limit is always checked against the full total.
+"""
+import heapq
+import itertools
+import threading
+from datetime import datetime
+from operator import attrgetter
+
+from .account import Account, CheckingAccount
+from .audit_log import AuditLog
+from .events import PostingEvent
+from .fx import DEFAULT_CURRENCY
+from .product import Product
+from .transaction import Transaction, TransactionType
+
+_BY_TIMESTAMP = attrgetter("timestamp")
+
+
+class _Stripe:
+    __slots__ = ("lock", "balance", "audit_log")
+
+    def __init__(self):
+        self.lock: threading.Lock = threading.Lock()
+        self.balance: float = 0.0
+        self.audit_log: AuditLog = AuditLog()
+
+
+class StripedCheckingAccount(CheckingAccount):
+    __slots__ = ("_stripes", "_cursor", "_fold_lock")
+
+    def __init__(self, account_ID: int, stripes: int = 8, product: Product | None = None, currency: str = DEFAULT_CURRENCY):
+        if stripes < 1:
+            raise ValueError("stripes must be positive")
+
+        super().__init__(account_ID, product, currency)
+        self._stripes: tuple[_Stripe, ...] = tuple(_Stripe() for _ in range(stripes))
+        # next() on itertools.count is atomic under the GIL: a lock-free round robin
+        self._cursor = itertools.count()
+        # Held by folds and balance reads, never by credits
+        self._fold_lock: threading.Lock = threading.Lock()
+
+
+    def _deposit_helper(self, amount: float, transaction_type: TransactionType, fx: tuple[float, str] | None = None,
+                        timestamp: datetime | None = None) -> None:
+        if amount <= 0:
+            raise ValueError("Invalid deposit amount")
+
+        views = Account._read_views
+        if views is not None and views.needs(self):
+            # Credits bypass the views' writers' lock: fold so the pre-image is taken with no credit half-applied
+            with self._fold_lock:
+                self._fold()
+                try:
+                    views.before_write(self)
+                finally:
+                    self._release_stripes()
+
+        stripe: _Stripe = self._stripes[next(self._cursor) % len(self._stripes)]
+        fx_amount, fx_currency = fx or (None, None)
+
+        with stripe.lock:
+            # Timestamped under the lock, so each stripe's log stays in time order for the merges below
+            new_tx: Transaction = Transaction(transaction_type, amount, fx_amount, fx_currency, timestamp)
+            stripe.balance += amount
+            stripe.audit_log.log_transaction(new_tx)
+
+        if self._event_bus is not None:
+            self._publish(new_tx)
+
+
+    def _withdraw_helper(self, amount: float, transaction_type: TransactionType, fx: tuple[float, str] | None = None) -> None:
+        with self._fold_lock:
+            self._fold()
+            try:
+                super()._withdraw_helper(amount, transaction_type, fx)
+            finally:
+                self._release_stripes()
+
+
+    def apply_maintenance_fee(self, timestamp: datetime | None = None) -> float:
+        with self._fold_lock:
+            self._fold()
+            try:
+                return super().apply_maintenance_fee(timestamp)
+            finally:
+                self._release_stripes()
+
+
+    def close(self) -> None:
+        # Credits may still sit in the stripes: fold them so the zero-balance check sees the full total
+        with self._fold_lock:
+            self._fold()
+            try:
+                super().close()
+            finally:
+                self._release_stripes()
+
+
+    def _fold(self) -> None:
+        # Caller holds _fold_lock; stripes stay locked until _release_stripes()
+        for stripe in self._stripes:
+            stripe.lock.acquire()
+
+        for stripe in self._stripes:
+            self._balance += stripe.balance
+            stripe.balance = 0.0
+
+
+    def _release_stripes(self) -> None:
+        for stripe in reversed(self._stripes):
+            stripe.lock.release()
+
+
+    def _merged_balance(self) -> float:
+        return self._balance + sum(stripe.balance for stripe in self._stripes)
+
+
+    def _publish(self, transaction: Transaction) -> None:
+        # May run with the stripes locked (inside a debit), so read without locking
+        self._event_bus.publish(PostingEvent(self._account_ID, self._customer_ID, transaction, self._merged_balance()))
+
+
+    def view_transaction_history(self) -> list[Transaction]:
+        logs: list[list[Transaction]] = [self._audit_log.transactions]
+        logs.extend(stripe.audit_log.transactions for stripe in self._stripes)
+        return list(heapq.merge(*logs, key=_BY_TIMESTAMP))
+
+
+    def _last_timestamp(self) -> datetime | None:
+        stamps = [log.last_timestamp for log in (self._audit_log, *(stripe.audit_log for stripe in self._stripes))]
+        return max((stamp for stamp in stamps if stamp is not None), default=None)
+
+
+    def _view_state(self) -> tuple[float, int]:
+        # Lock-free: called inside folds, which already hold every stripe lock
+        return self._merged_balance(), self.transaction_count
+
+
+    def _history_prefix(self, count: int) -> list[Transaction]:
+        # Entries are timestamped on creation, so later credits merge in after the first `count`
+        return self.view_transaction_history()[:count]
+
+
+    # =======================
+    #   Getters (Read-only)
+    # =======================
+
+    @property
+    def balance(self) -> float:
+        # Excludes folds so nothing is counted twice; credits keep flowing meanwhile
+        with self._fold_lock:
+            return self._merged_balance()
+
+    @property
+    def transaction_count(self) -> int:
+        return len(self._audit_log) + sum(len(stripe.audit_log) for stripe in self._stripes)
+
+    @property
+    def stripe_count(self) -> int:
+        return len(self._stripes)
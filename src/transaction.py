@@ -8,18 +8,44 @@ class TransactionType(Enum):
     TRANSFER_SENT = "TRANSFER SENT"
     TRANSFER_RECEIVED = "TRANSFER RECEIVED"
     INTEREST_APPLIED = "INTEREST APPLIED"
-    EXTRA_FEE = "EXTRA FEE"
+    EXTRA_FEE = "EXTRA FEE"              # Overdraft fee
+    MAINTENANCE_FEE = "MAINTENANCE FEE"  # Monthly product fee (month-end processing)
 
 
 class Transaction:
-    def __init__(self, transaction_type: TransactionType, amount: float):
+    # Other leg of a cross-currency transfer; only set on those postings, so
+    # single-currency transactions carry no extra per-instance state
+    _fx_amount: float | None = None
+    _fx_currency: str | None = None
+
+    def __init__(self, transaction_type: TransactionType, amount: float,
+                 fx_amount: float | None = None, fx_currency: str | None = None, timestamp: datetime | None = None):
         
         if amount <= 0:
             raise ValueError("Invalid transaction amount")
         
         self._transaction_type: TransactionType = transaction_type
         self._amount: float = amount
-        self._timestamp: datetime = datetime.now()
+        # Month-end postings pass their period's end (see scheduler.py)
+        self._timestamp: datetime = timestamp or datetime.now()
+
+        if fx_currency is not None:
+            self._fx_amount = fx_amount
+            self._fx_currency = fx_currency
+
+
+    @classmethod
+    def _restore(cls, transaction_type: TransactionType, amount: float, timestamp: datetime,
+                 fx_amount: float | None = None, fx_currency: str | None = None) -> 'Transaction':
+        # Rebuilds a stored record with its original timestamp (used by snapshot restore)
+        transaction: Transaction = cls.__new__(cls)
+        transaction._transaction_type = transaction_type
+        transaction._amount = amount
+        transaction._timestamp = timestamp
+        if fx_currency is not None:
+            transaction._fx_amount = fx_amount
+            transaction._fx_currency = fx_currency
+        return transaction
 
 
     # =======================
@@ -38,6 +64,31 @@ class Transaction:
     def timestamp(self) -> datetime:
         return self._timestamp
 
+    @property
+    def fx_amount(self) -> float | None:
+        return self._fx_amount
+
+    @property
+    def fx_currency(self) -> str | None:
+        return self._fx_currency
+
+    @property
+    def original_amount(self) -> float:
+        # What the sender instructed: for a converted TRANSFER RECEIVED, the amount before conversion
+        if self._fx_currency is not None and self._transaction_type is TransactionType.TRANSFER_RECEIVED:
+            return self._fx_amount
+        return self._amount
+
+    @property
+    def converted_amount(self) -> float:
+        # What the receiver got: for a converted TRANSFER SENT, the amount after conversion
+        if self._fx_currency is not None and self._transaction_type is TransactionType.TRANSFER_SENT:
+            return self._fx_amount
+        return self._amount
+
     def __repr__(self) -> str:
+        if self._fx_currency is not None:
+            return (f"Transaction(type={self._transaction_type.name}, amount={self._amount}, "
+                    f"fx={self._fx_amount} {self._fx_currency}, time={self._timestamp})")
         return f"Transaction(type={self._transaction_type.name}, amount={self._amount}, time={self._timestamp})"
     
@@ -0,0 +1,127 @@
+import http.client
+import json
+import threading
+import unittest
+
+from src.api import BankService, serve
+
+class TestApi(unittest.TestCase):
+    """
+    Test suite for the REST/JSON service, over a real localhost connection.
+    """
+
+    def setUp(self):
+        self.server = serve(BankService(), port=0)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        # One connection for the whole test: every request reuses it (keep-alive)
+        self.connection = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=10)
+
+        self.request("POST", "/customers", {"customer_id": 1, "first_name": "Alice", "last_name": "Smith", "email": "alice@example.com"})
+        self.request("POST", "/accounts", {"customer_id": 1, "type": "savings", "account_id": 10})
+        self.request("POST", "/accounts", {"customer_id": 1, "type": "checking", "account_id": 11})
+
+    def tearDown(self):
+        self.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, method, path, body=None):
+        self.connection.request(method, path, body=json.dumps(body) if body is not None else None)
+        response = self.connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_postings_and_reads(self):
+        """Test deposit, transfer and the account, customer and balance reads."""
+        self.assertEqual(self.request("POST", "/accounts/10/deposit", {"amount": 100})[1]["balance"], 100.0)
+
+        status, result = self.request("POST", "/transfers", {"source": 10, "destination": 11, "amount": 40})
+        self.assertEqual(status, 200)
+        self.assertEqual((result["source"]["balance"], result["destination"]["balance"]), (60.0, 40.0))
+
+        self.assertEqual(self.request("GET", "/accounts/11/balance")[1], {"account_id": 11, "balance": 40.0, "currency": "USD"})
+        self.assertEqual(self.request("GET", "/accounts/10")[1]["transactions"], 2)
+        self.assertEqual(self.request("GET", "/customers/1")[1]["accounts"], [10, 11])
+
+    def test_errors(self):
+        """Test that engine errors are 400s and unknown resources are 404s."""
+        status, result = self.request("POST", "/accounts/10/withdraw", {"amount": 5})
+        self.assertEqual((status, result["error"]), (400, "Insufficient funds"))
+        self.assertEqual(self.request("POST", "/accounts/10/deposit", {})[0], 400)
+        self.assertEqual(self.request("GET", "/accounts/99")[0], 404)
+        self.assertEqual(self.request("GET", "/nowhere")[0], 404)
+
+        self.connection.request("POST", "/accounts/10/deposit", body=b"not json")
+        response = self.connection.getresponse()
+        self.assertEqual((response.status, json.loads(response.read())["error"]), (400, "Invalid JSON body"))
+
+        for body in (b'{"amount": NaN}', b'{"amount": Infinity}', b'{"amount": "-inf"}'):
+            self.connection.request("POST", "/accounts/10/deposit", body=body)
+            response = self.connection.getresponse()
+            self.assertEqual(response.status, 400)
+            response.read()
+        self.assertEqual(self.request("GET", "/accounts/10/balance")[1]["balance"], 0)
+
+    def test_fields_are_not_coerced(self):
+        """Test that wrongly typed fields are refused rather than converted."""
+        bad = [("/customers", {"customer_id": 2, "first_name": None, "last_name": "Jones", "email": "bob@example.com"}),
+               ("/accounts", {"customer_id": 1, "type": "savings", "account_id": 12.7}),
+               ("/accounts/10/deposit", {"amount": True}),
+               ("/transfers", {"source": "10", "destination": 11, "amount": 1})]
+        for path, body in bad:
+            status, result = self.request("POST", path, body)
+            self.assertEqual(status, 400)
+            self.assertIn("must be", result["error"])
+
+        self.assertEqual(self.request("GET", "/customers/2")[0], 404)
+        self.assertEqual(self.request("GET", "/customers/1")[1]["accounts"], [10, 11])
+
+    def test_bad_content_length(self):
+        """Test that a negative or oversized Content-Length is answered at once with 400."""
+        for length in ("-1", "-5", "12abc", str(2 ** 40)):
+            connection = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=10)
+            connection.putrequest("POST", "/accounts/10/deposit")
+            connection.putheader("Content-Length", length)
+            connection.endheaders()
+            response = connection.getresponse()
+            self.assertEqual(response.status, 400)
+            response.read()
+            connection.close()
+
+    def test_batch_reports_each_operation(self):
+        """Test that a batch runs every operation in order and keeps going past failures."""
+        operations = [{"op": "deposit", "account_id": 10, "amount": 1} for _ in range(50)]
+        operations += [{"op": ["deposit"]}, "deposit", {"op": "deposit", "account_id": 10, "amount": "nan"}]
+        operations += [{"op": "withdraw", "account_id": 10, "amount": 1000}, {"op": "balance", "account_id": 10}, {"op": "nope"}]
+
+        status, result = self.request("POST", "/batch", {"operations": operations})
+        results = result["results"]
+
+        self.assertEqual(status, 200)
+        self.assertEqual(len(results), 56)
+        self.assertEqual([result["ok"] for result in results[50:53]], [False, False, False])
+        self.assertEqual(results[-3], {"ok": False, "error": "Insufficient funds"})
+        self.assertEqual(results[-2]["result"]["balance"], 50.0)
+        self.assertFalse(results[-1]["ok"])
+
+    def test_history_pagination_and_stream(self):
+        """Test that cursor pages and the chunked stream both return the full history in order."""
+        self.request("POST", "/batch", {"operations": [{"op": "deposit", "account_id": 10, "amount": n} for n in range(1, 301)]})
+
+        amounts, cursor = [], ""
+        while cursor is not None:
+            page = self.request("GET", f"/accounts/10/history?limit=64&cursor={cursor}")[1]
+            amounts += [tx["amount"] for tx in page["transactions"]]
+            cursor = page["next_cursor"]
+        self.assertEqual(amounts, [float(n) for n in range(1, 301)])
+
+        self.connection.request("GET", "/accounts/10/history/stream")
+        response = self.connection.getresponse()
+        self.assertEqual(response.getheader("Transfer-Encoding"), "chunked")
+        lines = response.read().decode().splitlines()
+        self.assertEqual([json.loads(line)["amount"] for line in lines], amounts)
+
+        self.assertEqual(self.request("GET", "/accounts/10/history?limit=0")[0], 400)
+        self.assertEqual(self.request("GET", "/accounts/99/history/stream")[0], 404)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
+from datetime import datetime, timedelta
 
 from src import AuditLog, Transaction, TransactionType
+from src.audit_log import verify_inclusion
 
 class TestAuditLog(unittest.TestCase):
     """
@@ -38,6 +40,52 @@ class TestAuditLog(unittest.TestCase):
         with self.assertRaises(AssertionError):
             self.audit_log.log_transaction("Not a transaction object")
 
+    def fill(self, count, interval=4):
+        self.audit_log = AuditLog(checkpoint_interval=interval)
+        start = datetime(2026, 1, 1)
+        for index in range(count):
+            self.audit_log.log_transaction(Transaction._restore(TransactionType.DEPOSIT, index + 1.0, start + timedelta(days=index)))
+        return self.audit_log.transactions
+
+    def test_chain_detects_tampering(self):
+        """Test that editing a logged entry fails verification of any range containing it."""
+        transactions = self.fill(10)
+        self.assertTrue(self.audit_log.verify())
+        self.assertEqual([c.size for c in self.audit_log.checkpoints], [4, 8])
+
+        transactions[5]._amount = 1000.0
+        self.assertFalse(self.audit_log.verify())
+        self.assertFalse(self.audit_log.verify(4, 6))
+        # Ranges that skip the edited entry only rehash their own entries
+        self.assertTrue(self.audit_log.verify(0, 5))
+        self.assertTrue(self.audit_log.verify_between(datetime(2026, 1, 7), datetime(2026, 1, 10)))
+        self.assertFalse(self.audit_log.verify_between(datetime(2026, 1, 6), datetime(2026, 1, 6)))
+        self.assertEqual(self.audit_log.index_range(datetime(2026, 1, 6), datetime(2026, 1, 8, 12)), (5, 8))
+        self.assertEqual(self.audit_log.index_range(datetime(2027, 1, 1), datetime(2027, 2, 1)), (10, 10))
+
+    def test_verify_against_checkpoint(self):
+        """Test that a range verifies against an earlier checkpoint but not one it extends past."""
+        self.fill(10)
+        first = self.audit_log.checkpoints[0]
+
+        self.assertTrue(self.audit_log.verify(1, 3, checkpoint=first))
+        with self.assertRaises(ValueError):
+            self.audit_log.verify(2, 6, checkpoint=first)
+
+    def test_inclusion_proofs(self):
+        """Test that every entry proves into the root for every tree size, and a wrong entry does not."""
+        transactions = self.fill(13)
+        for size in range(1, 14):
+            root = self.audit_log.root(size)
+            for index in range(size):
+                proof = self.audit_log.prove(index, size)
+                self.assertTrue(verify_inclusion(transactions[index], proof, root))
+
+        proof = self.audit_log.prove(3)
+        self.assertFalse(verify_inclusion(transactions[4], proof, self.audit_log.root()))
+        with self.assertRaises(ValueError):
+            self.audit_log.prove(13)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
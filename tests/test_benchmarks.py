@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from benchmarks import suite
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """
+    Test suite for the benchmark runner (not the timings themselves).
+    """
+
+    def test_run_suite_selected_case(self):
+        """Test that a run produces machine-readable results for the selected case."""
+        result = suite.run_suite(repeat=1, only=["transaction_construct"])
+
+        self.assertEqual(list(result["results"]), ["transaction_construct"])
+        self.assertGreater(result["results"]["transaction_construct"]["ops_per_sec"], 0)
+        self.assertIn("python", result["meta"])
+
+    def test_compare_flags_regressions(self):
+        """Test that only cases slower than the threshold are reported."""
+        baseline = {"results": {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}}}
+        current = {"results": {"a": {"ops_per_sec": 95.0}, "b": {"ops_per_sec": 80.0}, "c": {"ops_per_sec": 1.0}}}
+
+        regressions = suite.compare(current, baseline, threshold=0.10)
+
+        self.assertEqual([r["case"] for r in regressions], ["b"])
+        self.assertAlmostEqual(regressions[0]["ratio"], 0.8)
+
+    @patch('sys.stderr', new_callable=StringIO)
+    def test_main_rejects_unknown_case(self, mock_stderr):
+        """Test that a misspelt --case name is an argparse error, not an empty run."""
+        with self.assertRaises(SystemExit) as raised:
+            suite.main(["--repeat", "1", "--case", "transaction_constuct"])
+
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn("transaction_constuct", mock_stderr.getvalue())
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_writes_json_and_compares(self, mock_stdout):
+        """Test the CLI round trip: save a baseline, then compare against it."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            args = ["--repeat", "1", "--case", "customer_get_account_10"]
+
+            self.assertEqual(suite.main(args + ["--save-baseline", path]), 0)
+            with open(path) as file:
+                self.assertIn("customer_get_account_10", json.load(file)["results"])
+
+            # A generous threshold must never report a regression against itself
+            self.assertEqual(suite.main(args + ["--baseline", path, "--threshold", "0.99"]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from src import Customer
+from src.directory import CustomerDirectory
+
+class TestCustomerDirectory(unittest.TestCase):
+    """
+    Test suite for the in-memory customer directory.
+    """
+
+    def setUp(self):
+        self.directory = CustomerDirectory()
+        for customer in (Customer(1, "John", "Smith", "john@example.com"),
+                         Customer(2, "Jane", "Smithers", "jane@example.com"),
+                         Customer(3, "Johanna", "Jones", "jo@example.com"),
+                         Customer(4, "Mary Ann", "Goldsmith", "mary@example.com")):
+            self.directory.add(customer)
+
+    def ids(self, customers):
+        return sorted(customer.customer_ID for customer in customers)
+
+    def test_exact_lookups(self):
+        """Test ID and case-insensitive email lookups."""
+        self.assertEqual(self.directory.get(2).first_name, "Jane")
+        self.assertEqual(self.directory.find_by_email(" JOHN@example.com").customer_ID, 1)
+        self.assertIsNone(self.directory.find_by_email("nobody@example.com"))
+        self.assertIn(3, self.directory)
+        self.assertEqual(len(self.directory), 4)
+
+    def test_duplicates_rejected(self):
+        """Test that a duplicate ID or email is rejected and nothing is indexed."""
+        with self.assertRaisesRegex(ValueError, "already registered"):
+            self.directory.add(Customer(5, "Jack", "Smith", "John@Example.com"))
+        with self.assertRaisesRegex(ValueError, "already taken"):
+            self.directory.add(Customer(1, "Jack", "Smith", "jack@example.com"))
+
+        self.assertTrue(self.directory.email_taken("john@example.com"))
+        self.assertEqual(self.ids(self.directory.search_prefix("jack")), [])
+
+    def test_prefix_search(self):
+        """Test prefix search on single and multiple words."""
+        self.assertEqual(self.ids(self.directory.search_prefix("jo")), [1, 3])
+        self.assertEqual(self.ids(self.directory.search_prefix("SMITH")), [1, 2])
+        self.assertEqual(self.ids(self.directory.search_prefix("j smith")), [1, 2])
+        self.assertEqual(self.ids(self.directory.search_prefix("ann gold")), [4])
+        self.assertEqual(self.directory.search_prefix("zed"), [])
+        self.assertEqual(len(self.directory.search_prefix("j", limit=2)), 2)
+
+    def test_substring_search(self):
+        """Test trigram-backed substring search, including short words."""
+        self.assertEqual(self.ids(self.directory.search("mith")), [1, 2, 4])
+        self.assertEqual(self.ids(self.directory.search("ohn")), [1])
+        self.assertEqual(self.ids(self.directory.search("hann one")), [3])
+        self.assertEqual(self.ids(self.directory.search("an")), [2, 3, 4])
+        self.assertEqual(self.directory.search("htims"), [])
+
+    def test_remove(self):
+        """Test that removal frees the email and drops the customer from name search."""
+        self.directory.remove(1)
+
+        self.assertIsNone(self.directory.get(1))
+        self.assertFalse(self.directory.email_taken("john@example.com"))
+        self.assertEqual(self.ids(self.directory.search_prefix("jo")), [3])
+        self.assertEqual(self.ids(self.directory.search("ohn")), [])
+
+        self.directory.add(Customer(1, "Johnny", "Cash", "john@example.com"))
+        self.assertEqual(self.ids(self.directory.search_prefix("john")), [1])
+        with self.assertRaises(ValueError):
+            self.directory.remove(99)
+
+    def test_remove_compacts_shared_postings(self):
+        """Test that tombstones in a shared token's postings are skipped, compacted and never revived."""
+        for customer_ID in range(10, 30):
+            self.directory.add(Customer(customer_ID, "Pat", "Lee", f"pat{customer_ID}@example.com"))
+        for customer_ID in range(10, 19):
+            self.directory.remove(customer_ID)
+
+        self.assertEqual(self.ids(self.directory.search_prefix("pat lee")), list(range(19, 30)))
+        self.assertEqual(len(self.directory._postings["lee"]), 20)
+        self.directory.remove(19)
+        self.assertEqual(list(self.directory._postings["lee"]), list(range(20, 30)))
+
+        self.directory.add(Customer(12, "Ada", "Byron", "ada@example.com"))
+        self.assertEqual(self.ids(self.directory.search("lee")), list(range(20, 30)))
+        self.assertEqual(self.ids(self.directory.search_prefix("ada")), [12])
+
+        for customer_ID in range(20, 30):
+            self.directory.remove(customer_ID)
+        self.assertEqual(self.directory.search_prefix("lee"), [])
+        self.assertNotIn("lee", self.directory._postings)
+        self.assertEqual(self.directory._tombstones, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+import asyncio
+import threading
+import unittest
+from collections import deque
+
+from src import Account, EventBus, SavingsAccount, CheckingAccount, TransactionType
+
+class TestEventBus(unittest.TestCase):
+    """
+    Test suite for the posting change stream.
+    """
+
+    def setUp(self):
+        self.bus = EventBus()
+        Account.set_event_bus(self.bus)
+
+    def tearDown(self):
+        Account.set_event_bus(None)
+        self.bus.close()
+
+    def test_postings_are_published(self):
+        """Test that every logged balance change reaches a subscriber."""
+        received = []
+        self.bus.subscribe(received.extend)
+
+        account = CheckingAccount(1)
+        account.deposit(100.0)
+        account.withdraw(150.0)  # Withdraw + overdraft fee
+        self.bus.drain()
+
+        types = [event.transaction.transaction_type for event in received]
+        self.assertEqual(types, [TransactionType.DEPOSIT, TransactionType.WITHDRAW, TransactionType.EXTRA_FEE])
+        self.assertEqual(received[-1].balance, -85.0)
+        self.assertEqual(received[0].account_ID, 1)
+
+    def test_handlers_do_not_run_on_publish(self):
+        """Test that publishing only queues events until drained."""
+        received = []
+        subscription = self.bus.subscribe(received.extend)
+
+        SavingsAccount(1).deposit(10.0)
+
+        self.assertEqual(received, [])
+        self.assertEqual(subscription.pending, 1)
+
+    def test_batching(self):
+        """Test that events are delivered in batches of at most batch_size."""
+        batches = []
+        self.bus.subscribe(batches.append, batch_size=3)
+
+        account = SavingsAccount(1)
+        for _ in range(7):
+            account.deposit(1.0)
+        self.bus.drain()
+
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+
+    def test_drop_oldest_when_full(self):
+        """Test that a full queue evicts the oldest event and counts the drop."""
+        received = []
+        subscription = self.bus.subscribe(received.extend, max_queue=2)
+
+        account = SavingsAccount(1)
+        for amount in (1.0, 2.0, 3.0):
+            account.deposit(amount)
+        self.bus.drain()
+
+        self.assertEqual([event.transaction.amount for event in received], [2.0, 3.0])
+        self.assertEqual(subscription.dropped, 1)
+
+    def test_drop_oldest_races_a_drain(self):
+        """Test that a queue emptied between the length check and the eviction does not fail the posting."""
+        class DrainedQueue(deque):
+            raced = False
+
+            def popleft(self):
+                if not self.raced:
+                    # The delivery thread takes everything just before the eviction
+                    self.raced = True
+                    self.clear()
+                return super().popleft()
+
+        received = []
+        subscription = self.bus.subscribe(received.extend, max_queue=2)
+        account = SavingsAccount(1)
+        account.deposit(1.0)
+        account.deposit(2.0)
+        subscription._queue = DrainedQueue(subscription._queue)
+
+        account.deposit(3.0)
+        self.assertEqual(account.balance, 6.0)
+        self.assertEqual(subscription.dropped, 0)
+        self.bus.drain()
+        self.assertEqual([event.transaction.amount for event in received], [3.0])
+
+    def test_drop_newest_when_full(self):
+        """Test that drop_newest keeps the queued events."""
+        received = []
+        subscription = self.bus.subscribe(received.extend, max_queue=2, overflow="drop_newest")
+
+        account = SavingsAccount(1)
+        for amount in (1.0, 2.0, 3.0):
+            account.deposit(amount)
+        self.bus.drain()
+
+        self.assertEqual([event.transaction.amount for event in received], [1.0, 2.0])
+        self.assertEqual(subscription.dropped, 1)
+
+    def test_block_needs_delivery_thread(self):
+        """Test that block is refused without a delivery thread and loses nothing with one."""
+        with self.assertRaisesRegex(ValueError, "block"):
+            self.bus.subscribe(print, overflow="block")
+
+        received = []
+        subscription = self.bus.subscribe(received.extend, delivery="thread", max_queue=4, overflow="block", block_timeout=2)
+        account = SavingsAccount(1)
+        for _ in range(200):
+            account.deposit(1.0)
+        self.bus.unsubscribe(subscription)
+
+        self.assertEqual((len(received), subscription.dropped), (200, 0))
+
+    def test_failing_handler_is_isolated(self):
+        """Test that an exception in one subscriber does not affect others or the posting."""
+        received = []
+
+        def broken(batch):
+            raise RuntimeError("subscriber failure")
+
+        failing = self.bus.subscribe(broken)
+        self.bus.subscribe(received.extend)
+
+        account = SavingsAccount(1)
+        account.deposit(10.0)
+        self.bus.drain()
+
+        self.assertEqual(account.balance, 10.0)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(failing.errors, 1)
+
+    def test_thread_delivery(self):
+        """Test delivery on a background thread."""
+        done = threading.Event()
+        received = []
+
+        def handler(batch):
+            received.extend(batch)
+            if len(received) == 5:
+                done.set()
+
+        self.bus.subscribe(handler, delivery="thread")
+
+        account = SavingsAccount(1)
+        for _ in range(5):
+            account.deposit(1.0)
+
+        self.assertTrue(done.wait(2))
+
+    def test_asyncio_delivery(self):
+        """Test delivery on an asyncio event loop."""
+        received = []
+
+        async def scenario():
+            self.bus.subscribe(received.extend, delivery="asyncio", loop=asyncio.get_running_loop())
+            SavingsAccount(1).deposit(5.0)
+            await asyncio.sleep(0.01)
+
+        asyncio.run(scenario())
+        self.assertEqual(len(received), 1)
+
+    def test_invalid_options(self):
+        """Test that invalid subscription options are rejected."""
+        with self.assertRaises(ValueError):
+            self.bus.subscribe(print, delivery="carrier-pigeon")
+
+        with self.assertRaises(ValueError):
+            self.bus.subscribe(print, overflow="explode")
+
+        with self.assertRaises(ValueError):
+            self.bus.subscribe(print, delivery="asyncio")
+
+
+if __name__ == '__main__':
+    unittest.main()
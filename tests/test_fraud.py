@@ -0,0 +1,112 @@
+import random
+import unittest
+
+from src import Account, EventBus, SavingsAccount, Transaction, TransactionType
+from src.fraud import AnomalyScorer, _linear_recurrence, _score_history_numpy, _score_history_python
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestAnomalyScorer(unittest.TestCase):
+    """
+    Test suite for streaming anomaly scoring.
+    """
+
+    def setUp(self):
+        self.scorer = AnomalyScorer(burst_limit=3, burst_window=60)
+
+    def test_normal_activity_not_flagged(self):
+        """Test that postings close to the account's norm are not flagged."""
+        for amount in (100, 105, 95, 102, 98, 101, 99):
+            result = self.scorer.score(1, Transaction(TransactionType.DEPOSIT, amount))
+            self.assertFalse(result.flagged)
+
+    def test_large_amount_flagged(self):
+        """Test that an amount far above the norm is flagged."""
+        for amount in (100, 105, 95, 102, 98, 101, 99):
+            self.scorer.score(1, Transaction(TransactionType.DEPOSIT, amount))
+
+        result = self.scorer.score(1, Transaction(TransactionType.DEPOSIT, 10_000))
+        self.assertIn("amount", result.reasons)
+        self.assertGreater(result.z_score, 4)
+
+    def test_burst_of_withdrawals_flagged(self):
+        """Test that many outgoing postings in a short window are flagged as a burst."""
+        results = [self.scorer.score(1, Transaction(TransactionType.WITHDRAW, 20)) for _ in range(4)]
+
+        self.assertNotIn("burst", results[2].reasons)
+        self.assertIn("burst", results[3].reasons)
+
+    def test_accounts_are_independent(self):
+        """Test that statistics are kept per account."""
+        self.scorer.score(1, Transaction(TransactionType.DEPOSIT, 100))
+        self.scorer.score(2, Transaction(TransactionType.DEPOSIT, 5))
+
+        self.assertEqual(self.scorer.stats_for(1)[0], 100)
+        self.assertEqual(self.scorer.stats_for(2)[0], 5)
+        self.assertIsNone(self.scorer.stats_for(3))
+
+    def test_system_postings_ignored(self):
+        """Test that interest and fees are not scored."""
+        self.assertIsNone(self.scorer.score(1, Transaction(TransactionType.INTEREST_APPLIED, 1.5)))
+        self.assertEqual(self.scorer.scored, 0)
+
+    def test_history_matches_streaming(self):
+        """Test that batch back-scoring produces the same z-scores as streaming."""
+        amounts = [100, 120, 80, 110, 5000, 90, 95, 100, 300, 101]
+        streamed = [self.scorer.score(7, Transaction(TransactionType.DEPOSIT, amount)).z_score for amount in amounts]
+
+        for batch in (self.scorer.score_history(amounts), _score_history_python(amounts, 0.1)):
+            for expected, actual in zip(streamed, batch):
+                self.assertAlmostEqual(expected, actual, places=6)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_numpy_history_matches_python(self):
+        """Test that the vectorized scorer agrees with the pure-Python one over several recurrence blocks."""
+        rng = random.Random(7)
+        amounts = [rng.lognormvariate(4, 1) for _ in range(5000)]
+        amounts[2500] = 1e6
+
+        expected = _score_history_python(amounts, 0.1)
+        actual = _score_history_numpy(amounts, 0.1).tolist()
+        self.assertEqual(len(actual), len(expected))
+        for want, got in zip(expected, actual):
+            self.assertAlmostEqual(want, got, delta=1e-6 * max(1.0, abs(want)))
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_linear_recurrence(self):
+        """Test the blocked recurrence against a plain loop."""
+        inputs = numpy.arange(1, 1001, dtype=float)
+        expected, value = [], 5.0
+        for x in inputs.tolist():
+            value = 0.9 * value + x
+            expected.append(value)
+
+        for want, got in zip(expected, _linear_recurrence(inputs, 0.9, 5.0).tolist()):
+            self.assertAlmostEqual(want, got, delta=1e-9 * want)
+
+    def test_event_bus_integration(self):
+        """Test scoring postings delivered by the event bus."""
+        flagged = []
+        scorer = AnomalyScorer(burst_limit=2, on_flag=flagged.append)
+        bus = EventBus()
+        bus.subscribe(scorer.handle)
+        Account.set_event_bus(bus)
+
+        try:
+            account = SavingsAccount(1)
+            account.deposit(100.0)
+            for _ in range(3):
+                account.withdraw(10.0)
+            bus.drain()
+        finally:
+            Account.set_event_bus(None)
+
+        self.assertEqual(scorer.scored, 4)
+        self.assertEqual(len(flagged), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
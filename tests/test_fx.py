@@ -0,0 +1,153 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import SavingsAccount, CheckingAccount, FxRateTable, TransactionType
+from src.fx import currency_code, transfer_batch
+from src.reconciliation import Reconciler
+from src.snapshot import write_snapshot, load_snapshot
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestFxRateTable(unittest.TestCase):
+    """
+    Test suite for the FX rate table and cross-currency transfers.
+    """
+
+    def setUp(self):
+        self.rates = FxRateTable([("USD", "EUR", 0.9), ("GBP", "USD", 1.25)])
+
+    def test_inverse_rates_are_precomputed(self):
+        """Test that loading a pair also stores its inverse."""
+        self.assertEqual(self.rates.rate("USD", "EUR"), 0.9)
+        self.assertAlmostEqual(self.rates.rate("EUR", "USD"), 1 / 0.9)
+        self.assertEqual(self.rates.rate("USD", "USD"), 1.0)
+        self.assertIn(("USD", "GBP"), self.rates)
+        self.assertEqual(self.rates.currencies, {"USD", "EUR", "GBP"})
+
+    def test_unknown_pair_and_bad_rates(self):
+        """Test that missing pairs and invalid rates raise ValueError."""
+        with self.assertRaisesRegex(ValueError, "No FX rate for EUR/GBP"):
+            self.rates.rate("EUR", "GBP")
+        for rate in (0, -1.0, float("nan"), float("inf")):
+            with self.assertRaisesRegex(ValueError, "must be positive"):
+                self.rates.set_rate("USD", "JPY", rate)
+        self.assertNotIn(("USD", "JPY"), self.rates)
+        with self.assertRaises(ValueError):
+            currency_code("dollars")
+
+    def test_load_from_file(self):
+        """Test loading rates from a CSV file with a header and comments."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rates.csv")
+            with open(path, "w") as file:
+                file.write("base,quote,rate\n# majors\nusd,eur,0.9\n\nUSD,JPY,150\n")
+            rates = FxRateTable.load(path)
+
+            self.assertEqual(rates.convert(10, "USD", "JPY"), 1500.0)
+            self.assertEqual(rates.convert(9, "EUR", "USD"), 10.0)
+
+            with open(path, "a") as file:
+                file.write("USD,CHF\n")
+            with self.assertRaisesRegex(ValueError, "rates.csv:6"):
+                FxRateTable.load(path)
+
+            with open(path, "w") as file:
+                file.write("USD,EUR,0.9\nUSD,GBP,nan\n")
+            with self.assertRaisesRegex(ValueError, "rates.csv:2: invalid rate 'nan'"):
+                FxRateTable.load(path)
+
+    def test_convert_batch_matches_convert(self):
+        """Test that batch conversion gives the same cents as one-at-a-time conversion."""
+        amounts = [0.05 * i + 1 for i in range(500)]
+        pairs = [("USD", "EUR"), ("EUR", "USD"), ("USD", "GBP")] * 166 + [("USD", "USD")] * 2
+        expected = [self.rates.convert(amount, *pair) for amount, pair in zip(amounts, pairs)]
+        self.assertEqual(self.rates.convert_batch(amounts, pairs), expected)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_numpy_batch_matches_python_batch(self):
+        """Test that the vectorized multiply converts to the same cents as the pure-Python path."""
+        amounts = [0.01 * i + 0.37 for i in range(3000)]
+        pairs = [("USD", "EUR"), ("EUR", "GBP"), ("GBP", "USD")] * 1000
+        rates = FxRateTable([("USD", "EUR", 0.9137), ("USD", "GBP", 0.7861), ("EUR", "GBP", 0.8603)])
+
+        vectorized = rates.convert_batch(amounts, pairs)
+        with mock.patch("src._optional.numpy", return_value=None):
+            python = rates.convert_batch(amounts, pairs)
+        self.assertEqual(vectorized, python)
+        self.assertEqual(vectorized, [rates.convert(amount, *pair) for amount, pair in zip(amounts, pairs)])
+
+    def test_cross_currency_transfer(self):
+        """Test that the receiver is credited the converted amount and both legs keep both amounts."""
+        usd = CheckingAccount(1)
+        eur = SavingsAccount(2, currency="eur")
+        usd.deposit(100)
+
+        usd.transfer(eur, 50, self.rates)
+
+        self.assertEqual(eur.currency, "EUR")
+        self.assertEqual(usd.balance, 50)
+        self.assertEqual(eur.balance, 45.0)
+
+        sent = usd.view_transaction_history()[-1]
+        received = eur.view_transaction_history()[-1]
+        self.assertEqual((sent.amount, sent.converted_amount, sent.fx_currency), (50, 45.0, "EUR"))
+        self.assertEqual((received.amount, received.original_amount, received.fx_currency), (45.0, 50, "USD"))
+
+    def test_cross_currency_transfer_requires_rates(self):
+        """Test that a cross-currency transfer without a rate leaves both accounts untouched."""
+        usd = SavingsAccount(1)
+        gbp = SavingsAccount(2, currency="GBP")
+        eur = SavingsAccount(3, currency="EUR")
+        usd.deposit(100)
+        gbp.deposit(100)
+
+        with self.assertRaisesRegex(ValueError, "FX rates required"):
+            usd.transfer(gbp, 10)
+        with self.assertRaisesRegex(ValueError, "No FX rate"):
+            gbp.transfer(eur, 10, self.rates)
+
+        self.assertEqual((usd.balance, gbp.balance, eur.balance), (100, 100, 0))
+        self.assertEqual(eur.transaction_count, 0)
+
+    def test_transfer_batch(self):
+        """Test batch transfers mixing same- and cross-currency legs with a failure."""
+        usd = CheckingAccount(1)
+        eur = SavingsAccount(2, currency="EUR")
+        usd2 = SavingsAccount(3)
+        usd.deposit(1000)
+
+        results = transfer_batch([(usd, eur, 100), (usd, usd2, 50), (eur, usd, 1000), (usd, eur, 10)], self.rates)
+
+        self.assertEqual(results[:2], [None, None])
+        self.assertEqual(results[2], "Insufficient funds")
+        self.assertIsNone(results[3])
+        self.assertEqual(eur.balance, 99.0)
+        self.assertEqual(usd2.balance, 50)
+        self.assertEqual(usd.balance, 840)
+
+    def test_reconciliation_and_snapshot_keep_fx_legs(self):
+        """Test that converted transfers reconcile and survive a snapshot round trip."""
+        usd = CheckingAccount(1)
+        eur = SavingsAccount(2, currency="EUR")
+        usd.deposit(200)
+        usd.transfer(eur, 80, self.rates)
+
+        report = Reconciler().run([usd, eur])
+        self.assertTrue(report.ok)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bank.snap")
+            write_snapshot(path, [], [usd, eur])
+            with load_snapshot(path) as snapshot:
+                _, accounts = snapshot.restore()
+                received = accounts[2].view_transaction_history()[-1]
+
+                self.assertEqual(accounts[2].currency, "EUR")
+                self.assertEqual(received.transaction_type, TransactionType.TRANSFER_RECEIVED)
+                self.assertEqual((received.original_amount, received.fx_currency), (80, "USD"))
+                self.assertIsNone(accounts[1].view_transaction_history()[0].fx_currency)
@@ -0,0 +1,43 @@
+import importlib
+import sys
+import unittest
+
+from benchmarks import bench_import
+
+class TestImportTime(unittest.TestCase):
+    """
+    Test suite for start-up cost: lazy package exports and import-time budgets.
+    """
+
+    def test_forbidden_modules_not_loaded(self):
+        """Test that library and CLI start-up never load the DB stack or optional accelerators."""
+        for scenario in bench_import.SCENARIOS:
+            loaded = bench_import.loaded_modules(scenario)
+            for module in bench_import.FORBIDDEN_MODULES:
+                self.assertNotIn(module, loaded, f"{module} imported by {scenario} start-up")
+
+    def test_database_module_imports_without_driver(self):
+        """Test that importing src.database does not import mysql or dotenv."""
+        module = importlib.import_module("src.database")
+        self.assertTrue(callable(module.get_db_connection))
+        self.assertNotIn("mysql", sys.modules)
+        self.assertNotIn("dotenv", sys.modules)
+
+    def test_lazy_exports(self):
+        """Test that lazily exported names resolve and unknown names still fail."""
+        import src
+
+        self.assertIs(src.Customer, importlib.import_module("src.customer").Customer)
+        self.assertIn("SavingsAccount", dir(src))
+        with self.assertRaises(AttributeError):
+            src.DoesNotExist
+
+    def test_import_time_budgets(self):
+        """Test that library and CLI import time stay within budget."""
+        for scenario, budget in bench_import.BUDGETS_MS.items():
+            elapsed = bench_import.median_ms(scenario, repeat=3)
+            self.assertLessEqual(elapsed, budget, f"{scenario} import took {elapsed:.1f} ms")
+
+
+if __name__ == '__main__':
+    unittest.main()
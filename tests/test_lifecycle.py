@@ -0,0 +1,162 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src import Customer, SavingsAccount, CheckingAccount, AccountStatus, Transaction, TransactionType
+from src.lifecycle import AccountArchive, DormancyPolicy, last_activity
+from src.scheduler import MonthEndJob
+from src.snapshot import write_snapshot, load_snapshot
+from src.striping import StripedCheckingAccount
+
+class TestAccountLifecycle(unittest.TestCase):
+    """
+    Test suite for account closure, dormancy and archive compaction.
+    """
+
+    def setUp(self):
+        self.customer = Customer(1, "Alice", "Smith", "alice@example.com")
+        self.savings = SavingsAccount(10)
+        self.checking = CheckingAccount(11)
+        self.customer.open_account(self.savings)
+        self.customer.open_account(self.checking)
+        self.savings.deposit(500.0)
+        self.checking.deposit(20.0)
+        self.policy = DormancyPolicy(timedelta(days=30))
+        self.later = datetime.now() + timedelta(days=31)
+
+    def test_close_requires_zero_balance(self):
+        """Test that only an emptied account closes, and a closed account takes no postings."""
+        with self.assertRaisesRegex(ValueError, "zero"):
+            self.checking.close()
+
+        self.checking.withdraw(20.0)
+        self.checking.close()
+
+        self.assertEqual(self.checking.status, AccountStatus.CLOSED)
+        with self.assertRaisesRegex(ValueError, "closed"):
+            self.checking.deposit(1.0)
+        with self.assertRaisesRegex(ValueError, "closed"):
+            self.savings.transfer(self.checking, 1.0)
+        self.assertEqual(self.checking.apply_maintenance_fee(), 0)
+
+    def test_dormancy_ignores_bank_postings(self):
+        """Test that interest does not count as activity and a customer posting reactivates."""
+        self.savings.apply_interest()
+        self.assertEqual(last_activity(self.savings), self.savings.view_transaction_history()[0].timestamp)
+
+        self.assertTrue(self.policy.is_dormant(self.savings, self.later))
+        self.assertFalse(self.policy.is_dormant(self.savings))
+        self.assertFalse(self.policy.is_dormant(SavingsAccount(99), self.later))
+
+        self.savings.mark_dormant()
+        self.savings.apply_interest()
+        self.assertEqual(self.savings.status, AccountStatus.DORMANT)
+        self.savings.withdraw(1.0)
+        self.assertEqual(self.savings.status, AccountStatus.ACTIVE)
+
+    def test_failed_transfer_leaves_destination_dormant(self):
+        """Test that only a transfer that actually debits the sender wakes a dormant destination."""
+        self.savings.mark_dormant()
+        for amount in (0, 5000.0):
+            with self.assertRaises(ValueError):
+                self.checking.transfer(self.savings, amount)
+        self.assertEqual(self.savings.status, AccountStatus.DORMANT)
+        self.assertEqual(self.savings.transaction_count, 1)
+
+        self.checking.transfer(self.savings, 5.0)
+        self.assertEqual(self.savings.status, AccountStatus.ACTIVE)
+
+    def test_sweep_and_rehydrate(self):
+        """Test that a sweep drops inactive accounts from the customer and get_account brings them back."""
+        archive = AccountArchive()
+        history = self.savings.view_transaction_history()
+
+        self.assertEqual(archive.sweep([self.customer], self.policy, self.later), 2)
+        self.assertEqual(self.customer.accounts, [])
+        self.assertEqual(archive.summary(10).balance, 500.0)
+        self.assertGreater(archive.stored_bytes, 0)
+
+        restored = self.customer.get_account(10)
+        self.assertIsNot(restored, self.savings)
+        self.assertEqual((restored.balance, restored.status, restored.customer_ID), (500.0, AccountStatus.DORMANT, 1))
+        self.assertEqual([(tx.transaction_type, tx.amount, tx.timestamp, tx.fx_currency) for tx in restored.view_transaction_history()],
+                         [(tx.transaction_type, tx.amount, tx.timestamp, tx.fx_currency) for tx in history])
+        self.assertEqual(self.customer.accounts, [restored])
+        self.assertNotIn(10, archive)
+
+        # Another customer cannot reach it through the shared archive
+        other = Customer(2, "Bob", "Jones", "bob@example.com")
+        other._archive = archive
+        self.assertIsNone(other.get_account(11))
+        self.assertIsNotNone(self.customer.get_account(11))
+
+    def test_rehydrate_keeps_posted_periods(self):
+        """Test that a rehydrated account is not posted a month-end period twice."""
+        MonthEndJob("2026-10", tasks=("interest",)).run([self.savings])
+        balance = self.savings.balance
+        archive = AccountArchive()
+        archive.sweep([self.customer], self.policy, self.later)
+
+        restored = self.customer.get_account(10)
+        MonthEndJob("2026-10", tasks=("interest",)).run([restored])
+        self.assertEqual(restored._posted_periods, {"interest": "2026-10"})
+        self.assertEqual(restored.balance, balance)
+
+    def test_snapshot_includes_archived_accounts(self):
+        """Test that a snapshot taken after a sweep still holds the archived accounts and their money."""
+        archive = AccountArchive()
+        archive.sweep([self.customer], self.policy, self.later)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bank.snap")
+            write_snapshot(path, [self.customer])
+            with load_snapshot(path) as snapshot:
+                customers, accounts = snapshot.restore(lazy=False)
+
+        self.assertEqual(sorted(accounts), [10, 11])
+        self.assertEqual((accounts[10].balance, accounts[10].status), (500.0, AccountStatus.DORMANT))
+        self.assertEqual(accounts[11].transaction_count, 1)
+        self.assertTrue(accounts[10]._audit_log.verify())
+        self.assertEqual(len(archive), 2)
+
+    def test_directory_archive_detects_tampering(self):
+        """Test that a blob written by anyone else, or a history that no longer matches its checkpoint, is refused."""
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaisesRegex(ValueError, "needs a key"):
+                AccountArchive(directory)
+            archive = AccountArchive(directory, key=b"bank")
+            self.checking.mark_dormant()
+            archive.compact(self.checking, self.customer)
+            self.assertEqual(os.listdir(directory), ["11.archive"])
+
+            forged = CheckingAccount(11)
+            forged._audit_log.log_transaction(Transaction(TransactionType.DEPOSIT, 2000.0))
+            forged.mark_dormant()
+            other = AccountArchive(directory, key=b"intruder")
+            other.compact(forged)
+            other._summaries[11] = archive.summary(11)
+
+            with self.assertRaisesRegex(ValueError, "integrity check"):
+                other.rehydrate(11)
+
+            # Same key, so the blob passes its digest; the chain head still catches the swap
+            shared = AccountArchive(directory, key=b"shared")
+            shared.compact(forged)
+            shared._summaries[11].head = archive.summary(11).head
+            with self.assertRaisesRegex(ValueError, "does not match"):
+                shared.rehydrate(11)
+
+    def test_compact_rejects(self):
+        """Test that active and striped accounts are never archived."""
+        archive = AccountArchive()
+        with self.assertRaisesRegex(ValueError, "dormant or closed"):
+            archive.compact(self.savings, self.customer)
+
+        striped = StripedCheckingAccount(12)
+        striped.mark_dormant()
+        with self.assertRaisesRegex(ValueError, "Cannot archive"):
+            archive.compact(striped)
+
+if __name__ == '__main__':
+    unittest.main()
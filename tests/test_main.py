@@ -1,9 +1,11 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 from io import StringIO
 
 import main
-from src import Customer, SavingsAccount, CheckingAccount
+from src import Customer, SavingsAccount, CheckingAccount, FxRateTable
 
 class TestMain(unittest.TestCase):
 
@@ -179,5 +181,150 @@ class TestMain(unittest.TestCase):
         self.assertIsInstance(cust.accounts[0], SavingsAccount)
         self.assertEqual(cust.accounts[0].account_ID, 303)
 
+    # ==========================
+    # Test Batch Mode
+    # ==========================
+
+    def test_run_batch(self):
+        """Test replaying a command stream with a summary at the end."""
+        commands = [
+            "# comment lines and blank lines are skipped",
+            "",
+            "open_customer 1 John Doe john@example.com",
+            "open_account 1 savings 10",
+            "open_account 1 checking 11",
+            "deposit 10 100",
+            "transfer 10 11 30",
+            "withdraw 11 100",
+            "withdraw 10 1000",
+            "balance 11",
+            "interest 10",
+        ]
+        out = StringIO()
+        session = main.BatchSession()
+
+        summary = main.run_batch(commands, out, session=session)
+
+        self.assertEqual(summary, {"commands": 9, "succeeded": 8, "failed": 1})
+        self.assertEqual(session.accounts[10].balance, 71.05)
+        self.assertEqual(session.accounts[11].balance, -105.0)
+        output = out.getvalue()
+        self.assertIn("line 9: Error: Insufficient funds", output)
+        self.assertIn("Account 11 balance: $-105.0", output)
+        self.assertIn("Processed 9 commands: 8 succeeded, 1 failed", output)
+
+    def test_run_batch_invalid_commands(self):
+        """Test that unknown commands, bad arguments and missing IDs are reported per line."""
+        commands = [
+            "launch_rocket 1",
+            "deposit 10",
+            "deposit 99 10",
+            "open_account 5 savings 1",
+            "open_customer 1 Jane Doe jane@example.com",
+            "open_customer 1 Jane Doe jane@example.com",
+            "open_account 1 checking 2",
+            "interest 2",
+            "deposit 2 nan",
+            "withdraw 2 -inf",
+        ]
+        out = StringIO()
+
+        summary = main.run_batch(commands, out)
+
+        self.assertEqual(summary["failed"], 8)
+        output = out.getvalue()
+        self.assertIn("Unknown command 'launch_rocket'", output)
+        self.assertIn("Usage: deposit <account_id> <amount>", output)
+        self.assertIn("Account 99 not found", output)
+        self.assertIn("Customer 5 not found", output)
+        self.assertIn("Customer ID 1 is already taken", output)
+        self.assertIn("Interest only applies to savings accounts", output)
+        self.assertIn("Invalid amount 'nan'", output)
+
+    def test_run_batch_reports_engine_faults(self):
+        """Test that an invariant violation or lookup failure names its line and the batch carries on."""
+        commands = [
+            "open_customer 1 Jane Doe jane@example.com",
+            "open_account 1 savings 2",
+            "deposit 2 100",
+            "interest 2",
+            "withdraw 2 10",
+            "balance 2",
+        ]
+        out = StringIO()
+
+        with patch.object(SavingsAccount, "apply_interest", side_effect=AssertionError("savings balance became negative")), \
+             patch.object(SavingsAccount, "withdraw", side_effect=KeyError("stripe")):
+            summary = main.run_batch(commands, out)
+
+        self.assertEqual(summary, {"commands": 6, "succeeded": 4, "failed": 2})
+        output = out.getvalue()
+        self.assertIn("line 4: Internal error: AssertionError: savings balance became negative", output)
+        self.assertIn("line 5: Internal error: KeyError: 'stripe'", output)
+        self.assertIn("Account 2 balance: $100.0", output)
+
+    def test_run_batch_flushes_in_batches(self):
+        """Test that output is written once per batch rather than per line."""
+        out = MagicMock()
+        commands = ["open_customer 1 A B a@b.com", "open_account 1 c 1"] + ["deposit 1 1"] * 4
+
+        main.run_batch(commands, out, batch_size=3)
+
+        # Two full batches plus the summary line
+        self.assertEqual(out.write.call_count, 3)
+
+    def test_run_batch_cross_currency(self):
+        """Test that accounts can be opened in a currency and transfers use the session's FX table."""
+        commands = [
+            "open_customer 1 John Doe john@example.com",
+            "open_account 1 checking 1",
+            "open_account 1 savings 2 eur",
+            "deposit 1 100",
+            "transfer 1 2 50",
+            "balance 2",
+        ]
+        out = StringIO()
+
+        summary = main.run_batch(commands, out, session=main.BatchSession(FxRateTable([("USD", "EUR", 0.9)])))
+
+        self.assertEqual(summary["failed"], 0)
+        self.assertIn("SavingsAccount (ID: 2, EUR) opened", out.getvalue())
+        self.assertIn("Account 2 balance: $45.0", out.getvalue())
+
+        out = StringIO()
+        main.run_batch(commands, out)
+        self.assertIn("line 5: Error: FX rates required to transfer USD to EUR", out.getvalue())
+
+    def test_run_batch_customer_directory(self):
+        """Test that batch mode rejects duplicate emails and finds customers by name."""
+        commands = [
+            "open_customer 1 John Doe john@example.com",
+            "open_customer 2 Jane Doe JOHN@example.com",
+            "open_customer 3 Johanna Smith jo@example.com",
+            "find jo",
+            "find doe j",
+        ]
+        out = StringIO()
+
+        summary = main.run_batch(commands, out)
+
+        self.assertEqual(summary["failed"], 1)
+        output = out.getvalue()
+        self.assertIn("line 2: Error: Email JOHN@example.com is already registered", output)
+        self.assertIn("Customer 3: Johanna Smith <jo@example.com>", output)
+        self.assertEqual(output.count("Customer 1: John Doe <john@example.com>"), 2)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_batch_from_file(self, mock_stdout):
+        """Test the --batch command line flag."""
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+            file.write("open_customer 1 John Doe john@example.com\n")
+        try:
+            main.main(["--batch", file.name])
+        finally:
+            os.remove(file.name)
+
+        self.assertIn("Processed 1 commands: 1 succeeded, 0 failed", mock_stdout.getvalue())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
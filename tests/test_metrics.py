@@ -0,0 +1,105 @@
+import unittest
+
+from src import Account, SavingsAccount, CheckingAccount, AuditLog
+from src import invariants
+from src.metrics import Instrumentation, LatencyHistogram
+
+class TestLatencyHistogram(unittest.TestCase):
+    """
+    Test suite for the HDR-style latency histogram.
+    """
+
+    def test_percentiles_within_precision(self):
+        """Test that percentiles are within the bucket precision."""
+        histogram = LatencyHistogram()
+        for value in range(1, 10_001):
+            histogram.record(value)
+
+        self.assertEqual(histogram.count, 10_000)
+        self.assertEqual(histogram.min, 1)
+        self.assertEqual(histogram.max, 10_000)
+        self.assertLessEqual(abs(histogram.percentile(50) - 5_000) / 5_000, 0.125)
+        self.assertLessEqual(abs(histogram.percentile(99) - 9_900) / 9_900, 0.125)
+
+    def test_small_values_exact(self):
+        """Test that small values get their own bucket."""
+        histogram = LatencyHistogram()
+        histogram.record(3)
+        self.assertEqual(histogram.percentile(100), 3)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Test suite for engine instrumentation and invariant counters.
+    """
+
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+
+    def tearDown(self):
+        self.instrumentation.disable()
+        invariants.set_mode("raise")
+        invariants.reset()
+
+    def test_disabled_leaves_methods_untouched(self):
+        """Test that enable/disable restores the original methods."""
+        original = Account.deposit
+        self.instrumentation.enable()
+        self.assertIsNot(Account.deposit, original)
+        self.instrumentation.disable()
+        self.assertIs(Account.deposit, original)
+
+    def test_counts_calls_and_errors(self):
+        """Test per-operation call counts and error reasons."""
+        with self.instrumentation:
+            savings = SavingsAccount(1)
+            checking = CheckingAccount(2)
+            savings.deposit(100.0)
+            savings.apply_interest()
+            savings.transfer(checking, 50.0)
+            for amount in (1000.0, -5.0):
+                with self.assertRaises(ValueError):
+                    savings.withdraw(amount)
+            with self.assertRaises(ValueError):
+                checking.withdraw(10_000.0)
+
+        snapshot = self.instrumentation.metrics.snapshot()["operations"]
+        self.assertEqual(snapshot["deposit"]["calls"], 1)
+        self.assertEqual(snapshot["apply_interest"]["calls"], 1)
+        self.assertEqual(snapshot["transfer"]["calls"], 1)
+        self.assertEqual(snapshot["withdraw"]["errors"], {
+            "insufficient_funds": 1, "invalid_amount": 1, "overdraft_limit_exceeded": 1,
+        })
+        self.assertEqual(snapshot["log_transaction"]["calls"], 4)
+        self.assertGreater(snapshot["deposit"]["latency_ns"]["p99"], 0)
+
+    def test_prometheus_export(self):
+        """Test the Prometheus text exposition."""
+        with self.instrumentation:
+            SavingsAccount(1).deposit(10.0)
+
+        text = self.instrumentation.metrics.to_prometheus()
+        self.assertIn('securebank_operation_calls_total{operation="deposit"} 1', text)
+        self.assertIn('securebank_operation_latency_seconds_bucket{operation="deposit",le="+Inf"} 1', text)
+        self.assertIn("# TYPE securebank_operation_latency_seconds histogram", text)
+
+    def test_invariant_modes(self):
+        """Test that invariant checks can raise, count or be switched off."""
+        log = AuditLog()
+        with self.assertRaises(AssertionError):
+            log.log_transaction("not a transaction")
+
+        invariants.set_mode("count")
+        log.log_transaction("not a transaction")
+        self.assertEqual(invariants.violations()["audit_log_entry_type"], 2)
+
+        invariants.set_mode("off")
+        log.log_transaction("not a transaction")
+        self.assertEqual(invariants.violations()["audit_log_entry_type"], 2)
+
+        with self.assertRaises(ValueError):
+            invariants.set_mode("loud")
+
+
+if __name__ == '__main__':
+    unittest.main()
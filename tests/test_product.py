@@ -0,0 +1,82 @@
+import unittest
+
+from src import ProductCatalog, SavingsAccount, CheckingAccount, DEFAULT_CATALOG
+
+class TestProductCatalog(unittest.TestCase):
+    """
+    Test suite for shared, versioned product definitions.
+    """
+
+    def setUp(self):
+        self.catalog = ProductCatalog()
+        self.savings = self.catalog.register("SAVINGS_TIERED", interest_tiers=((0, 0.01), (1000, 0.02)))
+        self.checking = self.catalog.register("CHECKING_BASIC", overdraft_limit=-200, overdraft_fee=10)
+
+    def test_default_products(self):
+        """Test that accounts without a product use the default catalog terms."""
+        savings = SavingsAccount(1)
+        checking = CheckingAccount(2)
+
+        self.assertIs(savings.product, DEFAULT_CATALOG.get("SAVINGS"))
+        self.assertEqual(savings.interest_rate, 0.015)
+        self.assertEqual(checking.overdraft_limit, -500)
+        self.assertEqual(checking.overdraft_fee, 35)
+
+    def test_accounts_share_product(self):
+        """Test that accounts reference the product instead of copying its terms."""
+        acc1 = SavingsAccount(1, self.savings)
+        acc2 = SavingsAccount(2, self.savings)
+        self.assertIs(acc1.product, acc2.product)
+
+    def test_revise_applies_to_existing_accounts(self):
+        """Test that a revision is visible to every account holding the product."""
+        account = SavingsAccount(1, self.savings)
+        account.deposit(100.0)
+
+        self.savings.revise(interest_tiers=((0, 0.05),))
+        account.apply_interest()
+
+        self.assertEqual(account.balance, 105.0)
+        self.assertEqual(self.savings.terms.version, 2)
+        self.assertEqual(self.savings.terms_at(1).interest_rate, 0.01)
+
+    def test_tiered_interest(self):
+        """Test that the rate is chosen by balance tier."""
+        account = SavingsAccount(1, self.savings)
+        account.deposit(2000.0)
+        account.apply_interest()
+        self.assertEqual(account.balance, 2040.0)
+
+    def test_checking_uses_product_limits(self):
+        """Test that overdraft limit and fee come from the product."""
+        account = CheckingAccount(1, self.checking)
+        account.deposit(100.0)
+
+        account.withdraw(150.0)
+        self.assertEqual(account.balance, -60.0)
+
+        with self.assertRaises(ValueError):
+            account.withdraw(200.0)
+
+    def test_invalid_terms(self):
+        """Test that unknown or invalid terms are rejected."""
+        with self.assertRaises(ValueError):
+            self.checking.revise(unknown_fee=5)
+
+        with self.assertRaises(ValueError):
+            self.checking.revise(overdraft_limit=100)
+
+        with self.assertRaises(ValueError):
+            self.catalog.register("SAVINGS_TIERED")
+
+    def test_group_by_product(self):
+        """Test that accounts are bucketed by product code."""
+        accounts = [SavingsAccount(1, self.savings), CheckingAccount(2, self.checking), SavingsAccount(3, self.savings)]
+        groups = self.catalog.group_by_product(accounts)
+
+        self.assertEqual([acc.account_ID for acc in groups["SAVINGS_TIERED"]], [1, 3])
+        self.assertEqual([acc.account_ID for acc in groups["CHECKING_BASIC"]], [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import time
+import unittest
+
+from src import SavingsAccount, CheckingAccount
+from src.profiling import Profiler, SamplingProfiler
+
+class TestProfiling(unittest.TestCase):
+    """
+    Test suite for the profiling modes (collectors and output formats, not timings).
+    """
+
+    def workload(self):
+        savings, checking = SavingsAccount(1), CheckingAccount(2)
+        for _ in range(2000):
+            savings.deposit(10.0)
+            savings.transfer(checking, 1.0)
+        return savings, checking
+
+    def test_engine_profile_and_memory(self):
+        """Test scoped cProfile output, per-operation memory and that patched methods are restored."""
+        deposit = SavingsAccount.deposit
+        with Profiler(("cprofile", "memory")) as profiler:
+            self.assertIsNot(SavingsAccount.deposit, deposit)
+            self.workload()
+
+        self.assertIs(SavingsAccount.deposit, deposit)
+        self.assertEqual({label: calls for label, (calls, _) in profiler.memory.items() if calls},
+                         {"deposit": 2000, "transfer": 2000})
+        self.assertGreater(profiler.memory["transfer"][1], 0)
+
+        lines = profiler.engine_collapsed()
+        self.assertTrue(any(line.startswith("src/account.py:transfer;") for line in lines))
+        self.assertFalse(any("profiling.py" in line for line in lines))
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            self.assertTrue(stack and int(count) > 0)
+
+        report = profiler.report()
+        self.assertIn("src/audit_log.py:log_transaction", report)
+        self.assertIn("Net memory retained per operation", report)
+
+    def test_sampler_collects_stacks(self):
+        """Test that the sampler records the profiled thread's stacks."""
+        sampler = SamplingProfiler(interval=0.0005)
+        sampler.start()
+        deadline = time.perf_counter() + 0.3
+        while time.perf_counter() < deadline or not sampler.samples:
+            self.workload()
+            time.sleep(0.001)
+        sampler.stop()
+
+        self.assertGreater(sampler.samples, 0)
+        self.assertTrue(all(line.count(" ") >= 1 for line in sampler.collapsed()))
+        self.assertTrue(any(label.startswith("src/") for label, _, _ in sampler.hot_functions()))
+
+    def test_write_outputs(self):
+        """Test that write() produces every file for the enabled modes."""
+        with Profiler(("sample", "cprofile")) as profiler:
+            self.workload()
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = profiler.write(directory)
+            self.assertEqual(sorted(os.listdir(directory)),
+                             ["engine.collapsed", "engine.prof", "report.txt", "samples.collapsed"])
+            self.assertEqual(len(paths), 4)
+
+        with self.assertRaises(ValueError):
+            Profiler(("perf",))
+
+if __name__ == '__main__':
+    unittest.main()
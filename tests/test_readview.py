@@ -0,0 +1,129 @@
+import math
+import random
+import sys
+import threading
+import unittest
+
+from src import Account, SavingsAccount, CheckingAccount
+from src.readview import ReadViews
+from src.striping import StripedCheckingAccount
+
+class TestReadView(unittest.TestCase):
+    """
+    Test suite for point-in-time read views (copy-on-write pre-images).
+    """
+
+    def setUp(self):
+        self.savings = SavingsAccount(1)
+        self.checking = CheckingAccount(2)
+        self.savings.deposit(100)
+        self.accounts = {1: self.savings, 2: self.checking}
+        self.views = ReadViews(self.accounts)
+
+    def tearDown(self):
+        Account._read_views = None
+
+    def test_view_keeps_opening_state(self):
+        """Test that balances, counts and history stay as of the open while postings continue."""
+        with self.views.open() as view:
+            self.savings.transfer(self.checking, 40)
+            self.savings.withdraw(10)
+            self.checking.deposit(5)
+
+            self.assertEqual(view.balance(1), 100)
+            self.assertEqual(view.balance(2), 0)
+            self.assertEqual(view.transaction_count(1), 1)
+            self.assertEqual([tx.amount for tx in view.history(1)], [100])
+            self.assertEqual(view.history(2), [])
+            self.assertEqual(view.total_balance(), 100)
+            self.assertTrue(view.check_ledger(1))
+            self.assertEqual(view.preserved, 2)
+
+        self.assertEqual((self.savings.balance, self.checking.balance), (50, 45))
+        self.assertIsNone(Account._read_views)
+        with self.assertRaises(ValueError):
+            view.balance(1)
+
+    def test_nested_views_and_new_accounts(self):
+        """Test that each view sees its own cut and accounts opened later stay out of earlier views."""
+        first = self.views.open()
+        self.savings.withdraw(30)
+        second = self.views.open()
+        self.savings.withdraw(20)
+        self.accounts[3] = SavingsAccount(3)
+
+        self.assertEqual((first.balance(1), second.balance(1)), (100, 70))
+        self.assertEqual(first.account_count, 2)
+        with self.assertRaises(ValueError):
+            first.balance(3)
+
+        first.close()
+        self.assertIs(Account._read_views, self.views)
+        self.savings.withdraw(5)
+        self.assertEqual(second.balance(1), 70)
+        second.close()
+        self.assertEqual(self.views.open_views, 0)
+        self.assertIsNone(Account._read_views)
+
+    def test_striped_credits_keep_view_balance(self):
+        """Test that concurrent striped credits never show through an open view."""
+        striped = StripedCheckingAccount(3, stripes=4)
+        striped.deposit(10)
+        views = ReadViews({3: striped})
+        view = views.open()
+
+        def credit():
+            for _ in range(300):
+                striped.deposit(1.0)
+
+        threads = [threading.Thread(target=credit) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual((view.balance(3), view.transaction_count(3)), (10, 1))
+        self.assertEqual([tx.amount for tx in view.history(3)], [10])
+        self.assertEqual(striped.balance, 1210)
+        view.close()
+
+    def test_consistent_totals_under_concurrent_transfers(self):
+        """Test that view totals never tear while threads post transfers under the writers' lock."""
+        lock = threading.Lock()
+        bank = {account_ID: SavingsAccount(account_ID) for account_ID in range(1, 201)}
+        for account in bank.values():
+            account.deposit(50)
+        views = ReadViews(bank, lock)
+        stop = threading.Event()
+        previous = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+
+        def writer(seed: int) -> None:
+            rng = random.Random(seed)
+            while not stop.is_set():
+                source, destination = rng.sample(range(1, 201), 2)
+                with lock:
+                    try:
+                        bank[source].transfer(bank[destination], rng.randint(1, 8000) / 100)
+                    except ValueError:
+                        pass
+
+        threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(3)]
+        totals = []
+        try:
+            for thread in threads:
+                thread.start()
+            for _ in range(40):
+                with views.open() as view:
+                    totals.append(view.total_balance())
+                    self.assertTrue(all(view.check_ledger(account_ID) for account_ID in range(1, 201, 20)))
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            sys.setswitchinterval(previous)
+
+        self.assertTrue(all(math.isclose(total, 10000, abs_tol=1e-6) for total in totals))
+
+if __name__ == '__main__':
+    unittest.main()
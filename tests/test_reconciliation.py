@@ -0,0 +1,149 @@
+import random
+import sqlite3
+import unittest
+from unittest import mock
+
+from src import SavingsAccount, CheckingAccount, ProductCatalog, Transaction, TransactionType
+from src.reconciliation import DB_TRANSACTION_TYPES, Reconciler, compare_with_database, replay_balance
+
+class TestReconciliation(unittest.TestCase):
+    """
+    Test suite for the bank-wide reconciliation job.
+    """
+
+    def setUp(self):
+        self.savings = SavingsAccount(1)
+        self.checking = CheckingAccount(2)
+        self.savings.deposit(500.0)
+        self.savings.transfer(self.checking, 200.0)
+        self.checking.withdraw(250.0)  # Triggers overdraft fee
+        self.savings.apply_interest()
+        self.accounts = [self.savings, self.checking]
+
+    def test_replay_balance(self):
+        """Test replaying signed entries."""
+        entries = [("DEPOSIT", 100.0), ("WITHDRAW", 30.0), ("EXTRA FEE", 5.0)]
+        self.assertEqual(replay_balance(entries), 65.0)
+
+    def test_consistent_bank(self):
+        """Test that a bank built through the engine reconciles cleanly."""
+        report = Reconciler().run(self.accounts)
+
+        self.assertTrue(report.ok)
+        self.assertEqual(report.accounts_checked, 2)
+        self.assertEqual(report.transfer_sent, 200.0)
+        self.assertEqual(report.transfer_received, 200.0)
+        self.assertGreater(report.accounts_per_second, 0)
+
+    def test_detects_balance_drift(self):
+        """Test that a balance that disagrees with its log is reported."""
+        self.checking._balance += 1.0
+        report = Reconciler().run(self.accounts)
+
+        self.assertFalse(report.ok)
+        self.assertEqual([account_ID for account_ID, _, _ in report.mismatches], [2])
+
+    def test_detects_unbalanced_transfer(self):
+        """Test that a transfer leg without its counterpart is reported."""
+        self.savings._audit_log.log_transaction(Transaction(TransactionType.TRANSFER_SENT, 10.0))
+        self.savings._balance -= 10.0
+        report = Reconciler().run(self.accounts)
+
+        self.assertFalse(report.transfers_balanced)
+
+    def test_process_pool(self):
+        """Test that parallel runs give the same result as serial runs."""
+        accounts = []
+        for account_ID in range(50):
+            account = SavingsAccount(account_ID)
+            account.deposit(100.0 + account_ID)
+            accounts.append(account)
+
+        report = Reconciler(workers=2, chunk_size=7).run(iter(accounts))
+        self.assertTrue(report.ok)
+        self.assertEqual(report.accounts_checked, 50)
+        self.assertEqual(report.transactions_replayed, 50)
+
+    def test_incremental_only_rechecks_changed_accounts(self):
+        """Test that incremental mode skips accounts whose log has not grown."""
+        reconciler = Reconciler()
+        reconciler.run(self.accounts)
+
+        self.checking.deposit(10.0)
+        report = reconciler.run(self.accounts, incremental=True)
+
+        self.assertEqual(report.accounts_checked, 1)
+        self.assertTrue(report.ok)
+        self.assertEqual(report.transfer_sent, 200.0)
+
+    def test_incremental_drops_accounts_that_are_gone(self):
+        """Test that an account no longer passed in stops counting towards the transfer totals."""
+        rogue = SavingsAccount(3)
+        rogue._audit_log.log_transaction(Transaction(TransactionType.TRANSFER_SENT, 10.0))
+        rogue._balance = -10.0
+        reconciler = Reconciler()
+        self.assertFalse(reconciler.run(self.accounts + [rogue]).transfers_balanced)
+
+        report = reconciler.run(self.accounts, incremental=True)
+        self.assertEqual(report.accounts_checked, 0)
+        self.assertTrue(report.ok)
+        self.assertEqual(report.transfer_sent, 200.0)
+
+    def test_transfer_totals_at_scale(self):
+        """Test that large transfer totals summed in different orders do not report a false imbalance."""
+        hub = CheckingAccount(0)
+        hub.deposit(1e15)
+        destinations = [CheckingAccount(account_ID) for account_ID in range(1, 1001)]
+        rng = random.Random(1)
+        for destination in destinations:
+            hub.transfer(destination, round(rng.uniform(1e9, 1e12), 2))
+
+        # The hub sums its legs first to last; the destinations are visited last to first
+        report = Reconciler(chunk_size=97).run([hub] + destinations[::-1])
+        self.assertTrue(report.ok)
+        self.assertGreater(report.transfer_sent, 1e14)
+
+    def test_compare_with_database(self):
+        """Test comparing in-memory state with the Accounts/Transactions tables."""
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE Accounts (account_id INT, balance DECIMAL(10, 2))")
+        connection.execute("CREATE TABLE Transactions (account_id INT, transaction_type TEXT, amount DECIMAL(10, 2))")
+        connection.execute("INSERT INTO Accounts VALUES (1, ?), (2, 0)", (self.savings.balance,))
+        connection.executemany("INSERT INTO Transactions VALUES (?, ?, ?)", [
+            (1, "DEPOSIT", 500), (1, "TRANSFER_SENT", 200), (1, "INTEREST", 4.5),
+            (2, "TRANSFER_RECEIVED", 200), (2, "WITHDRAW", 250),
+        ])
+
+        mismatches = compare_with_database(connection, self.accounts)
+        reasons = [reason for account_ID, reason in mismatches if account_ID == 2]
+
+        self.assertEqual([account_ID for account_ID, _ in mismatches], [2, 2])
+        self.assertTrue(reasons[0].startswith("balance"))
+        self.assertEqual(reasons[1], "transaction counts differ")
+
+
+    def test_fee_types_stay_distinct(self):
+        """Test that overdraft and maintenance fees reconcile as separate Transactions types."""
+        catalog = ProductCatalog()
+        self.checking = CheckingAccount(2, catalog.register("CHECKING", overdraft_limit=-500, overdraft_fee=35, maintenance_fee=5))
+        self.checking.withdraw(50.0)
+        self.checking.apply_maintenance_fee()
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE Accounts (account_id INT, balance DECIMAL(10, 2))")
+        connection.execute("CREATE TABLE Transactions (account_id INT, transaction_type TEXT, amount DECIMAL(10, 2))")
+        connection.execute("INSERT INTO Accounts VALUES (2, ?)", (self.checking.balance,))
+        connection.executemany("INSERT INTO Transactions VALUES (2, ?, ?)", [
+            (DB_TRANSACTION_TYPES[tx.transaction_type], tx.amount) for tx in self.checking.view_transaction_history()])
+
+        self.assertEqual(compare_with_database(connection, [self.checking]), [])
+        stored = sorted(row[0] for row in connection.execute("SELECT transaction_type FROM Transactions"))
+        self.assertEqual(stored, ["MAINTENANCE_FEE", "OVERDRAFT_FEE", "WITHDRAW"])
+
+        with mock.patch.dict(DB_TRANSACTION_TYPES):
+            del DB_TRANSACTION_TYPES[TransactionType.MAINTENANCE_FEE]
+            self.assertEqual(compare_with_database(connection, [self.checking])[0],
+                             (2, "no database type for MAINTENANCE FEE"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from src import Customer, SavingsAccount, CheckingAccount, AccountStatus, TransactionType, FxRateTable
+from src.lifecycle import AccountArchive
+from src.reconciliation import compare_with_database
+from src.repository import AccountRepository, VersionConflict, SQLITE_SCHEMA
+from src.scheduler import MonthEndJob
+
+class TestAccountRepository(unittest.TestCase):
+    """
+    Test suite for versioned balance persistence (sqlite backend).
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "bank.db")
+        self.connection = self.connect()
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SQLITE_SCHEMA)
+        self.repository = AccountRepository.for_sqlite(self.connection)
+
+        self.savings = SavingsAccount(1)
+        self.savings.deposit(100)
+        self.repository.create(self.savings)
+        self.repository.create(CheckingAccount(2))
+
+    def tearDown(self):
+        self.connection.close()
+        self.directory.cleanup()
+
+    def connect(self):
+        return sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+
+    def test_post_bumps_version_and_logs(self):
+        """Test that each posting swaps in a new balance, bumps the version and logs a row."""
+        self.assertEqual(self.repository.load(1), (100.0, 0))
+
+        self.assertEqual(self.repository.post(1, 25, TransactionType.DEPOSIT), 125.0)
+        self.assertEqual(self.repository.post_locked(1, 5, TransactionType.WITHDRAW), 120.0)
+
+        self.assertEqual(self.repository.load(1), (120.0, 2))
+        rows = self.connection.execute("SELECT transaction_type, amount FROM Transactions ORDER BY transaction_id").fetchall()
+        # The opening deposit was written by create()
+        self.assertEqual(rows, [("DEPOSIT", 100.0), ("DEPOSIT", 25.0), ("WITHDRAW", 5.0)])
+
+    def test_floor_and_validation(self):
+        """Test that a posting the product rules refuse, or with a bad amount, changes nothing."""
+        with self.assertRaisesRegex(ValueError, "Insufficient funds"):
+            self.repository.post(1, 150, TransactionType.WITHDRAW)
+        with self.assertRaisesRegex(ValueError, "Overdraft limit exceeded"):
+            self.repository.post_locked(2, 600, TransactionType.WITHDRAW)
+        with self.assertRaises(ValueError):
+            self.repository.post(1, 0, TransactionType.DEPOSIT)
+        with self.assertRaisesRegex(ValueError, "not found"):
+            self.repository.post(99, 10, TransactionType.DEPOSIT)
+
+        self.assertEqual(self.repository.load(1), (100.0, 0))
+        self.assertEqual(self.connection.execute("SELECT COUNT(*) FROM Transactions").fetchone()[0], 1)
+
+    def test_database_path_matches_engine(self):
+        """Test that database debits charge the same overdraft fee as the engine, and persist() writes its rows."""
+        checking = CheckingAccount(3)
+        self.repository.create(checking)
+        checking.deposit(50)
+        checking.withdraw(80)
+        self.repository.persist(checking)
+
+        self.assertEqual(self.repository.post(2, 80, TransactionType.WITHDRAW), checking.balance - 50)
+        self.assertEqual(self.repository.post_locked(2, 10, TransactionType.WITHDRAW), checking.balance - 60)
+        self.assertNotIn(3, [account_ID for account_ID, _ in compare_with_database(self.connection, [checking])])
+
+        rows = self.connection.execute("SELECT transaction_type FROM Transactions WHERE account_id = 2 ORDER BY transaction_id").fetchall()
+        self.assertEqual([row[0] for row in rows], ["WITHDRAW", "OVERDRAFT_FEE", "WITHDRAW"])
+
+    def test_history_rows_keep_time_and_fx_leg(self):
+        """Test that persisted postings carry their own timestamp and the other FX leg."""
+        euros = SavingsAccount(3, currency="EUR")
+        self.repository.create(euros)
+        self.savings.transfer(euros, 50, FxRateTable([("USD", "EUR", 0.9)]))
+        self.repository.persist(self.savings)
+        self.repository.persist(euros)
+
+        rows = self.connection.execute("SELECT transaction_type, amount, fx_amount, fx_currency, time_stamp FROM Transactions "
+                                       "ORDER BY transaction_id").fetchall()
+        history = self.savings.view_transaction_history() + euros.view_transaction_history()
+        self.assertEqual(rows, [("DEPOSIT", 100.0, None, None, history[0].timestamp.isoformat(" ")),
+                                ("TRANSFER_SENT", 50.0, 45.0, "EUR", history[1].timestamp.isoformat(" ")),
+                                ("TRANSFER_RECEIVED", 45.0, 50.0, "USD", history[2].timestamp.isoformat(" "))])
+
+    def test_persist_detects_stale_account(self):
+        """Test that persisting an account loaded at an old version raises VersionConflict."""
+        first = SavingsAccount(1)
+        second = SavingsAccount(1)
+        self.repository.refresh(first)
+        self.repository.refresh(second)
+
+        first.deposit(10)
+        self.repository.persist(first)
+        self.assertEqual(first.version, 1)
+
+        second.deposit(20)
+        with self.assertRaises(VersionConflict):
+            self.repository.persist(second)
+
+        self.repository.refresh(second)
+        self.assertEqual((second.balance, second.version), (110.0, 1))
+        self.assertEqual(self.repository.conflicts, 1)
+
+    def test_posted_periods_survive_reload(self):
+        """Test that a reloaded account is not posted a month-end period twice."""
+        MonthEndJob("2026-10", tasks=("interest",)).run([self.savings])
+        self.repository.persist(self.savings)
+
+        reloaded = SavingsAccount(1)
+        self.repository.refresh(reloaded)
+        self.assertEqual(reloaded._posted_periods, {"interest": "2026-10"})
+        MonthEndJob("2026-10", tasks=("interest",)).run([reloaded])
+        self.assertEqual(reloaded.balance, self.savings.balance)
+
+    def test_status_survives_reload(self):
+        """Test that a closed or dormant account comes back from the database with its status."""
+        checking = CheckingAccount(3)
+        checking.close()
+        self.repository.create(checking)
+        self.savings.mark_dormant()
+        self.repository.persist(self.savings)
+
+        closed, dormant = CheckingAccount(3), SavingsAccount(1)
+        self.repository.refresh(closed)
+        self.repository.refresh(dormant)
+        self.assertEqual((closed.status, dormant.status), (AccountStatus.CLOSED, AccountStatus.DORMANT))
+        with self.assertRaisesRegex(ValueError, "closed"):
+            closed.deposit(5)
+
+    def test_rehydrated_account_is_not_reinserted(self):
+        """Test that an archived and rehydrated account only writes postings the database lacks."""
+        customer = Customer(1, "Alice", "Smith", "alice@example.com")
+        customer.open_account(self.savings)
+        self.savings.mark_dormant()
+        AccountArchive().compact(self.savings, customer)
+
+        restored = customer.get_account(1)
+        restored.deposit(5)
+        self.repository.persist(restored)
+
+        rows = self.connection.execute("SELECT transaction_type, amount FROM Transactions WHERE account_id = 1").fetchall()
+        self.assertEqual(rows, [("DEPOSIT", 100.0), ("DEPOSIT", 5.0)])
+
+    def test_retries_exhausted(self):
+        """Test that a CAS which keeps losing gives up after max_retries."""
+        repository = AccountRepository.for_sqlite(self.connection, max_retries=2, backoff=0)
+        # Simulate a concurrent writer bumping the version between every read and swap
+        original_read = repository._read
+
+        def racing_read(cursor, statement, account_ID):
+            result = original_read(cursor, statement, account_ID)
+            self.connection.execute("UPDATE Accounts SET version = version + 1 WHERE account_id = ?", (account_ID,))
+            return result
+
+        repository._read = racing_read
+        with self.assertRaises(VersionConflict):
+            repository.post(1, 10, TransactionType.DEPOSIT)
+
+        self.assertEqual(repository.retries, 2)
+        self.assertEqual(repository.conflicts, 1)
+
+    def test_concurrent_writers_lose_nothing(self):
+        """Test that concurrent optimistic and pessimistic writers never lose an update."""
+        def writer(locked: bool):
+            connection = self.connect()
+            repository = AccountRepository.for_sqlite(connection, max_retries=100)
+            post = repository.post_locked if locked else repository.post
+            for _ in range(25):
+                post(2, 1.0, TransactionType.DEPOSIT)
+            connection.close()
+
+        threads = [threading.Thread(target=writer, args=(index % 2 == 0,)) for index in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.repository.load(2), (150.0, 150))
+
+if __name__ == '__main__':
+    unittest.main()
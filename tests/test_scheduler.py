@@ -0,0 +1,168 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from datetime import datetime
+
+from src import SavingsAccount, CheckingAccount, ProductCatalog, TransactionType
+from src.scheduler import MonthEndJob, render_statements, _statement_record
+
+class TestMonthEndJob(unittest.TestCase):
+    """
+    Test suite for month-end batch processing.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint = os.path.join(self.directory.name, "month_end.json")
+        self.period = datetime.now().strftime("%Y-%m")
+
+        catalog = ProductCatalog()
+        savings_product = catalog.register("SAVINGS", interest_tiers=((0, 0.01),), maintenance_fee=2)
+        checking_product = catalog.register("CHECKING", overdraft_limit=-500, overdraft_fee=35, maintenance_fee=5)
+
+        self.accounts = []
+        for account_ID in range(1, 11):
+            if account_ID % 2:
+                account = SavingsAccount(account_ID, savings_product)
+            else:
+                account = CheckingAccount(account_ID, checking_product)
+            account.deposit(100.0)
+            self.accounts.append(account)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_interest_fees_and_statements(self):
+        """Test that every account gets interest/fees and a statement."""
+        report = MonthEndJob(self.period, chunk_size=3, workers=2, checkpoint_path=self.checkpoint).run(self.accounts)
+
+        self.assertEqual(report.interest_posted, 5)
+        self.assertEqual(report.fees_charged, 10)
+        self.assertEqual(report.chunks, 4)
+        self.assertEqual(self.accounts[0].balance, 99.0)   # 100 + 1 interest - 2 fee
+        self.assertEqual(self.accounts[1].balance, 95.0)   # 100 - 5 fee
+        self.assertEqual(len(report.statements), 10)
+        self.assertIn("Closing balance: $99.0", report.statements[1])
+        self.assertIn("Opening balance: $0", report.statements[1])
+
+    def test_fee_waived_when_not_covered(self):
+        """Test that savings fees are waived instead of making the balance negative."""
+        account = SavingsAccount(50, self.accounts[0].product)
+        account.deposit(1.0)
+        MonthEndJob(self.period, tasks=("fees",)).run([account])
+        self.assertEqual(account.balance, 1.0)
+
+    def test_exactly_once_per_period(self):
+        """Test that re-running a finished period does nothing."""
+        job = MonthEndJob(self.period, checkpoint_path=self.checkpoint)
+        job.run(self.accounts)
+        balances = [account.balance for account in self.accounts]
+
+        report = MonthEndJob(self.period, checkpoint_path=self.checkpoint).run(self.accounts)
+
+        self.assertEqual([account.balance for account in self.accounts], balances)
+        self.assertEqual(report.skipped, 10)
+
+    def test_resume_after_crash(self):
+        """Test that a crashed run resumes without re-posting finished accounts."""
+        class Crash(Exception):
+            pass
+
+        crashing = self.accounts[:6] + [None] + self.accounts[6:]
+
+        def population():
+            for account in crashing:
+                if account is None:
+                    raise Crash()
+                yield account
+
+        with self.assertRaises(Crash):
+            MonthEndJob(self.period, chunk_size=3, checkpoint_path=self.checkpoint).run(population())
+
+        with open(self.checkpoint) as file:
+            entries = [json.loads(line) for line in file]
+        self.assertEqual(entries[0], {"period": self.period})
+        self.assertEqual(sum(len(entry.get("posted", ())) for entry in entries), 6)
+
+        report = MonthEndJob(self.period, chunk_size=3, checkpoint_path=self.checkpoint).run(self.accounts)
+
+        # Statements are still rendered for the 6 posted accounts, but nothing is re-posted
+        self.assertEqual(report.fees_charged, 4)
+        self.assertEqual(len(report.statements), 10)
+        for account in self.accounts:
+            fees = [tx for tx in account.view_transaction_history() if tx.transaction_type.name == "MAINTENANCE_FEE"]
+            self.assertEqual(len(fees), 1)
+
+    def test_failure_inside_chunk_posts_once(self):
+        """Test that a posting failure mid-chunk, or a rerun without a checkpoint, never posts interest twice."""
+        apply_interest = SavingsAccount.apply_interest
+        calls = []
+
+        def failing(account, timestamp=None):
+            calls.append(account.account_ID)
+            if len(calls) == 3:
+                raise RuntimeError("posting failed")
+            apply_interest(account, timestamp)
+
+        with mock.patch.object(SavingsAccount, "apply_interest", failing):
+            with self.assertRaises(RuntimeError):
+                MonthEndJob(self.period, chunk_size=10, checkpoint_path=self.checkpoint).run(self.accounts)
+
+        MonthEndJob(self.period, chunk_size=10, checkpoint_path=self.checkpoint).run(self.accounts)
+        MonthEndJob(self.period, chunk_size=10).run(self.accounts)
+
+        for account in self.accounts:
+            types = [tx.transaction_type.name for tx in account.view_transaction_history()]
+            self.assertLessEqual(types.count("INTEREST_APPLIED"), 1)
+            self.assertEqual(types.count("MAINTENANCE_FEE"), 1)
+        self.assertEqual(self.accounts[0].balance, 99.0)
+
+    def test_new_period_starts_fresh(self):
+        """Test that a checkpoint from a previous period does not block the next one."""
+        MonthEndJob("1999-01", tasks=("fees",), checkpoint_path=self.checkpoint).run(self.accounts)
+        report = MonthEndJob("1999-02", tasks=("fees",), checkpoint_path=self.checkpoint).run(self.accounts)
+        self.assertEqual(report.fees_charged, 10)
+
+    def test_past_period_statement(self):
+        """Test that a closed period's postings are stamped inside it and later postings stay out of its statement."""
+        account = SavingsAccount(50, self.accounts[0].product)
+        account._deposit_helper(1000.0, TransactionType.DEPOSIT, timestamp=datetime(2025, 12, 5))
+
+        report = MonthEndJob("2025-12").run([account])
+        account.deposit(5.0)
+        late = render_statements([_statement_record(account)], "2025-12")[50]
+
+        stamps = [tx.timestamp for tx in account.view_transaction_history()]
+        self.assertEqual(stamps[1:3], [datetime(2025, 12, 31, 23, 59, 59, 999999)] * 2)
+        for statement in (report.statements[50], late):
+            self.assertIn("Opening balance: $0", statement)
+            self.assertIn("INTEREST APPLIED - $10.0", statement)
+            self.assertIn("Closing balance: $1008.0", statement)
+        self.assertEqual(account.balance, 1013.0)
+
+    def test_process_pool_statement_files(self):
+        """Test rendering statements on a process pool into files."""
+        statement_dir = os.path.join(self.directory.name, "statements")
+        MonthEndJob(self.period, tasks=("statements",), executor="process", workers=2,
+                    statement_dir=statement_dir).run(self.accounts)
+
+        files = os.listdir(os.path.join(statement_dir, self.period))
+        self.assertEqual(len(files), 10)
+        with open(os.path.join(statement_dir, self.period, "2.txt")) as file:
+            self.assertIn("Account 2 (CheckingAccount)", file.read())
+
+    def test_invalid_options(self):
+        """Test that unknown tasks and executors are rejected."""
+        with self.assertRaises(ValueError):
+            MonthEndJob(self.period, tasks=("payroll",))
+        with self.assertRaises(ValueError):
+            MonthEndJob(self.period, executor="gpu")
+        for period in ("2026-1", "2026-13", "2026-10-01", "26-10"):
+            with self.assertRaisesRegex(ValueError, "expected YYYY-MM"):
+                MonthEndJob(period)
+
+
+if __name__ == '__main__':
+    unittest.main()
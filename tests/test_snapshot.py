@@ -0,0 +1,165 @@
+import os
+import tempfile
+import unittest
+
+from src import Customer, SavingsAccount, CheckingAccount, ProductCatalog
+from src.scheduler import MonthEndJob
+from src.snapshot import write_snapshot, load_snapshot
+from src.striping import StripedCheckingAccount
+
+class TestSnapshot(unittest.TestCase):
+    """
+    Test suite for binary snapshot / restore of the in-memory bank.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "bank.snap")
+
+        self.alice = Customer(1, "Alice", "Smith", "alice@example.com")
+        self.bob = Customer(2, "Bób", "Jones", "bob@example.com")
+        savings = SavingsAccount(10)
+        checking = CheckingAccount(11)
+        self.alice.open_account(savings)
+        self.alice.open_account(checking)
+        self.bob.open_account(SavingsAccount(20))
+        self.bob.get_account(20).mark_dormant()
+
+        savings.deposit(1000.0)
+        savings.transfer(checking, 250.0)
+        checking.withdraw(300.0)  # Overdraft fee
+        savings.apply_interest()
+
+        self.orphan = CheckingAccount(99)
+        self.orphan.deposit(5.0)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertSameBank(self, customers, accounts):
+        originals = [self.alice, self.bob]
+        self.assertEqual([c.customer_ID for c in customers], [1, 2])
+
+        for original, restored in zip(originals, customers):
+            self.assertEqual((restored.first_name, restored.last_name, restored.email),
+                             (original.first_name, original.last_name, original.email))
+            self.assertEqual([type(a) for a in restored.accounts], [type(a) for a in original.accounts])
+
+            for account, copy in zip(original.accounts, restored.accounts):
+                self.assertIs(accounts[account.account_ID], copy)
+                self.assertEqual(copy.balance, account.balance)
+                self.assertEqual(copy.status, account.status)
+                self.assertEqual(copy.customer_ID, account.customer_ID)
+                self.assertEqual(copy.product.code, account.product.code)
+                self.assertEqual(copy.transaction_count, account.transaction_count)
+                self.assertEqual(copy._audit_log.head, account._audit_log.head)
+                self.assertTrue(copy._audit_log.verify())
+                for tx, tx_copy in zip(account.view_transaction_history(), copy.view_transaction_history()):
+                    self.assertEqual((tx_copy.transaction_type, tx_copy.amount, tx_copy.timestamp),
+                                     (tx.transaction_type, tx.amount, tx.timestamp))
+
+    def test_round_trip(self):
+        """Test that write + load + restore reproduces customers, accounts and history."""
+        write_snapshot(self.path, [self.alice, self.bob], [self.orphan])
+
+        with load_snapshot(self.path) as snapshot:
+            self.assertEqual((snapshot.customer_count, snapshot.account_count), (2, 4))
+            self.assertEqual(snapshot.transaction_count, 7)
+
+            customers, accounts = snapshot.restore()
+            self.assertSameBank(customers, accounts)
+            self.assertEqual(accounts[99].balance, 5.0)
+            self.assertIsNone(accounts[99].customer_ID)
+
+    def test_eager_restore_survives_close(self):
+        """Test that lazy=False restores do not depend on the open snapshot."""
+        write_snapshot(self.path, [self.alice, self.bob])
+
+        with load_snapshot(self.path) as snapshot:
+            customers, accounts = snapshot.restore(lazy=False)
+
+        self.assertSameBank(customers, accounts)
+
+    def test_restored_accounts_keep_working(self):
+        """Test that restored accounts accept new postings after lazy restore."""
+        write_snapshot(self.path, [self.alice, self.bob])
+
+        with load_snapshot(self.path) as snapshot:
+            _, accounts = snapshot.restore()
+            accounts[11].deposit(100.0)
+
+            self.assertEqual(accounts[11].transaction_count, 4)
+            self.assertEqual(accounts[11].balance, self.alice.get_account(11).balance + 100.0)
+
+    def test_striped_accounts_keep_their_type(self):
+        """Test that a striped checking account comes back striped, with its stripe count and merged history."""
+        striped = StripedCheckingAccount(50, stripes=3)
+        for amount in (10.0, 20.0, 30.0, 40.0):
+            striped.deposit(amount)
+        striped.withdraw(150.0)  # Overdraft fee
+        write_snapshot(self.path, [], [striped])
+
+        with load_snapshot(self.path) as snapshot:
+            _, accounts = snapshot.restore(lazy=False)
+
+        copy = accounts[50]
+        self.assertIs(type(copy), StripedCheckingAccount)
+        self.assertEqual((copy.stripe_count, copy.balance, copy.transaction_count), (3, striped.balance, 6))
+        self.assertEqual([tx.amount for tx in copy.view_transaction_history()],
+                         [tx.amount for tx in striped.view_transaction_history()])
+        self.assertTrue(copy._audit_log.verify())
+        copy.deposit(1.0)
+        self.assertEqual(copy.balance, striped.balance + 1.0)
+
+    def test_month_end_not_reposted_after_restore(self):
+        """Test that a restored bank remembers which month-end periods were posted."""
+        MonthEndJob("2026-10", tasks=("interest", "fees")).run(self.alice.accounts)
+        write_snapshot(self.path, [self.alice, self.bob])
+
+        with load_snapshot(self.path) as snapshot:
+            _, accounts = snapshot.restore(lazy=False)
+
+        self.assertEqual(accounts[10]._posted_periods, {"interest": "2026-10", "fees": "2026-10"})
+        self.assertIsNone(accounts[20]._posted_periods)
+        report = MonthEndJob("2026-10", tasks=("interest", "fees")).run([accounts[10], accounts[11]])
+        self.assertEqual(report.interest_posted, 0)
+        self.assertEqual(accounts[10].balance, self.alice.get_account(10).balance)
+        self.assertEqual(accounts[10].transaction_count, self.alice.get_account(10).transaction_count)
+
+    def test_columns_are_memoryviews(self):
+        """Test direct columnar access without restoring objects."""
+        write_snapshot(self.path, [self.alice, self.bob])
+
+        with load_snapshot(self.path) as snapshot:
+            balances = snapshot.column("account_balance")
+            self.assertEqual(list(balances), [a.balance for c in (self.alice, self.bob) for a in c.accounts])
+            self.assertEqual(snapshot.string(0), "Alice")
+
+    def test_custom_catalog(self):
+        """Test that products are resolved through the given catalog."""
+        catalog = ProductCatalog()
+        product = catalog.register("GOLD", interest_tiers=((0, 0.05),))
+        customer = Customer(3, "Gold", "Saver", "gold@example.com")
+        customer.open_account(SavingsAccount(30, product))
+        write_snapshot(self.path, [customer])
+
+        with load_snapshot(self.path) as snapshot:
+            _, accounts = snapshot.restore(catalog)
+            self.assertIs(accounts[30].product, product)
+
+    def test_invalid_files(self):
+        """Test that corrupt or foreign files are rejected."""
+        with open(self.path, "wb") as file:
+            file.write(b"NOTASNAPSHOT" + b"\0" * 64)
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+        write_snapshot(self.path, [self.alice])
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 16)
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,307 @@
+"""
+Model-based stress tests for the account engine.
+
+Random operation sequences (seeded, so every failure is reproducible) run
+against both the real accounts and a small reference model; after every
+operation balances, errors, fees and audit entries must agree. Sequences
+are spread over a process pool, one seed per task.
+
+    STRESS_OPERATIONS=2000000 python -m pytest tests/test_stress.py   # total generated operations
+    STRESS_SEED=1234 python -m pytest tests/test_stress.py            # replay a reported seed
+"""
+import math
+import os
+import random
+import sys
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from src import SavingsAccount, CheckingAccount, AccountStatus, ProductCatalog, TransactionType
+from src.api import BankService
+from src.striping import StripedCheckingAccount
+
+OPERATIONS: int = int(os.environ.get("STRESS_OPERATIONS", "100000"))
+BASE_SEED: int = int(os.environ.get("STRESS_SEED", "20261019"))
+SEQUENCE_LENGTH: int = 5_000
+POOL_SIZE: int = 6
+
+CREDITS: frozenset[TransactionType] = frozenset({TransactionType.DEPOSIT, TransactionType.TRANSFER_RECEIVED,
+                                                 TransactionType.INTEREST_APPLIED})
+
+
+def _catalog() -> ProductCatalog:
+    catalog = ProductCatalog()
+    catalog.register("SAVINGS", interest_tiers=((0, 0.01), (1000, 0.02)), maintenance_fee=2.5)
+    catalog.register("CHECKING", overdraft_limit=-300, overdraft_fee=25, maintenance_fee=5)
+    return catalog
+
+
+def ledger_balance(transactions) -> float:
+    return math.fsum(tx.amount if tx.transaction_type in CREDITS else -tx.amount for tx in transactions)
+
+
+class ModelAccount:
+    """Reference behaviour, written from the product rules rather than the engine code."""
+
+    def __init__(self, account_ID: int, savings: bool, terms):
+        self.account_ID = account_ID
+        self.savings = savings
+        self.terms = terms
+        self.balance = 0
+        self.closed = False
+        self.entries: list[tuple[TransactionType, float]] = []
+
+    def check_open(self) -> None:
+        if self.closed:
+            raise ValueError(f"Account {self.account_ID} is closed")
+
+    def deposit(self, amount: float, kind: TransactionType = TransactionType.DEPOSIT) -> None:
+        if amount <= 0:
+            raise ValueError("Invalid deposit amount")
+        self.balance += amount
+        self.entries.append((kind, amount))
+
+    def withdraw(self, amount: float, kind: TransactionType = TransactionType.WITHDRAW) -> None:
+        if amount <= 0:
+            raise ValueError("Invalid withdrawal amount")
+
+        if self.savings:
+            if self.balance - amount < 0:
+                raise ValueError("Insufficient funds")
+            self.balance -= amount
+            self.entries.append((kind, amount))
+            return
+
+        # One overdraft fee when a withdrawal first takes the balance below zero
+        fee = self.terms.overdraft_fee if self.balance - amount < 0 <= self.balance else 0
+        if self.balance - amount - fee < self.terms.overdraft_limit:
+            raise ValueError("Overdraft limit exceeded")
+        self.balance -= amount
+        self.entries.append((kind, amount))
+        if fee:
+            self.balance -= fee
+            self.entries.append((TransactionType.EXTRA_FEE, fee))
+
+    def interest(self) -> None:
+        interest = self.balance * self.terms.rate_for(self.balance)
+        if interest > 0 and not self.closed:
+            self.deposit(interest, TransactionType.INTEREST_APPLIED)
+
+    def maintenance_fee(self) -> float:
+        fee = self.terms.maintenance_fee
+        floor = 0 if self.savings else self.terms.overdraft_limit
+        if fee <= 0 or self.balance - fee < floor or self.closed:
+            return 0
+        self.balance -= fee
+        self.entries.append((TransactionType.MAINTENANCE_FEE, fee))
+        return fee
+
+    def close(self) -> None:
+        if self.closed:
+            raise ValueError(f"Account {self.account_ID} is already closed")
+        if self.balance != 0:
+            raise ValueError("Balance must be zero to close the account")
+        self.closed = True
+
+
+def _amount(rng: random.Random) -> float:
+    roll = rng.random()
+    if roll < 0.03:
+        return rng.choice((0, -1.0, -0.01))
+    if roll < 0.1:
+        return float(rng.randint(200, 2000))
+    return rng.randint(1, 40000) / 100
+
+
+def run_sequence(seed: int, length: int) -> str | None:
+    """Runs one random sequence; returns a failure description or None."""
+    rng = random.Random(seed)
+    catalog = _catalog()
+    savings_product, checking_product = catalog.get("SAVINGS"), catalog.get("CHECKING")
+    next_ID = 0
+    pool: list[tuple[object, ModelAccount]] = []
+
+    def open_account(savings: bool):
+        nonlocal next_ID
+        next_ID += 1
+        if savings:
+            return SavingsAccount(next_ID, savings_product), ModelAccount(next_ID, True, savings_product.terms)
+        return CheckingAccount(next_ID, checking_product), ModelAccount(next_ID, False, checking_product.terms)
+
+    for index in range(POOL_SIZE):
+        pool.append(open_account(index % 2 == 0))
+
+    for step in range(length):
+        slot = rng.randrange(POOL_SIZE)
+        account, model = pool[slot]
+        roll = rng.random()
+
+        def apply(real, expected):
+            outcome = []
+            for action in (real, expected):
+                try:
+                    outcome.append(("ok", action()))
+                except ValueError as e:
+                    outcome.append(("error", str(e)))
+            return outcome
+
+        if roll < 0.35:
+            amount = _amount(rng)
+            operation = f"deposit({amount})"
+            real, expected = apply(lambda: account.deposit(amount), lambda: model.check_open() or model.deposit(amount))
+        elif roll < 0.6:
+            amount = _amount(rng)
+            operation = f"withdraw({amount})"
+            real, expected = apply(lambda: account.withdraw(amount), lambda: model.check_open() or model.withdraw(amount))
+        elif roll < 0.85:
+            target_slot = rng.randrange(POOL_SIZE)
+            target, target_model = pool[target_slot]
+            amount = _amount(rng)
+            operation = f"transfer({amount} -> slot {target_slot})"
+
+            def model_transfer():
+                if target_model is model:
+                    raise ValueError("Cannot transfer to the same account.")
+                model.check_open()
+                target_model.check_open()
+                model.withdraw(amount, TransactionType.TRANSFER_SENT)
+                target_model.deposit(amount, TransactionType.TRANSFER_RECEIVED)
+
+            real, expected = apply(lambda: account.transfer(target, amount), model_transfer)
+        elif roll < 0.92:
+            if model.savings:
+                operation = "apply_interest()"
+                real, expected = apply(account.apply_interest, model.interest)
+            else:
+                operation = "apply_maintenance_fee()"
+                real, expected = apply(account.apply_maintenance_fee, model.maintenance_fee)
+        elif roll < 0.96 and model.savings:
+            operation = "apply_maintenance_fee()"
+            real, expected = apply(account.apply_maintenance_fee, model.maintenance_fee)
+        elif roll < 0.99:
+            # Empty the account when possible, then try to close it
+            operation = "drain and close()"
+
+            def drain():
+                if account.balance > 0 and account.status is not AccountStatus.CLOSED:
+                    account.withdraw(account.balance)
+                account.close()
+
+            def model_drain():
+                if model.balance > 0 and not model.closed:
+                    model.withdraw(model.balance)
+                model.close()
+
+            real, expected = apply(drain, model_drain)
+        else:
+            operation = "reopen()"
+            if model.closed:
+                pool[slot] = open_account(model.savings)
+            real = expected = ("ok", None)
+
+        if real != expected:
+            return f"seed {seed} step {step} {operation} on account {model.account_ID}: engine {real}, model {expected}"
+
+        account, model = pool[slot]
+        if account.balance != model.balance:
+            return f"seed {seed} step {step} {operation}: balance {account.balance} != model {model.balance}"
+
+    for account, model in pool:
+        history = account.view_transaction_history()
+        if [(tx.transaction_type, tx.amount) for tx in history] != model.entries:
+            return f"seed {seed}: audit entries of account {model.account_ID} differ from the model"
+        if not math.isclose(ledger_balance(history), account.balance, abs_tol=1e-6):
+            return f"seed {seed}: account {model.account_ID} balance does not match its ledger"
+        if not account._audit_log.verify():
+            return f"seed {seed}: audit chain of account {model.account_ID} does not verify"
+
+    return None
+
+
+class TestEngineStress(unittest.TestCase):
+    """
+    Model-based stress tests: random sequences against a reference model, and threaded interleavings.
+    """
+
+    def test_random_sequences_match_model(self):
+        """Test that long random operation sequences agree with the reference model step by step."""
+        sequences = max(1, OPERATIONS // SEQUENCE_LENGTH)
+        seeds = [BASE_SEED + index for index in range(sequences)]
+        workers = min(os.cpu_count() or 1, sequences)
+
+        if workers == 1:
+            failures = [run_sequence(seed, SEQUENCE_LENGTH) for seed in seeds]
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                failures = list(executor.map(run_sequence, seeds, [SEQUENCE_LENGTH] * sequences))
+
+        self.assertEqual([failure for failure in failures if failure], [])
+
+    def test_striped_credits_and_debits_interleave(self):
+        """Test that concurrent credits and debits on a striped account leave balance and ledger consistent."""
+        account = StripedCheckingAccount(1, stripes=4)
+        previous = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)  # Force frequent thread switches
+
+        def worker(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(1500):
+                try:
+                    if rng.random() < 0.7:
+                        account.deposit(rng.randint(1, 5000) / 100)
+                    else:
+                        account.withdraw(rng.randint(1, 8000) / 100)
+                except ValueError:
+                    pass
+
+        try:
+            threads = [threading.Thread(target=worker, args=(BASE_SEED + index,)) for index in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(previous)
+
+        history = account.view_transaction_history()
+        self.assertEqual(len(history), account.transaction_count)
+        self.assertAlmostEqual(ledger_balance(history), account.balance, places=6)
+        self.assertGreaterEqual(account.balance, account.overdraft_limit)
+
+    def test_service_transfers_conserve_money(self):
+        """Test that concurrent transfers through the service lock never create or lose money."""
+        service = BankService()
+        service.execute("open_customer", {"customer_id": 1, "first_name": "Stress", "last_name": "Test", "email": "s@example.com"})
+        for account_ID in range(1, 9):
+            service.execute("open_account", {"customer_id": 1, "type": "savings", "account_id": account_ID})
+            service.execute("deposit", {"account_id": account_ID, "amount": 1000})
+        previous = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+
+        def worker(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(1000):
+                source, destination = rng.sample(range(1, 9), 2)
+                try:
+                    service.execute("transfer", {"source": source, "destination": destination, "amount": rng.randint(1, 50000) / 100})
+                except ValueError:
+                    pass  # Insufficient funds
+
+        try:
+            threads = [threading.Thread(target=worker, args=(BASE_SEED + index,)) for index in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(previous)
+
+        accounts = service._accounts.values()
+        self.assertAlmostEqual(math.fsum(account.balance for account in accounts), 8000, places=6)
+        for account in accounts:
+            self.assertGreaterEqual(account.balance, 0)
+            self.assertAlmostEqual(ledger_balance(account.view_transaction_history()), account.balance, places=6)
+
+if __name__ == '__main__':
+    unittest.main()
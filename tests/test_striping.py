@@ -0,0 +1,115 @@
+import threading
+import unittest
+
+from src import EventBus, CheckingAccount, TransactionType
+from src.account import Account, AccountStatus
+from src.striping import StripedCheckingAccount
+
+class TestStripedCheckingAccount(unittest.TestCase):
+    """
+    Test suite for striped hot accounts.
+    """
+
+    def setUp(self):
+        self.account = StripedCheckingAccount(1, stripes=4)
+
+    def test_credits_spread_and_merge(self):
+        """Test that credits land on different stripes and reads merge them."""
+        for amount in (10, 20, 30, 40):
+            self.account.deposit(amount)
+
+        self.assertEqual([stripe.balance for stripe in self.account._stripes], [10, 20, 30, 40])
+        self.assertEqual(self.account.balance, 100)
+        self.assertEqual(self.account.transaction_count, 4)
+        self.assertEqual([tx.amount for tx in self.account.view_transaction_history()], [10, 20, 30, 40])
+
+    def test_withdraw_sees_full_total(self):
+        """Test that a withdrawal is checked against the folded total and the overdraft limit."""
+        for _ in range(4):
+            self.account.deposit(25)
+
+        self.account.withdraw(100)
+        self.assertEqual(self.account.balance, 0)
+        self.assertEqual([stripe.balance for stripe in self.account._stripes], [0, 0, 0, 0])
+
+        # Overdraft rules are the CheckingAccount ones: fee on crossing zero, limit enforced
+        self.account.deposit(10)
+        self.account.withdraw(20)
+        self.assertEqual(self.account.balance, -45)
+        with self.assertRaisesRegex(ValueError, "Overdraft limit exceeded"):
+            self.account.withdraw(456)
+
+        types = [tx.transaction_type for tx in self.account.view_transaction_history()]
+        self.assertEqual(types[-2:], [TransactionType.WITHDRAW, TransactionType.EXTRA_FEE])
+
+    def test_transfers_in_and_out(self):
+        """Test that transfers credit a stripe and debit through the fold."""
+        source = CheckingAccount(2)
+        source.deposit(500)
+
+        source.transfer(self.account, 200)
+        self.account.transfer(source, 150)
+
+        self.assertEqual((source.balance, self.account.balance), (450, 50))
+
+    def test_concurrent_credits_and_debits(self):
+        """Test that concurrent credits and debits lose nothing."""
+        def credit():
+            for _ in range(2_000):
+                self.account.deposit(1.0)
+
+        def debit():
+            for _ in range(500):
+                self.account.withdraw(1.0)
+
+        # Enough up front that debits never cross zero (no overdraft fees)
+        self.account.deposit(1_000)
+        threads = [threading.Thread(target=credit) for _ in range(4)] + [threading.Thread(target=debit)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.account.balance, 8_500)
+        self.assertEqual(self.account.transaction_count, 8_501)
+        # Each stripe's log is in time order, so the merged history is too
+        for log in [stripe.audit_log for stripe in self.account._stripes] + [self.account._audit_log]:
+            stamps = [tx.timestamp for tx in log.transactions]
+            self.assertEqual(stamps, sorted(stamps))
+        stamps = [tx.timestamp for tx in self.account.view_transaction_history()]
+        self.assertEqual(stamps, sorted(stamps))
+
+    def test_events_report_merged_balance(self):
+        """Test that posting events carry the merged balance."""
+        bus = EventBus()
+        events = []
+        bus.subscribe(events.extend)
+        Account.set_event_bus(bus)
+        try:
+            self.account.deposit(10)
+            self.account.deposit(5)
+            self.account.withdraw(3)
+            bus.drain()
+        finally:
+            Account.set_event_bus(None)
+
+        self.assertEqual([event.balance for event in events], [10, 15, 12])
+
+    def test_close_counts_striped_credits(self):
+        """Test that close() refuses while credits still sit in the stripes."""
+        self.account.deposit(10)
+        with self.assertRaisesRegex(ValueError, "Balance must be zero"):
+            self.account.close()
+        self.assertIs(self.account.status, AccountStatus.ACTIVE)
+
+        self.account.withdraw(10)
+        self.account.close()
+        self.assertIs(self.account.status, AccountStatus.CLOSED)
+
+    def test_invalid_stripes(self):
+        """Test that a non-positive stripe count is rejected."""
+        with self.assertRaises(ValueError):
+            StripedCheckingAccount(1, stripes=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from io import StringIO
+
+import main
+
+from src.reconciliation import Reconciler
+from benchmarks.workload import WorkloadGenerator, replay
+
+class TestWorkloadGenerator(unittest.TestCase):
+    """
+    Test suite for the synthetic workload generator and replay harness.
+    """
+
+    def setUp(self):
+        self.generator = WorkloadGenerator(seed=3, customers=50, accounts_per_customer=2)
+
+    def test_seeded_streams_are_reproducible(self):
+        """Test that the same seed produces the same bank and operations."""
+        other = WorkloadGenerator(seed=3, customers=50, accounts_per_customer=2)
+
+        self.assertEqual(self.generator.operations(500), other.operations(500))
+        balances = [acc.balance for acc in self.generator.build_bank()[1].values()]
+        self.assertEqual(balances, [acc.balance for acc in other.build_bank()[1].values()])
+
+    def test_account_mix(self):
+        """Test that the bank contains both account types for every customer count."""
+        customers, accounts = self.generator.build_bank()
+
+        self.assertEqual(len(customers), 50)
+        self.assertEqual(len(accounts), 100)
+        self.assertEqual({type(acc).__name__ for acc in accounts.values()}, {"SavingsAccount", "CheckingAccount"})
+
+    def test_stream_is_skewed(self):
+        """Test that a few hot accounts receive a disproportionate share of traffic."""
+        sources = [operation[1] for operation in self.generator.operations(5_000)]
+        busiest = max(sources.count(account_ID) for account_ID in set(sources))
+        self.assertGreater(busiest, 5_000 / 100 * 5)
+
+    def test_commands_replay_through_batch_mode(self):
+        """Test that generated command lines run cleanly through main.py's batch mode."""
+        out = StringIO()
+        summary = main.run_batch(self.generator.commands(200), out)
+
+        self.assertGreater(summary["commands"], 50 + 100 * 2 + 150)
+        self.assertEqual(summary["commands"], summary["succeeded"] + summary["failed"])
+
+    def test_invalid_mix(self):
+        """Test that unknown operation kinds are rejected."""
+        with self.assertRaises(ValueError):
+            WorkloadGenerator(mix={"mortgage": 1.0})
+
+    def test_replay_modes(self):
+        """Test that every replay mode processes the full stream."""
+        for mode in ("single", "thread", "async", "process"):
+            report = replay(self.generator, 1_000, mode=mode, workers=2)
+            summary = report.summary()
+
+            self.assertEqual(summary["operations"], 1_000, mode)
+            self.assertGreater(summary["throughput"], 0, mode)
+            self.assertIn("p99_us", summary["per_operation"]["deposit"])
+
+    def test_threaded_replay_keeps_ledger_consistent(self):
+        """Test that per-account locking keeps balances equal to their logs."""
+        _, accounts = self.generator.build_bank()
+        replay(self.generator, 5_000, mode="thread", workers=4, accounts=accounts)
+
+        report = Reconciler().run(accounts.values())
+        self.assertTrue(report.ok)
+
+
+if __name__ == '__main__':
+    unittest.main()